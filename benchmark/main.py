@@ -8,6 +8,7 @@ GAIA (General AI Assistant) dataset using the AgentX multi-agent framework.
 
 import asyncio
 import argparse
+import os
 import sys
 import traceback
 import time
@@ -16,7 +17,12 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 # Import AgentX core functions
-from agentx import start_task, set_log_level
+from agentx import set_log_level
+from agentx.core.task import TaskExecutor
+from agentx.core.llm_cache import CACHE_DIR_ENV
+from agentx.core.llm_provider import RecordingProvider, ReplayProvider, set_llm_provider
+from agentx.core.config import RateLimitConfig
+from agentx.core.rate_limiter import get_rate_limiter
 
 # Import benchmark utilities
 from .utils.data_loader import GAIADataLoader
@@ -55,6 +61,16 @@ Examples:
 
   # Resume from checkpoint
   python main.py --team team1 --resume --checkpoint-dir results/team1_20231201_120000
+
+  # Record a run, then replay it offline with the original timings
+  python main.py --team team3 --limit 10 --record-llm traces/team3.jsonl
+  python main.py --team team3 --limit 10 --replay-llm traces/team3.jsonl --replay-latency
+
+  # Rerun without paying again for identical LLM requests
+  python main.py --team team3 --limit 10 --llm-cache .cache/llm
+
+  # Stay within provider limits when running many questions at once
+  python main.py --team team3 --concurrent 10 --llm-rpm 500 --llm-tpm 200000
         """
     )
     
@@ -105,6 +121,38 @@ Examples:
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--record-llm",
+        metavar="TRACE",
+        help="Record every LLM request and response to a JSONL trace"
+    )
+    parser.add_argument(
+        "--replay-llm",
+        metavar="TRACE",
+        help="Serve LLM responses from a recorded trace instead of the provider"
+    )
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="With --replay-llm, reproduce the recorded response latencies"
+    )
+    parser.add_argument(
+        "--llm-cache",
+        metavar="DIR",
+        help="Cache LLM responses in DIR so reruns replay identical requests"
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        type=int,
+        metavar="N",
+        help="Limit LLM requests per minute for each provider/model"
+    )
+    parser.add_argument(
+        "--llm-tpm",
+        type=int,
+        metavar="N",
+        help="Limit estimated LLM tokens per minute for each provider/model"
+    )
     
     return parser.parse_args()
 
@@ -136,7 +184,8 @@ Please provide a direct, factual answer. Be concise and specific.
         start_time = time.time()
         
         # Start the task and set up cost tracking
-        task = start_task(task_content, team_config_path)
+        task = await TaskExecutor.create(team_config_path)
+        task.start_task(task_content)
         
         # Set up usage tracking via Brain wrapping (simpler than callbacks)
         wrapped_agents = []
@@ -424,6 +473,12 @@ async def run_benchmark(
         # Print cost summary
         cost_calculator.print_summary()
         
+        # Print time spent queueing for LLM rate limits
+        for name, stats in get_rate_limiter().get_stats().items():
+            print(f"LLM queue ({name}): {stats['queued']}/{stats['requests']} requests waited, "
+                  f"avg {stats['avg_queue_wait_seconds']:.2f}s, max {stats['max_queue_wait_seconds']:.2f}s, "
+                  f"{stats['rate_limited']} rate limited, concurrency limit {stats['concurrency_limit']}")
+        
         # Print summary with colors
         print(f"\n{Colors.BOLD}🎯 BENCHMARK COMPLETED{Colors.RESET}")
         print("=" * 60)
@@ -467,6 +522,23 @@ def main():
     # Use WARNING for clean output, INFO for verbose mode
     set_log_level("INFO" if args.verbose else "WARNING")
     
+    # Route every agent brain through a recording or replaying provider
+    if args.replay_llm:
+        set_llm_provider(ReplayProvider(args.replay_llm, reproduce_latency=args.replay_latency))
+    elif args.record_llm:
+        set_llm_provider(RecordingProvider(args.record_llm))
+    
+    # Shared request and token budgets for all LLM calls
+    if args.llm_rpm or args.llm_tpm:
+        get_rate_limiter().set_default(RateLimitConfig(
+            requests_per_minute=args.llm_rpm,
+            tokens_per_minute=args.llm_tpm
+        ))
+    
+    # Enable the LLM response cache for every agent brain
+    if args.llm_cache:
+        os.environ[CACHE_DIR_ENV] = args.llm_cache
+    
     # Validate team configuration exists
     config_dir = Path(__file__).parent / "config" / args.team
     if not config_dir.exists():
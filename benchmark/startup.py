@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Task Startup Benchmark for AgentX Framework
+
+Measures how long it takes to create task executors and how much that
+work stalls the event loop, comparing the blocking constructor with
+concurrent `await TaskExecutor.create(...)` calls. No LLM calls are made.
+"""
+
+import asyncio
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from agentx import set_log_level
+from agentx.core.task import TaskExecutor
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark concurrent task creation",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Default team3 with 1, 10 and 50 tasks
+  python -m benchmark.startup
+
+  # Larger batches with another team
+  python -m benchmark.startup --team team1 --counts 10 100
+        """
+    )
+    parser.add_argument(
+        "--team",
+        default="team3",
+        help="Team configuration to use (default: team3)"
+    )
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50],
+        help="Numbers of tasks to create per run (default: 1 10 50)"
+    )
+    return parser.parse_args()
+
+
+async def _watch_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Return the longest delay beyond `interval` seen by a ticking coroutine."""
+    max_lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - start - interval)
+    return max_lag
+
+
+async def _measure(count: int, team_config_path: Path, workspace_root: Path, concurrent: bool) -> Dict[str, float]:
+    """Create `count` executors and report wall time and worst loop stall."""
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(_watch_loop_lag(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    if concurrent:
+        await asyncio.gather(*(
+            TaskExecutor.create(str(team_config_path), workspace_dir=workspace_root / f"c{count}_{i}")
+            for i in range(count)
+        ))
+    else:
+        for i in range(count):
+            TaskExecutor(str(team_config_path), workspace_dir=workspace_root / f"s{count}_{i}")
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    max_lag = await watcher
+    return {"total": elapsed, "per_task": elapsed / count, "max_loop_stall": max_lag}
+
+
+async def run_startup_benchmark(team: str, counts: List[int]) -> None:
+    """Run the startup benchmark for each task count."""
+    team_config_path = Path(__file__).parent / "config" / team / "team.yaml"
+    if not team_config_path.exists():
+        raise FileNotFoundError(f"Team configuration not found: {team_config_path}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workspace_root = Path(temp_dir)
+
+        # Warm the shared team template so every run measures per-task cost
+        await TaskExecutor.create(str(team_config_path), workspace_dir=workspace_root / "warmup")
+
+        print(f"{'Tasks':>6} {'Mode':<11} {'Total (s)':>10} {'Per task (ms)':>14} {'Max loop stall (ms)':>20}")
+        print("-" * 65)
+        for count in counts:
+            for concurrent in (False, True):
+                result = await _measure(count, team_config_path, workspace_root, concurrent)
+                mode = "create()" if concurrent else "blocking"
+                print(
+                    f"{count:>6} {mode:<11} {result['total']:>10.3f} "
+                    f"{result['per_task'] * 1000:>14.2f} {result['max_loop_stall'] * 1000:>20.2f}"
+                )
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    set_log_level("WARNING")
+    asyncio.run(run_startup_benchmark(args.team, args.counts))
+
+
+if __name__ == "__main__":
+    main()
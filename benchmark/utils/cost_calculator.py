@@ -21,14 +21,24 @@ class ModelUsage:
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cache_hits: int = 0  # Calls served from the LLM response cache at no cost
+    cached_prompt_tokens: int = 0  # Prompt tokens served from the provider's prompt cache
+    retries: int = 0  # Failed attempts retried before a call succeeded
+    hedged_calls: int = 0  # Calls that fired a duplicate request because they were slow
     
     def add_call(self, cost: float, usage: Dict[str, Any]):
         """Add a single LLM call's usage and cost."""
         self.call_count += 1
+        if usage.get("cache_hit"):
+            self.cache_hits += 1
+        self.retries += usage.get("retries", 0)
+        if usage.get("hedged"):
+            self.hedged_calls += 1
         self.total_cost += cost
         self.prompt_tokens += usage.get("prompt_tokens", 0)
         self.completion_tokens += usage.get("completion_tokens", 0) 
         self.total_tokens += usage.get("total_tokens", 0)
+        self.cached_prompt_tokens += usage.get("cached_prompt_tokens") or 0
 
 
 class CostCalculator:
@@ -275,6 +285,10 @@ class CostCalculator:
                 "prompt_tokens": usage.prompt_tokens,
                 "completion_tokens": usage.completion_tokens,
                 "total_tokens": usage.total_tokens,
+                "cache_hits": usage.cache_hits,
+                "cached_prompt_tokens": usage.cached_prompt_tokens,
+                "retries": usage.retries,
+                "hedged_calls": usage.hedged_calls,
                 "avg_cost_per_call": usage.total_cost / usage.call_count if usage.call_count > 0 else 0.0
             }
         
@@ -293,10 +307,12 @@ class CostCalculator:
             print(f"\n📊 By Model:")
             for model_data in summary['models'].values():
                 print(f"   {model_data['model']}:")
-                print(f"     Calls: {model_data['call_count']}")
+                print(f"     Calls: {model_data['call_count']} ({model_data['cache_hits']} cached, "
+                      f"{model_data['retries']} retries, {model_data['hedged_calls']} hedged)")
                 print(f"     Cost: ${model_data['total_cost']:.6f}")
                 print(f"     Tokens: {model_data['total_tokens']} "
-                      f"({model_data['prompt_tokens']} prompt + {model_data['completion_tokens']} completion)")
+                      f"({model_data['prompt_tokens']} prompt + {model_data['completion_tokens']} completion, "
+                      f"{model_data['cached_prompt_tokens']} prompt tokens from provider cache)")
                 print(f"     Avg/call: ${model_data['avg_cost_per_call']:.6f}")
     
     def to_dict(self) -> Dict[str, Any]:
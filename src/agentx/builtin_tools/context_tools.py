@@ -228,7 +228,7 @@ class ContextTool(Tool):
             else:
                 target[key] = value
     
-    @tool(description="Query context with natural language or specific keys")
+    @tool(description="Query context with natural language or specific keys", read_only=True)
     async def get_context(
         self,
         query: str = "",
@@ -439,7 +439,7 @@ class PlanningTool(Tool):
                 error=f"Task status update failed: {str(e)}"
             )
     
-    @tool(description="Get plan status and progress with flexible querying")
+    @tool(description="Get plan status and progress with flexible querying", read_only=True)
     async def get_plan_status(
         self,
         query: str = "",
@@ -55,7 +55,11 @@ class SearchTool(Tool):
     
     @tool(
         description="Search the web using Google, Bing, DuckDuckGo or other search engines",
-        return_description="ToolResult containing list of search results with titles, URLs, and snippets"
+        return_description="ToolResult containing list of search results with titles, URLs, and snippets",
+        read_only=True,
+        cache_ttl=300,
+        cache_scope="global",
+        backend="serpapi"
     )
     async def web_search(self, query: str, engine: str = "google", 
                         max_results: int = 10, country: str = "us", 
@@ -138,7 +142,11 @@ class SearchTool(Tool):
     
     @tool(
         description="Search for news articles using Google News or Bing News",
-        return_description="ToolResult containing list of news search results with articles and publication dates"
+        return_description="ToolResult containing list of news search results with articles and publication dates",
+        read_only=True,
+        cache_ttl=300,
+        cache_scope="global",
+        backend="serpapi"
     )
     async def news_search(self, query: str, engine: str = "google", 
                          max_results: int = 10, country: str = "us") -> ToolResult:
@@ -201,7 +209,9 @@ class SearchTool(Tool):
     
     @tool(
         description="Search for images using Google Images or Bing Images",
-        return_description="ToolResult containing list of image search results with URLs and metadata"
+        return_description="ToolResult containing list of image search results with URLs and metadata",
+        read_only=True,
+        backend="serpapi"
     )
     async def image_search(self, query: str, engine: str = "google", 
                           max_results: int = 10, safe_search: str = "moderate") -> ToolResult:
@@ -21,7 +21,7 @@ class StorageTool(Tool):
         self.workspace = workspace_storage
         logger.info(f"StorageTool initialized with workspace: {self.workspace.get_workspace_path()}")
     
-    @tool(description="Read the contents of a file")
+    @tool(description="Read the contents of a file", read_only=True)
     async def read_file(
         self,
         task_id: str,
@@ -89,7 +89,7 @@ class StorageTool(Tool):
         except Exception as e:
             return f"❌ Error appending to file: {str(e)}"
     
-    @tool(description="List the contents of a directory")
+    @tool(description="List the contents of a directory", read_only=True)
     async def list_directory(
         self,
         task_id: str,
@@ -120,7 +120,7 @@ class StorageTool(Tool):
         except Exception as e:
             return f"❌ Error listing directory: {str(e)}"
     
-    @tool(description="Check if a file or directory exists")
+    @tool(description="Check if a file or directory exists", read_only=True)
     async def file_exists(
         self,
         task_id: str,
@@ -233,7 +233,7 @@ class ArtifactTool(Tool):
         except Exception as e:
             return f"❌ Error storing artifact: {str(e)}"
     
-    @tool(description="Retrieve an artifact by name")
+    @tool(description="Retrieve an artifact by name", read_only=True)
     async def get_artifact(
         self,
         task_id: str,
@@ -256,7 +256,7 @@ class ArtifactTool(Tool):
         except Exception as e:
             return f"❌ Error retrieving artifact: {str(e)}"
     
-    @tool(description="List all stored artifacts")
+    @tool(description="List all stored artifacts", read_only=True)
     async def list_artifacts(
         self,
         task_id: str,
@@ -288,7 +288,7 @@ class ArtifactTool(Tool):
         except Exception as e:
             return f"❌ Error listing artifacts: {str(e)}"
     
-    @tool(description="Get all versions of an artifact")
+    @tool(description="Get all versions of an artifact", read_only=True)
     async def get_artifact_versions(
         self,
         task_id: str,
@@ -85,7 +85,11 @@ class WebTool(Tool):
     
     @tool(
         description="Extract clean content from any URL using Firecrawl",
-        return_description="ToolResult containing extracted web content with title, content, and markdown"
+        return_description="ToolResult containing extracted web content with title, content, and markdown",
+        read_only=True,
+        cache_ttl=900,
+        cache_scope="global",
+        backend="firecrawl"
     )
     async def extract_content(self, url: str, include_tags: Optional[List[str]] = None, 
                             exclude_tags: Optional[List[str]] = None) -> ToolResult:
@@ -151,7 +155,9 @@ class WebTool(Tool):
     
     @tool(
         description="Crawl multiple pages from a website using Firecrawl",
-        return_description="ToolResult containing list of WebContent objects from crawled pages"
+        return_description="ToolResult containing list of WebContent objects from crawled pages",
+        read_only=True,
+        backend="firecrawl"
     )
     async def crawl_website(self, url: str, limit: int = 10, 
                           exclude_paths: Optional[List[str]] = None) -> ToolResult:
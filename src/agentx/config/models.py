@@ -248,7 +248,13 @@ class ToolsConfig(BaseModel):
     # Global tool settings
     execution_timeout: int = 300
     max_parallel_executions: int = 5
+    max_parallel_executions_per_agent: Optional[int] = None  # None = only the global limit
+    max_queue_wait: float = 30.0  # seconds a call waits for a free slot before failing
     enable_logging: bool = True
+    audit_log_path: Optional[str] = None  # JSONL file for full tool call records
+    compact_results: bool = True  # Send tool results to the LLM as compact JSON
+    include_result_metadata: bool = False  # Also send execution time and metadata
+    track_result_savings: bool = False  # Report tokens saved versus the verbose encoding (extra work per call)
     
     # Security settings
     sandbox_enabled: bool = True
@@ -6,7 +6,7 @@ import json
 import asyncio
 
 from .brain import Brain, BrainMessage, BrainResponse
-from .config import AgentConfig, BrainConfig
+from .config import AgentConfig, BrainConfig, ContextPolicy
 from .message import TaskStep, TextPart, ToolCallPart, ToolResultPart
 from .tool import get_tool_schemas, Tool, get_tool_registry
 from ..utils.logger import get_logger
@@ -27,6 +27,184 @@ class AgentState(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class ContextWindowManager:
+    """
+    Keeps the messages sent to an agent's brain within a token budget.
+    
+    The window is laid out as a pinned head (the initial prompt), an optional
+    summary of older history, and the most recent messages. When the window
+    nears the budget, the oldest unsummarized span is summarized in a
+    background task so the current turn never waits on it; until the summary
+    is ready, older messages are truncated instead.
+    
+    The task message log is append-only, so summarized spans are tracked by
+    their position in it. Messages added during a turn's tool loop are not in
+    the log; they are trimmed to fit but never summarized.
+    """
+    
+    MESSAGE_OVERHEAD_TOKENS = 4
+    SUMMARY_SOURCE_CHARS = 2000  # Per-message cap for text fed into a summary
+    
+    def __init__(self, policy: ContextPolicy, brain: Brain):
+        self.policy = policy
+        self.brain = brain
+        self._summary: Optional[str] = None
+        self._summarized_upto: int = 0  # Body messages covered by the summary
+        self._generation: int = 0
+        self._pending: Optional[asyncio.Task] = None
+    
+    @property
+    def budget(self) -> Optional[int]:
+        """Total prompt token budget, or None when the window is unbounded."""
+        return self.policy.max_tokens or self.brain.config.max_context_length
+    
+    def estimate_tokens(self, message: Dict[str, Any]) -> int:
+        """Estimate the prompt tokens taken by a single message."""
+        content = message.get("content") or ""
+        if not isinstance(content, str):
+            content = json.dumps(content, default=str)
+        length = len(content)
+        if message.get("tool_calls"):
+            length += len(json.dumps(message["tool_calls"], default=str))
+        return int(length / self.policy.chars_per_token) + self.MESSAGE_OVERHEAD_TOKENS
+    
+    def fit(self, messages: List[Dict[str, Any]], system_prompt: Optional[str] = None,
+            log_length: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the messages to send for this call, within the token budget.
+        
+        Args:
+            messages: The task log, followed by any messages added during the turn
+            system_prompt: System prompt that will accompany the messages
+            log_length: Number of leading messages from the task log (all when None)
+            
+        Returns:
+            Messages that fit the budget (the input list when no budget is set)
+        """
+        budget = self.budget
+        if not budget:
+            return messages
+        
+        available = budget - self.brain.config.max_tokens
+        if system_prompt:
+            available -= self.estimate_tokens({"content": system_prompt})
+        
+        head_count = min(self.policy.pinned_head_messages, len(messages))
+        head = messages[:head_count]
+        body = messages[head_count:]
+        
+        if self._summarized_upto > len(body):
+            # A different or rewritten history - the summary no longer applies
+            self.reset()
+        
+        summary = [self._summary_message()] if self._summary else []
+        recent = body[self._summarized_upto:]
+        recent_tokens = [self.estimate_tokens(m) for m in recent]
+        fixed_tokens = sum(self.estimate_tokens(m) for m in head + summary)
+        total = fixed_tokens + sum(recent_tokens)
+        
+        if self.policy.summarize and total > available * self.policy.compaction_threshold:
+            # Only the task log is summarized, so positions stay valid on later turns
+            log_length = len(messages) if log_length is None else log_length
+            self._schedule_compaction(body[:max(log_length - head_count, 0)])
+        
+        if total <= available:
+            return head + summary + recent
+        
+        # Over budget: keep the newest messages that fit, always at least one
+        kept = []
+        remaining = available - fixed_tokens
+        for message, tokens in zip(reversed(recent), reversed(recent_tokens)):
+            if kept and tokens > remaining:
+                break
+            kept.append(message)
+            remaining -= tokens
+        kept.reverse()
+        
+        # A tool result cannot lead the window without its tool call
+        while len(kept) > 1 and kept[0].get("role") == "tool":
+            kept.pop(0)
+        if kept[0].get("role") == "tool":
+            # Only the newest tool result fits - send it with its tool call anyway
+            start = len(recent) - 1
+            while start > 0 and recent[start].get("role") == "tool":
+                start -= 1
+            kept = recent[start:]
+        
+        omitted = len(recent) - len(kept)
+        logger.debug(f"Context window over budget ({total}/{available} tokens), omitting {omitted} messages")
+        note = {
+            "role": "system",
+            "content": f"[{omitted} earlier messages omitted to fit the context window]"
+        }
+        return head + summary + [note] + kept
+    
+    def detached(self) -> "ContextWindowManager":
+        """A trim-only window with the same budget, for conversations that are not the task log."""
+        return ContextWindowManager(self.policy.model_copy(update={"summarize": False}), self.brain)
+    
+    def reset(self) -> None:
+        """Drop the current summary and any in-flight compaction."""
+        self._generation += 1
+        self._summary = None
+        self._summarized_upto = 0
+        if self._pending and not self._pending.done():
+            self._pending.cancel()
+        self._pending = None
+    
+    def _summary_message(self) -> Dict[str, Any]:
+        return {
+            "role": "system",
+            "content": f"Summary of the earlier conversation:\n{self._summary}"
+        }
+    
+    def _schedule_compaction(self, body: List[Dict[str, Any]]) -> None:
+        """Start summarizing the oldest unsummarized span in the background."""
+        if self._pending and not self._pending.done():
+            return
+        
+        end = len(body) - self.policy.tail_messages
+        if end - self._summarized_upto < 2:
+            return
+        
+        span = body[self._summarized_upto:end]
+        self._pending = asyncio.create_task(self._compact(span, end, self._generation))
+    
+    async def _compact(self, span: List[Dict[str, Any]], end: int, generation: int) -> None:
+        """Summarize a span of messages and fold it into the running summary."""
+        lines = []
+        for message in span:
+            content = message.get("content") or ""
+            if not isinstance(content, str):
+                content = json.dumps(content, default=str)
+            lines.append(f"{message.get('role', 'unknown')}: {content[:self.SUMMARY_SOURCE_CHARS]}")
+        
+        previous = f"Existing summary:\n{self._summary}\n\n" if self._summary else ""
+        prompt = (
+            f"{previous}Summarize the following conversation so it can replace the original "
+            f"messages. Keep facts, decisions, open questions, file names and tool findings; "
+            f"drop pleasantries.\n\n" + "\n".join(lines)
+        )
+        
+        try:
+            response = await self.brain.generate_response(
+                messages=[{"role": "user", "content": prompt}]
+            )
+        except Exception as e:
+            logger.warning(f"Context compaction failed: {e}")
+            return
+        
+        if generation != self._generation:
+            return
+        if response.finish_reason == "error" or not response.content:
+            logger.warning("Context compaction returned no summary; keeping truncation")
+            return
+        
+        self._summary = response.content.strip()
+        self._summarized_upto = end
+        logger.debug(f"Compacted {len(span)} messages into a summary")
+
+
 class Agent:
     """
     Represents an autonomous agent that manages its own conversation flow.
@@ -66,6 +244,9 @@ class Agent:
         brain_config = config.brain_config or BrainConfig()
         self.brain = Brain(brain_config)
         
+        # Token budget for the history sent to the brain
+        self.context_window = ContextWindowManager(config.context_policy or ContextPolicy(), self.brain)
+        
         # Tool management (injected by TaskExecutor for task isolation)
         self.tool_manager = tool_manager
         
@@ -94,7 +275,9 @@ class Agent:
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str] = None,
         orchestrator = None,
-        max_tool_rounds: int = 10
+        max_tool_rounds: int = 10,
+        turn_context: Optional[str] = None,
+        context_window: Optional[ContextWindowManager] = None
     ) -> str:
         """
         Generate response with tool execution handled by orchestrator.
@@ -106,6 +289,8 @@ class Agent:
             system_prompt: Optional system prompt override
             orchestrator: Orchestrator instance for tool execution
             max_tool_rounds: Maximum tool execution rounds
+            turn_context: Per-turn details sent after the conversation (see `build_turn_context`)
+            context_window: Window to fit messages with; the agent's own when None
             
         Returns:
             Final response string
@@ -115,12 +300,13 @@ class Agent:
             # Check if brain config has streaming setting
             if hasattr(self.brain.config, 'streaming') and not self.brain.config.streaming:
                 return await self._generate_response_non_streaming(
-                    messages, system_prompt, orchestrator, max_tool_rounds
+                    messages, system_prompt, orchestrator, max_tool_rounds, turn_context, context_window
                 )
             
             # Use streaming mode (existing behavior)
             response_parts = []
-            async for chunk in self._streaming_loop(messages, system_prompt, orchestrator, max_tool_rounds):
+            async for chunk in self._streaming_loop(messages, system_prompt, orchestrator, max_tool_rounds,
+                                                    turn_context, context_window):
                 if isinstance(chunk, dict) and chunk.get("type") == "content":
                     response_parts.append(chunk.get("content", ""))
                 elif isinstance(chunk, str):
@@ -134,7 +320,9 @@ class Agent:
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str] = None,
         orchestrator = None,
-        max_tool_rounds: int = 10
+        max_tool_rounds: int = 10,
+        turn_context: Optional[str] = None,
+        context_window: Optional[ContextWindowManager] = None
     ) -> AsyncGenerator[str, None]:
         """
         Stream response with tool execution handled by orchestrator.
@@ -146,13 +334,16 @@ class Agent:
             system_prompt: Optional system prompt override
             orchestrator: Orchestrator instance for tool execution
             max_tool_rounds: Maximum tool execution rounds
+            turn_context: Per-turn details sent after the conversation (see `build_turn_context`)
+            context_window: Window to fit messages with; the agent's own when None
             
         Yields:
             Response chunks and tool execution status updates
         """
         self.state.is_active = True
         try:
-            async for chunk in self._streaming_loop(messages, system_prompt, orchestrator, max_tool_rounds):
+            async for chunk in self._streaming_loop(messages, system_prompt, orchestrator, max_tool_rounds,
+                                                    turn_context, context_window):
                 yield chunk
         finally:
             self.state.is_active = False
@@ -166,7 +357,9 @@ class Agent:
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str],
         orchestrator,
-        max_tool_rounds: int = 10
+        max_tool_rounds: int = 10,
+        turn_context: Optional[str] = None,
+        context_window: Optional[ContextWindowManager] = None
     ) -> str:
         """
         Conversation loop that works with orchestrator for tool execution.
@@ -174,12 +367,14 @@ class Agent:
         Agent generates responses, orchestrator executes tools for security.
         """
         conversation = messages.copy()
+        window = context_window or self.context_window
         
         for round_num in range(max_tool_rounds):
             # Get response from brain
             llm_response = await self.brain.generate_response(
-                messages=conversation,
+                messages=window.fit(conversation, system_prompt, log_length=len(messages)),
                 system_prompt=system_prompt,
+                turn_context=turn_context,
                 tools=self.get_tools_json()
             )
             
@@ -204,7 +399,9 @@ class Agent:
                 })
                 
                 # Execute tools - use injected ToolExecutor from TaskExecutor
-                tool_messages = await self.tool_manager.execute_tool_calls(llm_response.tool_calls, self.name)
+                tool_messages = await self.tool_manager.execute_tool_calls(
+                    llm_response.tool_calls, self.name, parallel=self.brain.config.parallel_function_calls
+                )
                 conversation.extend(tool_messages)
                 
                 # Continue to next round
@@ -222,53 +419,82 @@ class Agent:
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str],
         orchestrator,
-        max_tool_rounds: int = 10
+        max_tool_rounds: int = 10,
+        turn_context: Optional[str] = None,
+        context_window: Optional[ContextWindowManager] = None
     ) -> AsyncGenerator[str, None]:
         """
         Clean streaming loop that consumes Brain's structured stream.
         
         The Brain handles all streaming + tool call complexity.
         Agent just processes the structured chunks and handles tool execution.
+        Each tool call starts as soon as the Brain emits it, while the rest of
+        the response is still streaming.
         """
         conversation = messages.copy()
+        window = context_window or self.context_window
         available_tools = self.get_tools_json()
         
+        # Create mock tool call object with required attributes
+        class MockToolCall:
+            def __init__(self, data):
+                self.id = data.get('id')
+                self.type = data.get('type', 'function')
+                self.function = type('obj', (object,), {
+                    'name': data.get('function', {}).get('name'),
+                    'arguments': data.get('function', {}).get('arguments')
+                })()
+        
         for round_num in range(max_tool_rounds):
             # Single streaming call - Brain handles tool call detection
             stream = self.brain.stream_response(
-                messages=conversation,
+                messages=window.fit(conversation, system_prompt, log_length=len(messages)),
                 system_prompt=system_prompt,
+                turn_context=turn_context,
                 tools=available_tools
             )
             
             # Process structured stream from Brain
             content_parts = []
             tool_calls_detected = []
+            formatted_tool_calls = []
+            batch = None
             
-            async for chunk in stream:
-                chunk_type = chunk.get('type')
-                
-                if chunk_type == 'text-delta':
-                    # Stream text content to user immediately
-                    content = chunk.get('content', '')
-                    content_parts.append(content)
-                    yield {"type": "content", "content": content}
-                    
-                elif chunk_type == 'tool-call':
-                    # Collect tool calls (no text parsing needed!)
-                    tool_calls_detected.append(chunk.get('tool_call'))
+            try:
+                async for chunk in stream:
+                    chunk_type = chunk.get('type')
                     
-                elif chunk_type == 'finish':
-                    # Stream finished - process any tool calls
-                    break
-                    
-                elif chunk_type == 'error':
-                    # Stream error
-                    yield {"type": "error", "content": chunk.get('content', 'Error occurred')}
+                    if chunk_type == 'text-delta':
+                        # Stream text content to user immediately
+                        content = chunk.get('content', '')
+                        content_parts.append(content)
+                        yield {"type": "content", "content": content}
+                        
+                    elif chunk_type == 'tool-call':
+                        # Start executing right away, overlapping with the rest of the stream
+                        tool_call = chunk.get('tool_call')
+                        tool_calls_detected.append(tool_call)
+                        formatted_tool_calls.append(MockToolCall(tool_call))
+                        if batch is None:
+                            batch = self.tool_manager.start_tool_calls(
+                                self.name, parallel=self.brain.config.parallel_function_calls
+                            )
+                        batch.add(formatted_tool_calls[-1])
+                        
+                    elif chunk_type == 'finish':
+                        # Stream finished - process any tool calls
+                        break
+                        
+                    elif chunk_type == 'error':
+                        # Stream error - tools already started are cancelled below
+                        yield {"type": "error", "content": chunk.get('content', 'Error occurred')}
+                        return
+                
+                # Handle tool calls if detected
+                if not tool_calls_detected:
+                    # No tool calls - conversation complete
                     return
-            
-            # Handle tool calls if detected
-            if tool_calls_detected:
+                
                 # Emit tool call chunk
                 yield {
                     "type": "tool_calls_start", 
@@ -290,70 +516,54 @@ class Agent:
                     ]
                 })
                 
-                # Execute tools and emit tool-result chunks for client visualization
-                # Convert to expected format for tool executor
-                formatted_tool_calls = []
-                for tc in tool_calls_detected:
-                    # Create mock tool call object with required attributes
-                    class MockToolCall:
-                        def __init__(self, data):
-                            self.id = data.get('id')
-                            self.type = data.get('type', 'function')
-                            self.function = type('obj', (object,), {
-                                'name': data.get('function', {}).get('name'),
-                                'arguments': data.get('function', {}).get('arguments')
-                            })()
-                    
-                    formatted_tool_calls.append(MockToolCall(tc))
-                
-                # Execute tools one by one and emit results for client visualization
-                tool_messages = []
-                for i, tool_call in enumerate(formatted_tool_calls):
-                    # Emit tool call start
+                # Announce every call, then emit each result as soon as it finishes
+                for tool_call in formatted_tool_calls:
                     yield {
                         "type": "tool_call",
                         "name": tool_call.function.name,
                         "arguments": tool_call.function.arguments,
                         "content": f"🔧 Calling {tool_call.function.name}..."
                     }
-                    
-                    try:
-                        # Execute single tool call
-                        result = await self.tool_manager.execute_tool_calls([tool_call], self.name)
-                        tool_messages.extend(result)
+                
+                # Results go back into the conversation in tool call order
+                tool_messages = [None] * len(formatted_tool_calls)
+                try:
+                    async for index, result in batch.results():
+                        tool_messages[index] = result
+                        tool_name = formatted_tool_calls[index].function.name
                         
                         # Emit tool result chunk
-                        tool_result_content = result[0].get('content', '') if result else 'No result'
+                        tool_result_content = result.get('content', '')
                         yield {
                             "type": "tool_result",
-                            "name": tool_call.function.name,
+                            "name": tool_name,
                             "success": True,
-                            "content": f"✅ {tool_call.function.name}: {tool_result_content[:100]}{'...' if len(tool_result_content) > 100 else ''}"
+                            "content": f"✅ {tool_name}: {tool_result_content[:100]}{'...' if len(tool_result_content) > 100 else ''}"
                         }
                         
-                    except Exception as e:
-                        # Handle tool execution error
-                        error_message = {
+                except Exception as e:
+                    # Handle tool execution error for every call without a result
+                    for index, tool_call in enumerate(formatted_tool_calls):
+                        if tool_messages[index] is not None:
+                            continue
+                        tool_messages[index] = {
                             "role": "tool",
                             "tool_call_id": tool_call.id,
                             "name": tool_call.function.name,
                             "content": f"Error: {str(e)}"
                         }
-                        tool_messages.append(error_message)
                         yield {
                             "type": "tool_result",
                             "name": tool_call.function.name,
                             "success": False,
                             "content": f"❌ {tool_call.function.name} failed: {str(e)}"
                         }
-                
-                conversation.extend(tool_messages)
-                
-                # Continue to next step
-                continue
-            else:
-                # No tool calls - conversation complete
-                return
+            finally:
+                # Stop tools still running if the stream failed or the caller went away
+                if batch is not None:
+                    batch.cancel()
+            
+            conversation.extend(tool_messages)
         
         # Max rounds exceeded
         yield {"type": "warning", "content": "\n⚠️ Reached maximum tool execution limit."}
@@ -363,19 +573,23 @@ class Agent:
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str],
         orchestrator,
-        max_tool_rounds: int = 10
+        max_tool_rounds: int = 10,
+        turn_context: Optional[str] = None,
+        context_window: Optional[ContextWindowManager] = None
     ) -> str:
         """
         Non-streaming loop using Brain's generate_response method.
         """
         conversation = messages.copy()
+        window = context_window or self.context_window
         available_tools = self.get_tools_json()
         
         for round_num in range(max_tool_rounds):
             # Single non-streaming call
             response = await self.brain.generate_response(
-                messages=conversation,
+                messages=window.fit(conversation, system_prompt, log_length=len(messages)),
                 system_prompt=system_prompt,
+                turn_context=turn_context,
                 tools=available_tools
             )
             
@@ -410,7 +624,9 @@ class Agent:
                 
                 # Execute tools and add results to conversation
                 try:
-                    tool_messages = await self.tool_manager.execute_tool_calls(formatted_tool_calls, self.name)
+                    tool_messages = await self.tool_manager.execute_tool_calls(
+                        formatted_tool_calls, self.name, parallel=self.brain.config.parallel_function_calls
+                    )
                     conversation.extend(tool_messages)
                 except Exception as e:
                     # Handle tool execution error
@@ -430,22 +646,18 @@ class Agent:
         return "Reached maximum tool execution limit."
 
     def build_system_prompt(self, context: Dict[str, Any] = None) -> str:
-        """Build the system prompt for the agent, including dynamic context and tool definitions."""
+        """
+        Build the system prompt for the agent: template, tool instructions, then task details.
+        
+        The result stays byte-identical across turns of a task so providers can
+        cache the prompt prefix. Details that change every turn belong in
+        `build_turn_context` instead.
+        """
         base_prompt = self.config.prompt_template
         
         if not context:
             return base_prompt
         
-        # Add context information
-        current_datetime = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
-        context_prompt = f"""
-Here is some context for the current task:
-- Current date and time: {current_datetime}
-- Task ID: {context.get('task_id', 'N/A')}
-- Round: {context.get('round_count', 0)}
-- Workspace: {context.get('workspace_dir', 'N/A')}
-"""
-        
         # Add tool information with explicit instructions
         tools_prompt = ""
         if self.tools:
@@ -471,7 +683,20 @@ Tool Usage Guidelines:
 - Always check tool results and handle errors gracefully
 """
         
-        return f"{base_prompt}{context_prompt}{tools_prompt}"
+        # Add task information that stays fixed for the whole task
+        context_prompt = f"""
+Here is some context for the current task:
+- Task ID: {context.get('task_id', 'N/A')}
+- Workspace: {context.get('workspace_dir', 'N/A')}
+"""
+        
+        return f"{base_prompt}{tools_prompt}{context_prompt}"
+
+    def build_turn_context(self, context: Dict[str, Any] = None) -> Optional[str]:
+        """Build the per-turn details that Brain sends after the conversation."""
+        if not context:
+            return None
+        return f"Round: {context.get('round_count', 0)}"
 
     # ============================================================================
     # UTILITY METHODS
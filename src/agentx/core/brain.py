@@ -9,6 +9,10 @@ that's the orchestrator's responsibility.
 import os
 import asyncio
 import json
+import random
+import threading
+import time
+from collections import deque
 from typing import Dict, Any, List, Optional, Union, AsyncGenerator
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -16,9 +20,18 @@ import litellm
 
 from ..utils.logger import get_logger
 from .config import BrainConfig
+from .llm_cache import CLOCK_LINE_PREFIX, cache_key, get_response_cache
+from .llm_provider import LLMProvider, get_llm_provider
+from .rate_limiter import get_rate_limiter, is_retryable_error
+from .http_pool import get_pooled_client
+from .endpoint_router import EndpointRouter, model_name
 
 logger = get_logger(__name__)
 
+# litellm capability lookups per model, shared by every Brain in the process
+_function_calling_support: Dict[str, bool] = {}
+_function_calling_support_lock = threading.Lock()
+
 
 class BrainMessage(BaseModel):
     """Standard message format for brain interactions."""
@@ -53,16 +66,31 @@ class Brain:
     3. Parse and return responses
     """
     
-    def __init__(self, config: BrainConfig):
+    def __init__(self, config: BrainConfig, provider: Optional[LLMProvider] = None):
         """
         Initialize Brain with Brain configuration.
         
         Args:
             config: Brain configuration including provider, model, etc.
+            provider: LLM provider to send requests through (defaults to the
+                      process-wide provider, normally litellm)
         """
-        self.config = config
+        # Own copy: configs compiled by a team template are shared by every task,
+        # and capability detection below updates supports_function_calls
+        self.config = config.model_copy()
+        self.provider = provider
         self.initialized = False
         self._usage_callbacks = []
+        self.response_cache = get_response_cache(config.response_cache)
+        self.call_stats = {"calls": 0, "retries": 0, "hedges": 0, "hedge_wins": 0, "failovers": 0}
+        self._latencies = deque(maxlen=200)  # Recent non-streaming call latencies, for hedging
+        self.cascade_stats: Dict[str, Dict[str, Any]] = {}  # Per cascade tier model
+        self.router = EndpointRouter(config) if config.failover and config.failover.endpoints else None
+        if config.rate_limit:
+            model_name = config.model
+            if config.provider and '/' not in model_name:
+                model_name = f"{config.provider}/{model_name}"
+            get_rate_limiter().configure(model_name, config.rate_limit)
     
     @classmethod
     def from_config(cls, brain_config: BrainConfig) -> "Brain":
@@ -111,51 +139,97 @@ class Brain:
         if hasattr(self.config, 'provider') and self.config.provider and '/' not in model_name:
             model_name = f"{self.config.provider}/{self.config.model}"
         
-        try:
-            # Check if LiteLLM reports the model supports function calling
-            supports_fc = litellm.supports_function_calling(model=model_name)
-            
-            if not supports_fc:
+        with _function_calling_support_lock:
+            supports_fc = _function_calling_support.get(model_name)
+        
+        if supports_fc is None:
+            try:
+                # Check if LiteLLM reports the model supports function calling
+                supports_fc = bool(litellm.supports_function_calling(model=model_name))
+                if supports_fc:
+                    logger.info(f"Model '{model_name}' supports native function calling.")
+                else:
+                    logger.warning(
+                        f"Model '{model_name}' does not support native function calling according to LiteLLM. "
+                        f"Function calls will be handled via text-based fallback method."
+                    )
+            except Exception as e:
                 logger.warning(
-                    f"Model '{model_name}' does not support native function calling according to LiteLLM. "
-                    f"Function calls will be handled via text-based fallback method."
+                    f"Could not validate function calling support for '{model_name}': {e}. "
+                    f"Assuming text-based tool calling."
                 )
-                # Update config to reflect actual capabilities
-                self.config.supports_function_calls = False
-            else:
-                logger.info(f"Model '{model_name}' supports native function calling.")
-                
-        except Exception as e:
-            logger.warning(
-                f"Could not validate function calling support for '{model_name}': {e}. "
-                f"Assuming text-based tool calling."
-            )
-            # Be conservative - assume no native support if we can't validate
+                # Be conservative - assume no native support if we can't validate
+                supports_fc = False
+            with _function_calling_support_lock:
+                _function_calling_support[model_name] = supports_fc
+        
+        if not supports_fc:
+            # Update config to reflect actual capabilities
             self.config.supports_function_calls = False
 
-    def _format_messages(self, messages: List[Dict[str, Any]], system_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Format messages for LLM call."""
+    @staticmethod
+    def _cache_hit_usage() -> Dict[str, Any]:
+        """Usage reported for a response served from the cache: no tokens were billed."""
+        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "cache_hit": True}
+
+    def _format_messages(self, messages: List[Dict[str, Any]], system_prompt: Optional[str] = None,
+                         turn_context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Format messages for LLM call.
+        
+        Static content comes first and volatile content last, so the prompt
+        prefix stays byte-identical across calls and providers can cache it.
+        The current time and any per-turn context go in a trailing user message:
+        some providers (Anthropic) hoist every system message to the front of
+        the prompt, where volatile content would invalidate the cached prefix.
+        """
         formatted_messages = []
         
         if system_prompt:
-            # Always append current date/time to system prompt
-            current_datetime = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
-            enhanced_system_prompt = f"{system_prompt}\n\nCurrent date and time: {current_datetime}"
             formatted_messages.append({
                 "role": "system", 
-                "content": enhanced_system_prompt
+                "content": system_prompt
             })
         
         formatted_messages.extend(messages)
+        
+        if system_prompt or turn_context:
+            current_datetime = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+            context_lines = [f"{CLOCK_LINE_PREFIX}{current_datetime}"]
+            if turn_context:
+                context_lines.append(turn_context)
+            formatted_messages.append({
+                "role": "user",
+                "content": "\n".join(context_lines)
+            })
         return formatted_messages
 
+    @staticmethod
+    def _cached_prompt_tokens(usage: Dict[str, Any]) -> Optional[int]:
+        """Prompt tokens the provider served from its prompt cache, if it reports them."""
+        details = usage.get('prompt_tokens_details')
+        if isinstance(details, dict) and details.get('cached_tokens') is not None:
+            return details['cached_tokens']
+        for field in ('prompt_cache_hit_tokens', 'cache_read_input_tokens'):  # DeepSeek, Anthropic
+            if usage.get(field) is not None:
+                return usage[field]
+        return None
+
+    def _model_name(self, model: Optional[str] = None) -> str:
+        """The brain's model, or a cascade tier's, with its provider prefix as sent to litellm."""
+        model = model or self.config.model
+        if self.config.provider and '/' not in model:
+            return f"{self.config.provider}/{model}"
+        return model
+
     def _prepare_call_params(self, messages: List[Dict[str, Any]], temperature: Optional[float] = None, 
-                           tools: Optional[List[Dict[str, Any]]] = None, stream: bool = False) -> Dict[str, Any]:
-        """Prepare parameters for LLM API call."""
+                           tools: Optional[List[Dict[str, Any]]] = None, stream: bool = False,
+                           json_mode: bool = False, model: Optional[str] = None) -> Dict[str, Any]:
+        """Prepare parameters for LLM API call, optionally for a cascade tier's model."""
         # Handle model name - if it already includes provider prefix, use as-is
-        model_name = self.config.model
-        if hasattr(self.config, 'provider') and self.config.provider and '/' not in model_name:
-            model_name = f"{self.config.provider}/{self.config.model}"
+        model_name = self._model_name(model)
+        # A tier on another provider resolves its own credentials and endpoint
+        same_endpoint = model is None or model_name.split('/', 1)[0] == self._model_name().split('/', 1)[0]
         
         call_params = {
             "model": model_name,
@@ -163,18 +237,28 @@ class Brain:
             "temperature": temperature or self.config.temperature,
             "max_tokens": self.config.max_tokens,
             "timeout": self.config.timeout,
-            "stream": stream
+            "stream": stream,
+            "max_retries": 0  # Brain retries and fails over itself; litellm would otherwise set SDK retries
         }
         
         # For streaming calls, request usage data in the final chunk
         if stream:
             call_params["stream_options"] = {"include_usage": True}
         
+        # Constrain the output to a JSON object where the provider supports it
+        if json_mode:
+            call_params["response_format"] = {"type": "json_object"}
+        
         # Add API credentials and base URL
-        if self.config.api_key:
+        if self.config.api_key and same_endpoint:
             call_params["api_key"] = self.config.api_key
-        if self.config.base_url:
+        if self.config.base_url and same_endpoint:
             call_params["api_base"] = self.config.base_url
+        
+        # Reuse the process-wide connection pool for this endpoint
+        client = get_pooled_client(self.config) if same_endpoint else None
+        if client is not None:
+            call_params["client"] = client
             
         # Add tools if model supports native function calling
         if tools and self.config.supports_function_calls:
@@ -189,12 +273,289 @@ class Brain:
             
         return call_params
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number `attempt + 1`."""
+        policy = self.config.retry_policy
+        return random.uniform(0, min(policy.max_delay, policy.initial_delay * policy.multiplier ** attempt))
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """Seconds after which a slow call gets a duplicate, or None when hedging is off or unwarmed."""
+        policy = self.config.retry_policy
+        if policy.hedge_percentile is None or len(self._latencies) < policy.hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * policy.hedge_percentile / 100))]
+    
+    def _routed(self, call_params: Dict[str, Any]) -> bool:
+        """Whether a request is for the brain's own model and may go to an equivalent endpoint."""
+        return self.router is not None and call_params.get("model") == self._model_name()
+    
+    def _route(self, call_params: Dict[str, Any], tried: Optional[set]):
+        """
+        Point a request at the healthiest endpoint not yet tried for it.
+        
+        Returns:
+            (request for that endpoint, endpoint index or None when not routed)
+        """
+        if not self._routed(call_params):
+            return call_params, None
+        index = self.router.choose(tried or ())
+        if tried is not None:
+            tried.add(index)
+        if index == 0:
+            return call_params, index
+        endpoint = self.router.endpoints[index]
+        params = {k: v for k, v in call_params.items() if k not in ("api_key", "api_base", "client")}
+        params["model"] = model_name(endpoint)
+        if endpoint.api_key:
+            params["api_key"] = endpoint.api_key
+        if endpoint.base_url:
+            params["api_base"] = endpoint.base_url
+        client = get_pooled_client(endpoint)
+        if client is not None:
+            params["client"] = client
+        return params, index
+    
+    def _record_endpoint(self, index: Optional[int], start: float, error: Optional[BaseException] = None) -> None:
+        """Feed a call's outcome into its endpoint's health; errors that aren't transient don't count."""
+        if index is None:
+            return
+        if error is None:
+            self.router.record(index, latency=time.perf_counter() - start)
+        else:
+            self.router.record(index, failed=is_retryable_error(error))
+    
+    async def _attempt(self, call_params: Dict[str, Any], tried: Optional[set] = None) -> Any:
+        """One non-streaming provider call, queued behind the shared rate limiter."""
+        call_params, endpoint = self._route(call_params, tried)
+        permit = await get_rate_limiter().acquire(call_params)
+        start = time.perf_counter()
+        error = None
+        try:
+            response = await (self.provider or get_llm_provider()).acompletion(**call_params)
+            # The whole response has arrived, so measure latency per output token
+            output_tokens = getattr(getattr(response, 'usage', None), 'completion_tokens', None)
+            if isinstance(output_tokens, int) and output_tokens > 0:
+                permit.responded(output_tokens)
+            permit.record_usage(getattr(response.usage, 'total_tokens', None))
+            self._record_endpoint(endpoint, start)
+            return response
+        except asyncio.CancelledError:
+            if endpoint is not None:
+                self.router.record(endpoint)  # A cancelled hedge says nothing about the endpoint's health
+            raise
+        except Exception as e:
+            error = e
+            self._record_endpoint(endpoint, start, e)
+            raise
+        finally:
+            permit.release(error)
+    
+    async def _hedged_attempt(self, call_params: Dict[str, Any], tried: Optional[set] = None):
+        """
+        Call the provider, firing a duplicate request if the first one is slow.
+        With failover endpoints, the duplicate goes to a different endpoint.
+        
+        Returns:
+            (response, hedged) from whichever request succeeded first
+        """
+        delay = self._hedge_delay()
+        start = time.perf_counter()
+        if delay is None:
+            response = await self._attempt(call_params, tried)
+            self._latencies.append(time.perf_counter() - start)
+            return response, False
+        
+        primary = asyncio.ensure_future(self._attempt(call_params, tried))
+        pending = {primary}
+        hedged = False
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                logger.debug(f"Hedging '{self.config.model}' call after {delay:.2f}s")
+                self.call_stats["hedges"] += 1
+                hedged = True
+                pending.add(asyncio.ensure_future(self._attempt(call_params, tried)))
+            
+            # Take the first success; fail only if every request failed
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.call_stats["hedge_wins"] += 1
+                        self._latencies.append(time.perf_counter() - start)
+                        return task.result(), hedged
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _should_fail_over(self, call_params: Dict[str, Any], tried: set, error: Exception) -> bool:
+        """Whether a failed call should go straight to another endpoint instead of backing off."""
+        if not self._routed(call_params) or not is_retryable_error(error) or not self.router.has_untried(tried):
+            return False
+        self.call_stats["failovers"] += 1
+        logger.warning(f"LLM endpoint failed ({error}), failing over to another endpoint")
+        return True
+    
+    async def _complete(self, call_params: Dict[str, Any]):
+        """
+        Non-streaming completion with retries, failover and optional hedging.
+        
+        Returns:
+            (response, retries, hedged)
+        """
+        self.call_stats["calls"] += 1
+        attempt = 0
+        tried = set()  # Endpoints tried since the last backoff
+        while True:
+            try:
+                response, hedged = await self._hedged_attempt(call_params, tried)
+                return response, attempt, hedged
+            except Exception as e:
+                if self._should_fail_over(call_params, tried, e):
+                    continue
+                if attempt >= self.config.retry_policy.max_retries or not is_retryable_error(e):
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                tried.clear()
+                self.call_stats["retries"] += 1
+                logger.warning(f"LLM call failed ({e}), retry {attempt} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    async def _open_stream(self, call_params: Dict[str, Any]):
+        """
+        Start a streaming completion, retrying or failing over before the first chunk.
+        
+        Returns:
+            (response stream, rate limit permit to release once consumed, retries)
+        """
+        self.call_stats["calls"] += 1
+        attempt = 0
+        tried = set()
+        while True:
+            params, endpoint = self._route(call_params, tried)
+            permit = await get_rate_limiter().acquire(params)
+            start = time.perf_counter()
+            try:
+                response = await (self.provider or get_llm_provider()).acompletion(**params)
+                permit.responded()
+                self._record_endpoint(endpoint, start)
+                return response, permit, attempt
+            except asyncio.CancelledError:
+                permit.release()
+                if endpoint is not None:
+                    self.router.record(endpoint)
+                raise
+            except Exception as e:
+                permit.release(e)
+                self._record_endpoint(endpoint, start, e)
+                if self._should_fail_over(call_params, tried, e):
+                    continue
+                if attempt >= self.config.retry_policy.max_retries or not is_retryable_error(e):
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                tried.clear()
+                self.call_stats["retries"] += 1
+                logger.warning(f"Streaming LLM call failed ({e}), retry {attempt} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    def get_endpoint_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Health of each failover endpoint: requests, failures, error rate, median latency, circuit state."""
+        return self.router.get_stats() if self.router else {}
+    
+    def get_call_stats(self) -> Dict[str, int]:
+        """Provider calls made by this brain, with retry, hedge and failover counts."""
+        return dict(self.call_stats)
+    
+    def _cascade_tiers(self) -> List[str]:
+        """Cheaper models to try, in order, before the brain's own model."""
+        cascade = self.config.cascade
+        return [m for m in cascade.models if m != self.config.model] if cascade else []
+    
+    def _tier_system_prompt(self, system_prompt: Optional[str]) -> Optional[str]:
+        """System prompt for a cheaper tier, asking it to flag steps it can't handle."""
+        cascade = self.config.cascade
+        if not cascade.confidence_prompt or "low_confidence" not in cascade.escalate_on:
+            return system_prompt
+        return f"{system_prompt}\n\n{cascade.confidence_prompt}" if system_prompt else cascade.confidence_prompt
+    
+    def _escalation_reason(self, content: Optional[str], tool_calls: Optional[List[Any]],
+                           finish_reason: Optional[str], tools: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+        """Why a cheaper tier's answer should go to the next tier, or None to accept it."""
+        checks = self.config.cascade.escalate_on
+        if "error" in checks and finish_reason == "error":
+            return "error"
+        if "empty_response" in checks and not (content or "").strip() and not tool_calls:
+            return "empty_response"
+        if "invalid_tool_arguments" in checks and tool_calls:
+            offered = {t.get("function", {}).get("name") for t in tools or []}
+            for tool_call in tool_calls:
+                function = tool_call.get("function") if isinstance(tool_call, dict) else getattr(tool_call, "function", None)
+                if isinstance(function, dict):
+                    name, arguments = function.get("name"), function.get("arguments")
+                else:
+                    name, arguments = getattr(function, "name", None), getattr(function, "arguments", None)
+                if tools and name not in offered:
+                    return "invalid_tool_arguments"
+                try:
+                    if not isinstance(json.loads(arguments or "{}"), dict):
+                        return "invalid_tool_arguments"
+                except (TypeError, json.JSONDecodeError):
+                    return "invalid_tool_arguments"
+        if "low_confidence" in checks and content:
+            lowered = content.lower()
+            if any(marker.lower() in lowered for marker in self.config.cascade.low_confidence_markers):
+                return "low_confidence"
+        return None
+    
+    def _record_tier(self, model: str, latency: float, usage: Optional[Dict[str, Any]], reason: Optional[str]) -> None:
+        """Add one call on a cascade tier to its stats; `reason` is None when the answer was kept."""
+        stats = self.cascade_stats.setdefault(model, {
+            "calls": 0, "accepted": 0, "escalated": 0, "latency_seconds": 0.0,
+            "prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0, "escalation_reasons": {}
+        })
+        stats["calls"] += 1
+        stats["latency_seconds"] += latency
+        if reason is None:
+            stats["accepted"] += 1
+        else:
+            stats["escalated"] += 1
+            stats["escalation_reasons"][reason] = stats["escalation_reasons"].get(reason, 0) + 1
+        if usage:
+            prompt_tokens = usage.get("prompt_tokens") or 0
+            completion_tokens = usage.get("completion_tokens") or 0
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            try:
+                prompt_cost, completion_cost = litellm.cost_per_token(
+                    model=self._model_name(model), prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+                )
+                stats["cost"] += prompt_cost + completion_cost
+            except Exception:
+                pass  # No pricing for this model; tokens are still counted
+    
+    def get_cascade_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tier calls, escalations by reason, latency, tokens and cost, for tuning the cascade."""
+        return {
+            model: {**stats, "escalation_reasons": dict(stats["escalation_reasons"]),
+                    "avg_latency_seconds": stats["latency_seconds"] / stats["calls"] if stats["calls"] else 0.0}
+            for model, stats in self.cascade_stats.items()
+        }
+
     async def generate_response(
         self,
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+        json_mode: bool = False,
+        turn_context: Optional[str] = None,
     ) -> BrainResponse:
         """
         Generate a single response from the LLM.
@@ -208,34 +569,95 @@ class Brain:
             system_prompt: Optional system prompt
             temperature: Override temperature
             tools: Available tools for the LLM
+            json_mode: Ask the provider for a single JSON object response
+            turn_context: Per-turn details sent after the conversation
             
         Returns:
             LLM response (may contain tool call requests)
         """
         await self._ensure_initialized()
         
-
+        tiers = self._cascade_tiers()
+        for model in tiers:
+            start = time.perf_counter()
+            response = await self._generate(
+                messages, self._tier_system_prompt(system_prompt), temperature, tools, json_mode, turn_context, model=model
+            )
+            reason = self._escalation_reason(response.content, response.tool_calls, response.finish_reason, tools)
+            self._record_tier(model, time.perf_counter() - start, response.usage, reason)
+            if reason is None:
+                return response
+            logger.info(f"Escalating from '{model}' to the next tier: {reason}")
+        
+        start = time.perf_counter()
+        response = await self._generate(messages, system_prompt, temperature, tools, json_mode, turn_context)
+        if tiers:
+            self._record_tier(self.config.model, time.perf_counter() - start, response.usage, None)
+        return response
+    
+    async def _generate(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        tools: Optional[List[Dict[str, Any]]],
+        json_mode: bool,
+        turn_context: Optional[str],
+        model: Optional[str] = None
+    ) -> BrainResponse:
+        """One non-streaming completion from the brain's model, or from `model` if given."""
+        formatted_messages = self._format_messages(messages, system_prompt, turn_context)
+        call_params = self._prepare_call_params(formatted_messages, temperature, tools, stream=False,
+                                                json_mode=json_mode, model=model)
         
-        formatted_messages = self._format_messages(messages, system_prompt)
-        call_params = self._prepare_call_params(formatted_messages, temperature, tools, stream=False)
+        # Serve byte-identical requests from the response cache
+        key = cache_key(call_params) if self.response_cache else None
+        if key:
+            entry = await asyncio.to_thread(self.response_cache.get, key)
+            if entry:
+                logger.debug(f"LLM response cache hit for '{self.config.model}'")
+                usage = self._cache_hit_usage()
+                self._notify_usage_callbacks(entry["model"], usage, None)
+                return BrainResponse(**{**entry["response"], "usage": usage, "timestamp": datetime.now()})
         
         try:
             logger.debug(f"Making LLM call with {len(formatted_messages)} messages")
             
-            response = await litellm.acompletion(**call_params)
+            response, retries, hedged = await self._complete(call_params)
             message = response.choices[0].message
             
             # Notify usage callbacks
             self._notify_usage_callbacks(response.model, None, response)
             
-            return BrainResponse(
+            usage = response.usage.dict() if response.usage else None
+            if usage is not None:
+                cached_tokens = self._cached_prompt_tokens(usage)
+                if cached_tokens is not None:
+                    usage['cached_prompt_tokens'] = cached_tokens
+                if retries or hedged:
+                    usage.update(retries=retries, hedged=hedged)
+            brain_response = BrainResponse(
                 content=message.content,
                 tool_calls=message.tool_calls if hasattr(message, 'tool_calls') else None,
                 model=response.model,
-                usage=response.usage.dict() if response.usage else None,
+                usage=usage,
                 finish_reason=response.choices[0].finish_reason,
                 timestamp=datetime.now()
             )
+            if key:
+                await asyncio.to_thread(self.response_cache.put, key, {
+                    "model": brain_response.model,
+                    "response": {
+                        "content": brain_response.content,
+                        "tool_calls": [
+                            tc.model_dump() if hasattr(tc, 'model_dump') else tc
+                            for tc in brain_response.tool_calls
+                        ] if brain_response.tool_calls else None,
+                        "model": brain_response.model,
+                        "finish_reason": brain_response.finish_reason
+                    }
+                })
+            return brain_response
             
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
@@ -251,7 +673,8 @@ class Brain:
         messages: List[Dict[str, Any]],
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
-        tools: Optional[List[Dict[str, Any]]] = None
+        tools: Optional[List[Dict[str, Any]]] = None,
+        turn_context: Optional[str] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Stream response from the LLM with integrated tool call detection.
@@ -264,6 +687,7 @@ class Brain:
             system_prompt: Optional system prompt  
             temperature: Override temperature
             tools: Available tools for the LLM
+            turn_context: Per-turn details sent after the conversation
             
         Yields:
             Dict[str, Any]: Structured chunks with type and data:
@@ -275,11 +699,63 @@ class Brain:
         """
         await self._ensure_initialized()
         
-
+        # Cheaper tiers are buffered so a rejected answer never reaches the caller
+        tiers = self._cascade_tiers()
+        for model in tiers:
+            start = time.perf_counter()
+            buffered = [
+                chunk async for chunk in self._stream(
+                    messages, self._tier_system_prompt(system_prompt), temperature, tools, turn_context, model=model
+                )
+            ]
+            finish = next((c for c in buffered if c['type'] == 'finish'), {})
+            reason = self._escalation_reason(
+                "".join(c.get('content') or "" for c in buffered if c['type'] == 'text-delta'),
+                [c['tool_call'] for c in buffered if c['type'] == 'tool-call'],
+                'error' if any(c['type'] == 'error' for c in buffered) else finish.get('finish_reason'),
+                tools
+            )
+            self._record_tier(model, time.perf_counter() - start, finish.get('usage'), reason)
+            if reason is None:
+                for chunk in buffered:
+                    yield chunk
+                return
+            logger.info(f"Escalating from '{model}' to the next tier: {reason}")
+        
+        start = time.perf_counter()
+        async for chunk in self._stream(messages, system_prompt, temperature, tools, turn_context):
+            if chunk['type'] == 'finish' and tiers:
+                self._record_tier(self.config.model, time.perf_counter() - start, chunk.get('usage'), None)
+            yield chunk
+    
+    async def _stream(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        tools: Optional[List[Dict[str, Any]]],
+        turn_context: Optional[str],
+        model: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """One streaming completion from the brain's model, or from `model` if given."""
+        formatted_messages = self._format_messages(messages, system_prompt, turn_context)
+        call_params = self._prepare_call_params(formatted_messages, temperature, tools, stream=True, model=model)
         
-        formatted_messages = self._format_messages(messages, system_prompt)
-        call_params = self._prepare_call_params(formatted_messages, temperature, tools, stream=True)
+        # Replay byte-identical requests from the response cache
+        key = cache_key(call_params) if self.response_cache else None
+        if key:
+            entry = await asyncio.to_thread(self.response_cache.get, key)
+            if entry:
+                logger.debug(f"LLM response cache hit for '{self.config.model}' (stream)")
+                for chunk in entry["chunks"]:
+                    if chunk['type'] == 'finish':
+                        chunk['usage'] = self._cache_hit_usage()
+                        self._notify_usage_callbacks(chunk.get('model') or entry["model"], chunk['usage'], None)
+                    yield chunk
+                return
         
+        permit = None
+        error = None
         try:
             logger.debug(f"Making streaming LLM call with {len(formatted_messages)} messages")
             
@@ -291,28 +767,58 @@ class Brain:
             else:
                 logger.info(f"[BRAIN] No tools being sent to LLM")
             
-            response = await litellm.acompletion(**call_params)
+            # The rate limit slot is held until the stream is fully consumed
+            response, permit, retries = await self._open_stream(call_params)
             
             if self.config.supports_function_calls and tools:
                 # Native function calling mode
-                async for chunk in self._handle_native_function_calling_stream(response):
-                    yield chunk
+                chunks = self._handle_native_function_calling_stream(response)
             else:
                 # Text-based tool calling mode (for models without native support)
-                async for chunk in self._handle_text_based_tool_calling_stream(response, tools):
-                    yield chunk
+                chunks = self._handle_text_based_tool_calling_stream(response, tools)
+            
+            recorded = []
+            async for chunk in chunks:
+                if chunk['type'] == 'finish' and isinstance(chunk.get('usage'), dict):
+                    permit.record_usage(chunk['usage'].get('total_tokens'))
+                    cached_tokens = self._cached_prompt_tokens(chunk['usage'])
+                    if cached_tokens is not None:
+                        chunk['usage']['cached_prompt_tokens'] = cached_tokens
+                    if retries:
+                        chunk['usage']['retries'] = retries
+                if key:
+                    recorded.append(json.loads(json.dumps(chunk, default=str)))
+                yield chunk
+            
+            # Only complete, error-free streams are worth replaying
+            if key and any(c['type'] == 'finish' for c in recorded) and not any(c['type'] == 'error' for c in recorded):
+                await asyncio.to_thread(self.response_cache.put, key, {
+                    "model": self.config.model,
+                    "chunks": recorded
+                })
                     
         except Exception as e:
+            error = e
             logger.error(f"Streaming LLM call failed: {e}")
             yield {
                 'type': 'error',
                 'content': f"I apologize, but I encountered an error: {str(e)}"
             }
+        finally:
+            if permit:
+                permit.release(error)
     
     async def _handle_native_function_calling_stream(self, response) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle streaming for models with native function calling support."""
+        """
+        Handle streaming for models with native function calling support.
+        
+        A tool call is emitted as soon as its arguments form a complete JSON
+        object, so it can start executing while the rest of the response is
+        still streaming. Any remaining calls are emitted at finish.
+        """
         # Track accumulated tool calls for proper reconstruction
         accumulated_tool_calls = {}
+        emitted_tool_call_ids = set()
         usage_data = None
         model_name = None
         
@@ -373,6 +879,7 @@ class Brain:
                                 logger.info(f"[BRAIN] Added arguments: '{func.arguments}' -> Total: '{accumulated_tool_calls[tool_call_id]['function']['arguments']}'")
                             else:
                                 logger.info(f"[BRAIN] No arguments in this delta")
+                        updated_id = tool_call_id
                     
                     elif hasattr(tool_call_delta, 'function') and accumulated_tool_calls:
                         # Handle chunks without ID - accumulate to the most recent tool call
@@ -388,13 +895,28 @@ class Brain:
                             logger.info(f"[BRAIN] Added arguments (no ID): '{func.arguments}' -> Total: '{accumulated_tool_calls[most_recent_id]['function']['arguments']}'")
                         else:
                             logger.info(f"[BRAIN] No arguments in this delta (no ID)")
+                        updated_id = most_recent_id
+                    
+                    else:
+                        continue
+                    
+                    # Emit the call early once its arguments are complete
+                    tool_call = accumulated_tool_calls[updated_id]
+                    if updated_id not in emitted_tool_call_ids and self._tool_call_complete(tool_call):
+                        emitted_tool_call_ids.add(updated_id)
+                        logger.debug(f"[BRAIN] Emitting completed tool call: {tool_call}")
+                        yield {
+                            'type': 'tool-call',
+                            'tool_call': tool_call
+                        }
             
             # Handle finish reason - emit complete tool calls
             if hasattr(choice, 'finish_reason') and choice.finish_reason:
                 logger.debug(f"[BRAIN] Stream finished, accumulated tool calls: {accumulated_tool_calls}")
-                # Emit all accumulated tool calls for client visualization
+                # Emit accumulated tool calls that were not emitted early
                 for tool_call in accumulated_tool_calls.values():
-                    if tool_call['function']['name']:  # Only emit complete tool calls
+                    if tool_call['function']['name'] and tool_call['id'] not in emitted_tool_call_ids:
+                        emitted_tool_call_ids.add(tool_call['id'])
                         logger.debug(f"[BRAIN] Emitting tool call: {tool_call}")
                         yield {
                             'type': 'tool-call',
@@ -430,6 +952,17 @@ class Brain:
                 'usage': usage_data
             }
     
+    @staticmethod
+    def _tool_call_complete(tool_call: Dict[str, Any]) -> bool:
+        """Whether a streamed tool call has a name and a complete JSON object of arguments."""
+        arguments = tool_call['function']['arguments'].strip()
+        if not tool_call['function']['name'] or not arguments.endswith('}'):
+            return False
+        try:
+            return isinstance(json.loads(arguments), dict)
+        except json.JSONDecodeError:
+            return False
+    
     async def _handle_text_based_tool_calling_stream(self, response, tools) -> AsyncGenerator[Dict[str, Any], None]:
         """Handle streaming for models without native function calling support."""
         content_chunks = []
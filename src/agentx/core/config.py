@@ -37,6 +37,62 @@ class GuardrailType(str, Enum):
     RATE_LIMITING = "rate_limiting"
     CONTENT_SAFETY = "content_safety"
 
+class ResponseCacheConfig(BaseModel):
+    """Persistent exact-match LLM response cache settings."""
+    enabled: bool = True
+    directory: str = ".agentx/llm_cache"
+    max_size_mb: float = 256
+    ttl_seconds: int = 7 * 24 * 3600
+
+class RateLimitConfig(BaseModel):
+    """Limits shared by every LLM call to one provider or model."""
+    requests_per_minute: Optional[int] = None  # None = unlimited
+    tokens_per_minute: Optional[int] = None  # Estimated prompt + max_tokens; None = unlimited
+    initial_concurrency: int = 8
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    backoff_factor: float = 0.5  # Applied to the concurrency limit on a 429
+    latency_tolerance: Optional[float] = None  # Back off when latency exceeds this multiple of the baseline; None = 429s only
+    latency_backoff_factor: float = 0.9
+    latency_baseline_decay: float = 0.05  # How fast the baseline drifts up from its fastest sample
+
+class RetryPolicy(BaseModel):
+    """Retries and request hedging for LLM calls."""
+    max_retries: int = 3  # For 429s, 5xx, timeouts and connection errors
+    initial_delay: float = 1.0  # Seconds; backoff is jittered between 0 and the exponential delay
+    max_delay: float = 20.0
+    multiplier: float = 2.0
+    hedge_percentile: Optional[float] = None  # e.g. 95: duplicate non-streaming calls slower than p95
+    hedge_min_samples: int = 20  # Latencies to observe before hedging starts
+
+class CascadeConfig(BaseModel):
+    """Cheaper models to try before the brain's own model."""
+    models: List[str] = Field(default_factory=list)  # Tried in order; the brain's model is the last resort
+    escalate_on: List[str] = Field(default_factory=lambda: [
+        "error", "empty_response", "invalid_tool_arguments", "low_confidence"
+    ])
+    low_confidence_markers: List[str] = Field(default_factory=lambda: ["[LOW_CONFIDENCE]"])
+    confidence_prompt: Optional[str] = (  # Appended to the system prompt of cheaper tiers; None to omit
+        "If you are not confident you can handle this step correctly, reply with only [LOW_CONFIDENCE]."
+    )
+
+class EndpointConfig(BaseModel):
+    """An endpoint serving a model equivalent to the brain's own."""
+    model: str
+    provider: Optional[str] = None  # Defaults to the brain's provider
+    api_key: Optional[str] = None
+    base_url: Optional[str] = None
+    weight: float = 1.0  # Relative share of traffic under weighted routing
+
+class FailoverConfig(BaseModel):
+    """Health-based routing between the brain's endpoint and equivalent ones."""
+    endpoints: List[EndpointConfig] = Field(default_factory=list)  # Alternatives after the brain's own endpoint
+    strategy: Literal["ordered", "weighted"] = "ordered"
+    failure_threshold: int = 3  # Consecutive failures that open an endpoint's circuit
+    cooldown_seconds: float = 30.0  # How long an open circuit rejects traffic before one trial request
+    latency_window: int = 50  # Recent calls per endpoint kept for latency and error rates
+    slow_factor: float = 2.0  # Ordered routing skips endpoints this many times slower (median) than the fastest
+
 class BrainConfig(BaseModel):
     """Brain configuration with DeepSeek as default provider."""
     provider: str = "deepseek"  # Default provider (Req #17)
@@ -46,9 +102,15 @@ class BrainConfig(BaseModel):
     api_key: Optional[str] = None
     base_url: Optional[str] = None
     timeout: int = 30
-    retry_policy: Dict[str, Any] = Field(default_factory=dict)
+    retry_policy: RetryPolicy = Field(default_factory=RetryPolicy)
     supports_function_calls: bool = True  # Whether the model supports native function calling
+    parallel_function_calls: bool = True  # Run independent tool calls from one response concurrently
     streaming: bool = True  # Whether to use streaming mode
+    max_context_length: Optional[int] = None  # Prompt token budget; None disables enforcement
+    response_cache: Optional[ResponseCacheConfig] = None  # Opt-in; see core/llm_cache.py
+    rate_limit: Optional[RateLimitConfig] = None  # Shared by all brains on this model; see core/rate_limiter.py
+    cascade: Optional[CascadeConfig] = None  # Try cheaper models first; see Brain.generate_response
+    failover: Optional[FailoverConfig] = None  # Equivalent endpoints; see core/endpoint_router.py
     
     @model_validator(mode='after')
     def set_default_base_url(self):
@@ -80,6 +142,24 @@ class Handoff(BaseModel):
     condition: str  # Natural language description of when to handoff (AG2-consistent)
     priority: int = 1  # Higher numbers = higher priority
 
+class RoutingRule(BaseModel):
+    """
+    Declarative routing rule evaluated locally before the routing LLM.
+    
+    All given conditions must hold; a rule without conditions always matches.
+    """
+    after: Optional[str] = None  # Agent that just finished its turn ("*" or None = any)
+    contains: Optional[Union[str, List[str]]] = None  # Case-insensitive substring(s), any may match
+    matches: Optional[str] = None  # Regular expression searched in the last response
+    action: Literal["handoff", "complete", "continue"] = "handoff"
+    to: Optional[str] = None  # Target agent for handoff
+    
+    @model_validator(mode='after')
+    def check_handoff_target(self):
+        if self.action == 'handoff' and not self.to:
+            raise ValueError("Handoff routing rules need a 'to' agent")
+        return self
+
 class CollaborationPattern(BaseModel):
     """Custom collaboration pattern configuration."""
     name: str
@@ -106,6 +186,15 @@ class MemoryConfig(BaseModel):
     consolidation_interval: int = 3600  # seconds
     vector_db_config: Dict[str, Any] = Field(default_factory=dict)
 
+class ContextPolicy(BaseModel):
+    """Context window budget and history compaction policy for an agent."""
+    max_tokens: Optional[int] = None  # Overrides brain max_context_length when set
+    pinned_head_messages: int = 1  # Leading messages always kept (the initial prompt)
+    tail_messages: int = 6  # Recent messages never folded into a summary
+    compaction_threshold: float = 0.75  # Fraction of the budget that triggers background compaction
+    summarize: bool = True  # Summarize older spans; when False they are only truncated
+    chars_per_token: float = 4.0  # Heuristic used to estimate tokens per message
+
 class AgentConfig(BaseModel):
     """Agent configuration for flat team structure."""
     name: str
@@ -117,6 +206,7 @@ class AgentConfig(BaseModel):
     guardrail_policies: List[str] = Field(default_factory=list)
     collaboration_patterns: List[str] = Field(default_factory=list)
     max_parallel_tasks: int = 1
+    context_policy: Optional[ContextPolicy] = None
 
 class TaskConfig(BaseModel):
     """Task-specific configuration for execution control."""
@@ -0,0 +1,219 @@
+"""
+Health-based routing between equivalent LLM endpoints.
+
+A brain with a failover configuration can send its requests to its own
+endpoint or to any listed equivalent one, e.g. the same model from another
+provider. Each endpoint keeps rolling latency and error statistics. After
+repeated failures its circuit opens: it gets no traffic until a cooldown has
+passed, then a single trial request decides whether it closes again.
+Endpoint health is shared by every brain in the process, so one agent's
+failures steer the others away from a degraded provider too.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+from .config import BrainConfig, FailoverConfig
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def model_name(config: BrainConfig) -> str:
+    """Model name with its provider prefix, as sent to litellm."""
+    if config.provider and "/" not in config.model:
+        return f"{config.provider}/{config.model}"
+    return config.model
+
+
+def endpoint_key(config: BrainConfig) -> Tuple[str, Optional[str]]:
+    return model_name(config), config.base_url
+
+
+class EndpointHealth:
+    """Rolling latency, error rate and circuit breaker state for one endpoint."""
+
+    def __init__(self, name: str, config: FailoverConfig):
+        self.name = name
+        self.config = config
+        self.latencies: deque = deque(maxlen=config.latency_window)
+        self.outcomes: deque = deque(maxlen=config.latency_window)  # True for a failure
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.stats = {"requests": 0, "failures": 0, "circuit_opens": 0}
+
+    def state(self, now: float) -> str:
+        """Circuit state: "closed" (healthy), "open" (cooling down) or "half_open" (ready for a trial request)."""
+        if self.opened_at is None:
+            return "closed"
+        return "open" if now - self.opened_at < self.config.cooldown_seconds else "half_open"
+
+    def available(self, now: float) -> bool:
+        state = self.state(now)
+        return state == "closed" or (state == "half_open" and not self.trial_in_flight)
+
+    def median_latency(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[len(ordered) // 2]
+
+    def error_rate(self) -> float:
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+    def record_success(self, latency: float) -> None:
+        self.stats["requests"] += 1
+        self.latencies.append(latency)
+        self.outcomes.append(False)
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+        if self.opened_at is not None:
+            logger.info(f"LLM endpoint '{self.name}' recovered")
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        self.stats["requests"] += 1
+        self.stats["failures"] += 1
+        self.outcomes.append(True)
+        self.consecutive_failures += 1
+        if self.trial_in_flight or (self.opened_at is None and self.consecutive_failures >= self.config.failure_threshold):
+            if self.opened_at is None:
+                self.stats["circuit_opens"] += 1
+                logger.warning(f"LLM endpoint '{self.name}' failing, routing around it for {self.config.cooldown_seconds:.0f}s")
+            self.opened_at = now
+        self.trial_in_flight = False
+
+
+_health: Dict[Tuple[str, Optional[str]], EndpointHealth] = {}
+_health_lock = threading.Lock()
+
+
+def get_endpoint_health(config: BrainConfig, failover: FailoverConfig) -> EndpointHealth:
+    """Get the process-wide health record for an endpoint, creating it on first use."""
+    key = endpoint_key(config)
+    with _health_lock:
+        health = _health.get(key)
+        if health is None:
+            name = model_name(config) if not config.base_url else f"{model_name(config)} @ {config.base_url}"
+            health = EndpointHealth(name, failover)
+            _health[key] = health
+        return health
+
+
+def reset_endpoint_health() -> None:
+    """Forget all endpoint statistics and circuit states."""
+    with _health_lock:
+        _health.clear()
+
+
+class EndpointRouter:
+    """
+    Picks the endpoint for each request of one brain.
+
+    Endpoints whose circuit is open are skipped. Ordered routing takes the
+    first remaining endpoint unless it is much slower than the fastest one.
+    Weighted routing picks at random, favouring higher configured weight,
+    lower latency and fewer recent errors. When every circuit is open, the
+    endpoint that has cooled down longest is tried anyway.
+    """
+
+    def __init__(self, config: BrainConfig):
+        self.failover = config.failover
+        primary = config.model_copy(update={"failover": None, "cascade": None})
+        self.endpoints: List[BrainConfig] = [primary] + [
+            primary.model_copy(update={
+                "model": endpoint.model,
+                "provider": endpoint.provider or config.provider,
+                "api_key": endpoint.api_key,
+                "base_url": endpoint.base_url
+            })
+            for endpoint in self.failover.endpoints
+        ]
+        self.weights = [1.0] + [endpoint.weight for endpoint in self.failover.endpoints]
+
+    def health(self, endpoint: BrainConfig) -> EndpointHealth:
+        return get_endpoint_health(endpoint, self.failover)
+
+    def choose(self, exclude: Iterable[int] = ()) -> int:
+        """
+        Pick an endpoint for the next request.
+
+        Args:
+            exclude: Indexes of endpoints already tried for this request
+
+        Returns:
+            Index into `endpoints`
+        """
+        now = time.monotonic()
+        exclude = set(exclude)
+        candidates = [i for i in range(len(self.endpoints))
+                      if i not in exclude and self.health(self.endpoints[i]).available(now)]
+        if not candidates:
+            fallback = [i for i in range(len(self.endpoints)) if i not in exclude] or list(range(len(self.endpoints)))
+            choice = min(fallback, key=lambda i: self.health(self.endpoints[i]).opened_at or 0.0)
+        elif self.failover.strategy == "weighted":
+            choice = random.choices(candidates, weights=[self._score(i, candidates) for i in candidates])[0]
+        else:
+            medians = {i: self.health(self.endpoints[i]).median_latency() for i in candidates}
+            known = [m for m in medians.values() if m is not None]
+            fastest = min(known) if known else None
+            choice = next(
+                (i for i in candidates
+                 if medians[i] is None or medians[i] <= fastest * self.failover.slow_factor),
+                candidates[0]
+            )
+
+        health = self.health(self.endpoints[choice])
+        if health.state(now) == "half_open":
+            health.trial_in_flight = True
+        return choice
+
+    def _score(self, index: int, candidates: List[int]) -> float:
+        health = self.health(self.endpoints[index])
+        known = [m for m in (self.health(self.endpoints[i]).median_latency() for i in candidates) if m is not None]
+        median = health.median_latency()
+        speed = min(known) / median if known and median else 1.0
+        return max(self.weights[index], 0.0) * speed * (1.0 - health.error_rate()) + 1e-6
+
+    def record(self, index: int, latency: Optional[float] = None, failed: bool = False) -> None:
+        """
+        Record how a request to an endpoint went.
+
+        Args:
+            index: Endpoint index from `choose`
+            latency: Seconds until the endpoint responded, for a success
+            failed: Whether the endpoint failed; with neither set, the
+                    request was abandoned and says nothing about its health
+        """
+        health = self.health(self.endpoints[index])
+        if failed:
+            health.record_failure()
+        elif latency is not None:
+            health.record_success(latency)
+        else:
+            health.trial_in_flight = False
+
+    def has_untried(self, tried: Iterable[int]) -> bool:
+        """Whether an endpoint outside `tried` can take a request right now."""
+        now = time.monotonic()
+        return any(i not in tried and self.health(endpoint).available(now)
+                   for i, endpoint in enumerate(self.endpoints))
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per endpoint requests, failures, error rate, median latency and circuit state."""
+        now = time.monotonic()
+        stats = {}
+        for endpoint in self.endpoints:
+            health = self.health(endpoint)
+            stats[health.name] = {
+                **health.stats,
+                "error_rate": round(health.error_rate(), 3),
+                "median_latency_seconds": health.median_latency(),
+                "circuit": health.state(now)
+            }
+        return stats
@@ -0,0 +1,137 @@
+"""
+Shared, connection-pooled HTTP clients for LLM providers.
+
+Brains calling the same provider endpoint share one client per event loop.
+That includes agent brains and the orchestrator's routing brain. Their
+keep-alive connections then skip the TCP and TLS handshakes after the first
+request. `warm_connections` opens those connections ahead of the first
+request, e.g. at server start. Providers not listed here keep using
+litellm's own clients.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from .config import BrainConfig
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Set to "0" to let litellm create its own clients
+POOL_ENV = "AGENTX_HTTP_POOL"
+
+# Providers litellm calls through the OpenAI SDK; the client carries the API key
+OPENAI_SDK_PROVIDERS = {"openai": "https://api.openai.com/v1"}
+
+# Providers litellm calls through its own HTTP handler; credentials go per request
+HTTP_HANDLER_PROVIDERS = {"deepseek": "https://api.deepseek.com", "anthropic": "https://api.anthropic.com"}
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+TIMEOUT = 600.0
+
+_clients: Dict[Tuple[Any, ...], Tuple[Any, Any]] = {}  # key -> (client for litellm, httpx.AsyncClient)
+_clients_lock = threading.Lock()
+
+
+def _endpoint(config: BrainConfig) -> Optional[Tuple[str, str, Optional[str]]]:
+    """(provider, base URL, API key) for a pooled client, or None if this brain can't use one."""
+    provider = config.provider
+    if "/" in config.model:
+        provider = config.model.split("/", 1)[0]
+    if provider in HTTP_HANDLER_PROVIDERS:
+        return provider, config.base_url or HTTP_HANDLER_PROVIDERS[provider], None
+    if provider in OPENAI_SDK_PROVIDERS:
+        api_key = config.api_key or os.getenv(f"{provider.upper()}_API_KEY")
+        if not api_key:
+            return None  # Let litellm resolve credentials itself
+        return provider, config.base_url or OPENAI_SDK_PROVIDERS[provider], api_key
+    return None
+
+
+def get_pooled_client(config: BrainConfig) -> Optional[Any]:
+    """
+    Get the shared client for a brain's endpoint in the running event loop.
+
+    Args:
+        config: Brain configuration naming the provider, base URL and key
+
+    Returns:
+        A client to pass to litellm as `client`, or None when pooling is
+        disabled or doesn't apply to this provider
+    """
+    if os.getenv(POOL_ENV, "1").lower() in ("0", "false", "no"):
+        return None
+    endpoint = _endpoint(config)
+    if endpoint is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    key = (loop, *endpoint)
+    with _clients_lock:
+        if key not in _clients:
+            # Clients are bound to the loop that created them; forget closed loops
+            for stale in [k for k in _clients if k[0].is_closed()]:
+                del _clients[stale]
+            _clients[key] = _create_client(*endpoint)
+        return _clients[key][0]
+
+
+def _create_client(provider: str, base_url: str, api_key: Optional[str]) -> Tuple[Any, Any]:
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+    )
+    logger.debug(f"Creating pooled HTTP client for {provider} at {base_url}")
+
+    if provider in OPENAI_SDK_PROVIDERS:
+        import openai
+        http_client = httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(TIMEOUT, connect=10.0))
+        # Brain retries failed calls itself, so the SDK must not retry as well
+        return openai.AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client, max_retries=0), http_client
+
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+    try:
+        handler = AsyncHTTPHandler(timeout=TIMEOUT, transport=httpx.AsyncHTTPTransport(limits=limits))
+    except TypeError:
+        handler = AsyncHTTPHandler(timeout=TIMEOUT)  # Older litellm: keep its default pool limits
+    return handler, handler.client
+
+
+async def warm_connections(configs: List[BrainConfig]) -> int:
+    """
+    Open pooled connections before the first LLM request.
+
+    Args:
+        configs: Brain configurations whose endpoints should be warmed
+
+    Returns:
+        Number of pooled endpoints in this event loop that answered
+    """
+    for config in configs:
+        get_pooled_client(config)
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        endpoints = [(key[2], http_client) for key, (_, http_client) in _clients.items() if key[0] is loop]
+
+    async def warm(base_url: str, http_client) -> bool:
+        try:
+            # Any response will do; the point is the TCP and TLS handshake
+            await http_client.head(base_url, timeout=10.0)
+            return True
+        except Exception as e:
+            logger.debug(f"Could not warm connection to {base_url}: {e}")
+            return False
+
+    warmed = sum(await asyncio.gather(*(warm(*endpoint) for endpoint in endpoints)))
+    logger.info(f"Warmed {warmed} LLM provider connection(s)")
+    return warmed
@@ -0,0 +1,150 @@
+"""
+Task journal - append-only write-ahead log of task events.
+
+Every TaskStep, routing decision and artifact event is appended to
+history/journal.jsonl as one JSON line, so persisting a step costs one small
+append instead of rewriting the whole task state. Every so often a compact
+snapshot of the full state is written to task_state.json and the journal is
+truncated. A task is rebuilt from the latest snapshot plus the journal tail.
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..storage.interfaces import FileStorage
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TaskJournal:
+    """
+    Append-only journal with periodic snapshots for one task workspace.
+
+    Records are buffered by record() (safe to call from sync code such as
+    Task.add_step) and written by flush(). Each record carries a sequence
+    number; the snapshot stores the last sequence it covers, so records
+    already folded into a snapshot are skipped on replay even if the
+    journal was not truncated before a crash.
+    """
+
+    JOURNAL_PATH = "history/journal.jsonl"
+    SNAPSHOT_PATH = "task_state.json"
+
+    def __init__(self, file_storage: FileStorage, snapshot_interval: int = 50):
+        """
+        Initialize the journal.
+
+        Args:
+            file_storage: Workspace file storage to write into
+            snapshot_interval: Records to journal between compact snapshots
+        """
+        self.file_storage = file_storage
+        self.snapshot_interval = snapshot_interval
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._pending: List[str] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot_due(self) -> bool:
+        """Whether enough records have been journaled since the last snapshot."""
+        return self._seq - self._snapshot_seq >= self.snapshot_interval
+
+    def record(self, record_type: str, data: Dict[str, Any]) -> None:
+        """
+        Buffer a record for the next flush.
+
+        Args:
+            record_type: Record kind ("start", "step", "routing", "artifact")
+            data: JSON-serializable record payload
+        """
+        self._seq += 1
+        self._pending.append(json.dumps(
+            {"seq": self._seq, "type": record_type, "data": data},
+            ensure_ascii=False,
+            default=str
+        ))
+
+    async def flush(self) -> None:
+        """Append all buffered records to the journal."""
+        async with self._lock:
+            if not self._pending:
+                return
+
+            lines, self._pending = self._pending, []
+            result = await self.file_storage.append_text(self.JOURNAL_PATH, "\n".join(lines) + "\n")
+            if not result.success:
+                # Keep the records so the next flush retries them
+                self._pending = lines + self._pending
+                raise IOError(f"Failed to append to task journal: {result.error}")
+
+    async def snapshot(self, state: Dict[str, Any]) -> None:
+        """
+        Write a compact snapshot of the full task state and truncate the journal.
+
+        The snapshot is written to a temporary file and moved into place, so a
+        crash leaves either the previous or the new snapshot intact.
+
+        Args:
+            state: Full task state, including serialized history
+        """
+        await self.flush()
+
+        async with self._lock:
+            seq = self._seq
+            content = json.dumps({**state, "journal_seq": seq}, ensure_ascii=False, indent=2, default=str)
+
+            temp_path = f"{self.SNAPSHOT_PATH}.tmp"
+            result = await self.file_storage.write_text(temp_path, content)
+            if not result.success:
+                raise IOError(f"Failed to write task snapshot: {result.error}")
+            result = await self.file_storage.move(temp_path, self.SNAPSHOT_PATH)
+            if not result.success:
+                raise IOError(f"Failed to replace task snapshot: {result.error}")
+
+            self._snapshot_seq = seq
+            if not self._pending:
+                await self.file_storage.write_text(self.JOURNAL_PATH, "")
+
+        logger.debug(f"Task snapshot written at journal seq {seq}")
+
+    async def load(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Load the latest snapshot and the journal records written after it.
+
+        A torn final line (a crash mid-append) ends the replay and is cut from
+        the journal, so later appends start on a fresh line.
+
+        Returns:
+            Tuple of (snapshot or None, records newer than the snapshot)
+        """
+        snapshot = None
+        if await self.file_storage.exists(self.SNAPSHOT_PATH):
+            snapshot = json.loads(await self.file_storage.read_text(self.SNAPSHOT_PATH))
+
+        base_seq = snapshot.get("journal_seq", 0) if snapshot else 0
+        records = []
+
+        if await self.file_storage.exists(self.JOURNAL_PATH):
+            valid_lines = []
+            for line in (await self.file_storage.read_text(self.JOURNAL_PATH)).splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Task journal ends with a partial record; truncating it")
+                    content = "".join(f"{valid}\n" for valid in valid_lines)
+                    result = await self.file_storage.write_text(self.JOURNAL_PATH, content)
+                    if not result.success:
+                        raise IOError(f"Failed to truncate task journal: {result.error}")
+                    break
+                valid_lines.append(line)
+                if record["seq"] > base_seq:
+                    records.append(record)
+
+        self._snapshot_seq = base_seq
+        self._seq = records[-1]["seq"] if records else base_seq
+        return snapshot, records
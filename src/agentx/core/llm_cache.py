@@ -0,0 +1,209 @@
+"""
+Persistent exact-match cache for LLM responses.
+
+Benchmark reruns, test suites and retried tasks send byte-identical
+completion requests. When enabled, Brain looks each request up here before
+calling the provider. Entries are JSON files keyed by a hash of the request,
+evicted least-recently-used once the store exceeds its size budget, and
+ignored once older than their TTL.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .config import ResponseCacheConfig
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Environment variable that enables the cache for every Brain, e.g. for benchmarks
+CACHE_DIR_ENV = "AGENTX_LLM_CACHE_DIR"
+
+# Request fields that determine the response. Credentials, timeouts and
+# streaming options don't change what the model says.
+KEY_FIELDS = ("model", "messages", "tools", "tool_choice", "temperature", "max_tokens", "response_format")
+
+
+# Brain sends the current time in a trailing message. It changes every
+# minute and must not stop otherwise identical requests from matching.
+CLOCK_LINE_PREFIX = "Current date and time: "
+_CLOCK_LINE = re.compile(rf"^{CLOCK_LINE_PREFIX}.*$", re.MULTILINE)
+
+
+def _without_clock(messages: Any) -> Any:
+    if not isinstance(messages, list) or not messages:
+        return messages
+    last = messages[-1]
+    if not isinstance(last, dict) or not isinstance(last.get("content"), str):
+        return messages
+    return messages[:-1] + [{**last, "content": _CLOCK_LINE.sub("", last["content"])}]
+
+
+def cache_key(call_params: Dict[str, Any]) -> str:
+    """Canonical hash of the request fields that determine an LLM response."""
+    request = {field: call_params.get(field) for field in KEY_FIELDS}
+    request["messages"] = _without_clock(request["messages"])
+    request["stream"] = bool(call_params.get("stream"))
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU store of LLM responses on disk.
+
+    One JSON file per entry. File modification time records the last access,
+    so recency survives restarts. Methods do blocking file I/O; Brain calls
+    them from a worker thread.
+    """
+
+    def __init__(self, config: ResponseCacheConfig):
+        self.config = config
+        self.directory = Path(config.directory).expanduser()
+        self.max_bytes = int(config.max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, list]] = None  # key -> [size, last_access]
+        self._total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load_index(self) -> Dict[str, list]:
+        """Scan the directory once to learn entry sizes and access times."""
+        if self._index is None:
+            self._index = {}
+            self._total_bytes = 0
+            if self.directory.exists():
+                for path in self.directory.glob("*.json"):
+                    stat = path.stat()
+                    self._index[path.stem] = [stat.st_size, stat.st_mtime]
+                    self._total_bytes += stat.st_size
+        return self._index
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Request hash from `cache_key`
+
+        Returns:
+            The stored entry, or None on a miss or an expired entry
+        """
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                self.stats["misses"] += 1
+                return None
+
+            path = self._path(key)
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"Dropping unreadable cache entry {key}: {e}")
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+
+            if time.time() - entry.get("created_at", 0) > self.config.ttl_seconds:
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+
+            now = time.time()
+            index[key][1] = now
+            os.utime(path, (now, now))
+            self.stats["hits"] += 1
+            return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry, evicting least recently used entries over the size budget.
+
+        Args:
+            key: Request hash from `cache_key`
+            entry: JSON-serializable response data
+        """
+        data = json.dumps({**entry, "created_at": time.time()}, ensure_ascii=False, default=str)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            index = self._load_index()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if key in index:
+                self._remove(key)
+
+            # Write then rename so readers never see a partial file
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, path)
+            index[key] = [size, time.time()]
+            self._total_bytes += size
+            self.stats["writes"] += 1
+
+            if self._total_bytes > self.max_bytes:
+                for old_key, _ in sorted(index.items(), key=lambda item: item[1][1]):
+                    if self._total_bytes <= self.max_bytes:
+                        break
+                    if old_key != key:
+                        self._remove(old_key)
+                        self.stats["evictions"] += 1
+
+    def _remove(self, key: str) -> None:
+        size, _ = self._index.pop(key)
+        self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+
+
+_caches: Dict[Path, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(config: Optional[ResponseCacheConfig]) -> Optional[ResponseCache]:
+    """
+    Get the shared cache for a configuration.
+
+    Falls back to the AGENTX_LLM_CACHE_DIR environment variable when the
+    brain has no cache configuration. Brains using the same directory share one
+    ResponseCache so its size accounting stays consistent.
+
+    Args:
+        config: Cache settings from BrainConfig, or None
+
+    Returns:
+        ResponseCache, or None when caching is disabled
+    """
+    if config is None:
+        directory = os.getenv(CACHE_DIR_ENV)
+        if not directory:
+            return None
+        config = ResponseCacheConfig(directory=directory)
+    elif not config.enabled:
+        return None
+
+    path = Path(config.directory).expanduser().resolve()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = ResponseCache(config)
+            _caches[path] = cache
+        return cache
@@ -0,0 +1,188 @@
+"""
+Pluggable LLM provider layer under Brain.
+
+Brain sends every completion request through an LLMProvider. The default
+provider calls litellm. RecordingProvider wraps another provider and writes
+each request and response, including stream chunk timing, to a JSONL trace.
+ReplayProvider serves responses from such a trace without network access,
+optionally reproducing the recorded latencies, so whole teams can be
+benchmarked offline and deterministically.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Any, List, Optional, AsyncIterator, Union
+
+import litellm
+
+from .llm_cache import cache_key
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Environment variables that select a provider for every Brain, e.g. for benchmarks
+RECORD_ENV = "AGENTX_LLM_RECORD"
+REPLAY_ENV = "AGENTX_LLM_REPLAY"
+REPLAY_LATENCY_ENV = "AGENTX_LLM_REPLAY_LATENCY"
+
+def trace_key(params: Dict[str, Any]) -> str:
+    """Request key for traces. Same as the response cache key, which ignores the clock line."""
+    return cache_key(params)
+
+
+class TraceMissError(RuntimeError):
+    """Raised when a replayed request is not in the trace."""
+
+
+class LLMProvider:
+    """Sends completion requests. Same interface as `litellm.acompletion`."""
+
+    async def acompletion(self, **params) -> Any:
+        raise NotImplementedError
+
+
+class LiteLLMProvider(LLMProvider):
+    """Default provider backed by litellm."""
+
+    async def acompletion(self, **params) -> Any:
+        return await litellm.acompletion(**params)
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Plain dict form of a litellm response or chunk."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return dict(obj)
+
+
+def _stream_chunk(data: Dict[str, Any]) -> Any:
+    """Rebuild a litellm stream chunk from its recorded form."""
+    try:
+        from litellm.types.utils import ModelResponseStream
+        return ModelResponseStream(**data)
+    except ImportError:
+        return litellm.ModelResponse(stream=True, **data)
+
+
+class RecordingProvider(LLMProvider):
+    """
+    Records every request and response from another provider to a JSONL trace.
+
+    Each line holds the request key, the request itself, and either the
+    response with its latency or the stream chunks with the delay before each.
+    Streams are written once fully consumed.
+    """
+
+    def __init__(self, trace_path: Union[str, Path], provider: Optional[LLMProvider] = None):
+        self.trace_path = Path(trace_path)
+        self.provider = provider or LiteLLMProvider()
+        self._lock = threading.Lock()
+        self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def acompletion(self, **params) -> Any:
+        start = time.perf_counter()
+        response = await self.provider.acompletion(**params)
+        entry = {
+            "key": trace_key(params),
+            "request": {k: v for k, v in params.items() if k not in ("api_key", "client")},
+            "stream": bool(params.get("stream"))
+        }
+        if entry["stream"]:
+            return self._record_stream(response, entry, start)
+
+        entry["latency"] = time.perf_counter() - start
+        entry["response"] = _to_dict(response)
+        await asyncio.to_thread(self._append, entry)
+        return response
+
+    async def _record_stream(self, response: AsyncIterator, entry: Dict[str, Any], start: float):
+        chunks = []
+        last = start
+        async for chunk in response:
+            now = time.perf_counter()
+            chunks.append({"delay": now - last, "chunk": _to_dict(chunk)})
+            last = now
+            yield chunk
+        entry["chunks"] = chunks
+        await asyncio.to_thread(self._append, entry)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock, open(self.trace_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class ReplayProvider(LLMProvider):
+    """
+    Serves responses from a trace written by RecordingProvider.
+
+    Requests are matched by `trace_key`. Identical requests recorded several
+    times are replayed in recorded order; the last one is reused once they
+    run out.
+    """
+
+    def __init__(self, trace_path: Union[str, Path], reproduce_latency: bool = False):
+        self.trace_path = Path(trace_path)
+        self.reproduce_latency = reproduce_latency
+        self.entries: Dict[str, deque] = defaultdict(deque)
+        with open(self.trace_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.entries[entry["key"]].append(entry)
+        logger.info(f"Loaded {sum(len(e) for e in self.entries.values())} recorded LLM calls from {self.trace_path}")
+
+    def _next_entry(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        recorded = self.entries.get(trace_key(params))
+        if not recorded:
+            raise TraceMissError(f"No recorded response for this {params.get('model')} request in {self.trace_path}")
+        return recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+    async def acompletion(self, **params) -> Any:
+        entry = self._next_entry(params)
+        if entry["stream"]:
+            return self._replay_stream(entry["chunks"])
+
+        if self.reproduce_latency:
+            await asyncio.sleep(entry.get("latency", 0))
+        return litellm.ModelResponse(**entry["response"])
+
+    async def _replay_stream(self, chunks: List[Dict[str, Any]]):
+        for recorded in chunks:
+            if self.reproduce_latency:
+                await asyncio.sleep(recorded["delay"])
+            yield _stream_chunk(recorded["chunk"])
+
+
+_provider: Optional[LLMProvider] = None
+
+
+def set_llm_provider(provider: Optional[LLMProvider]) -> None:
+    """Route every Brain without its own provider through `provider` (None restores the default)."""
+    global _provider
+    _provider = provider
+
+
+def get_llm_provider() -> LLMProvider:
+    """
+    Get the process-wide LLM provider.
+
+    Unless one was set explicitly, AGENTX_LLM_REPLAY selects replay from a
+    trace (with AGENTX_LLM_REPLAY_LATENCY=1 to reproduce timings) and
+    AGENTX_LLM_RECORD selects recording to a trace. Otherwise litellm is used.
+    """
+    global _provider
+    if _provider is None:
+        if os.getenv(REPLAY_ENV):
+            reproduce = os.getenv(REPLAY_LATENCY_ENV, "").lower() in ("1", "true", "yes")
+            _provider = ReplayProvider(os.environ[REPLAY_ENV], reproduce_latency=reproduce)
+        elif os.getenv(RECORD_ENV):
+            _provider = RecordingProvider(os.environ[RECORD_ENV])
+        else:
+            _provider = LiteLLMProvider()
+    return _provider
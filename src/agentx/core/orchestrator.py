@@ -8,15 +8,25 @@ The orchestrator is the centralized service that provides:
 - Tool permissions and security policy management
 """
 
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, List, Tuple, Pattern
+import hashlib
 import json
+import re
+import time
+
+from pydantic import BaseModel
 
 from .brain import Brain
+from .config import RoutingRule, BrainConfig, OrchestratorConfig
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+ROUTING_ACTIONS = {"CONTINUE", "HANDOFF", "COMPLETE", "PARALLEL"}
+
+
 class Orchestrator:
     """
     Orchestrates agent coordination and tool execution in the AgentX framework.
@@ -28,6 +38,10 @@ class Orchestrator:
     - Event-driven memory synthesis
     """
     
+    # Routing decisions shared across tasks, keyed by team and routing prompt digest
+    DECISION_CACHE_SIZE = 512
+    _decision_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+    
     def __init__(
         self, 
         task: 'Task' = None, 
@@ -50,6 +64,16 @@ class Orchestrator:
         self.memory_system = memory_system
         self.routing_brain = None  # Will be initialized lazily
         
+        # Declarative handoff rules checked before the routing brain is consulted
+        self.routing_rules = self._load_routing_rules()
+        
+        # How routing decisions were made: local rules, the routing LLM, or shortcuts
+        self.routing_stats: Dict[str, int] = {"rule": 0, "cache": 0, "llm": 0, "llm_error": 0, "shortcut": 0}
+        self.routing_latencies: deque = deque(maxlen=100)  # Seconds per routing LLM call
+        
+        # Observed next-agent counts per agent, used to predict the next speaker
+        self.transition_counts: Dict[str, Dict[str, int]] = {}
+        
         if task:
             if not task.agents:
                 logger.warning(f"Task '{task.task_id}' has no agents configured yet - routing brain will be initialized later")
@@ -92,15 +116,12 @@ class Orchestrator:
         
         try:
             orchestrator_config = getattr(self.task.team_config, 'orchestrator', None)
-            if orchestrator_config and hasattr(orchestrator_config, 'brain_config'):
+            if orchestrator_config and not isinstance(orchestrator_config, dict) and hasattr(orchestrator_config, 'brain_config'):
                 # Use explicit orchestrator brain config if provided
                 logger.debug(f"Using explicit orchestrator brain config")
                 self.routing_brain = Brain.from_config(orchestrator_config.brain_config)
             else:
-                # Use the first agent's brain config for routing decisions
-                first_agent = list(self.task.agents.values())[0]
-                logger.debug(f"Using first agent '{first_agent.name}' brain config for routing")
-                self.routing_brain = Brain.from_config(first_agent.config.brain_config)
+                self.routing_brain = Brain.from_config(self._routing_brain_config(orchestrator_config))
             
             # Routing brain is mandatory for teams
             if not self.routing_brain:
@@ -112,6 +133,143 @@ class Orchestrator:
             logger.error(f"Failed to initialize routing brain: {e}")
             raise
 
+    def _routing_brain_config(self, orchestrator_config: Any) -> BrainConfig:
+        """
+        Build the low-latency routing profile.
+        
+        Takes only the first agent's model, provider and credentials, applies
+        the routing defaults (temperature 0, small max_tokens, short timeout, no
+        streaming or tools) and then any orchestrator llm_config from team.yaml.
+        The agent's cascade, failover, response cache and rate limit settings
+        are not inherited: a cascade would send routing calls to its cheap tier.
+        """
+        first_agent = list(self.task.agents.values())[0]
+        base = first_agent.config.brain_config or BrainConfig()
+        profile = OrchestratorConfig().get_default_brain_config()
+        
+        settings = {
+            "provider": base.provider,
+            "model": base.model,
+            "api_key": base.api_key,
+            "base_url": base.base_url,
+            "cascade": None,
+            "failover": None,
+            "temperature": profile.temperature,
+            "max_tokens": profile.max_tokens,
+            "timeout": profile.timeout,
+            "supports_function_calls": False,
+            "streaming": False,
+            "max_context_length": None
+        }
+        if isinstance(orchestrator_config, dict):
+            settings.update(orchestrator_config.get('llm_config') or orchestrator_config.get('brain_config') or {})
+        
+        logger.debug(f"Using routing profile based on '{first_agent.name}' brain config")
+        return BrainConfig(**settings)
+
+    def _load_routing_rules(self) -> List[Tuple[RoutingRule, Optional[Pattern]]]:
+        """Parse orchestrator.rules from the team config and compile their regexes."""
+        orchestrator_config = getattr(self.task.team_config, 'orchestrator', None) if self.task else None
+        if isinstance(orchestrator_config, dict):
+            raw_rules = orchestrator_config.get('rules') or []
+        else:
+            raw_rules = getattr(orchestrator_config, 'rules', None) if isinstance(orchestrator_config, BaseModel) else None
+        
+        rules = []
+        for raw_rule in raw_rules or []:
+            rule = raw_rule if isinstance(raw_rule, RoutingRule) else RoutingRule(**raw_rule)
+            rules.append((rule, re.compile(rule.matches) if rule.matches else None))
+        
+        if rules:
+            logger.info(f"Loaded {len(rules)} routing rules")
+        return rules
+
+    def _match_routing_rules(self, current_agent: str, last_response: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Return the decision of the first rule that matches, if any.
+        
+        Rules are checked in declaration order. Handoffs to agents that are
+        not part of the task are skipped.
+        """
+        response = last_response or ""
+        lowered = response.lower()
+        
+        for index, (rule, pattern) in enumerate(self.routing_rules):
+            if rule.after not in (None, "*", current_agent):
+                continue
+            if rule.contains is not None:
+                needles = [rule.contains] if isinstance(rule.contains, str) else rule.contains
+                if not any(needle.lower() in lowered for needle in needles):
+                    continue
+            if pattern is not None and not pattern.search(response):
+                continue
+            if rule.action == "handoff" and rule.to not in self.task.agents:
+                logger.warning(f"Routing rule {index} targets unknown agent '{rule.to}', skipping")
+                continue
+            
+            return {
+                "action": rule.action.upper(),
+                "next_agent": rule.to if rule.action == "handoff" else current_agent,
+                "reason": f"Routing rule {index} matched"
+            }
+        
+        return None
+
+    def observe_transition(self, current_agent: str, decision: Dict[str, Any]) -> None:
+        """Count which agent worked after `current_agent` for next-agent prediction."""
+        if decision["action"] == "HANDOFF":
+            next_agent = decision.get("next_agent")
+        elif decision["action"] == "CONTINUE":
+            next_agent = current_agent
+        else:
+            return
+        counts = self.transition_counts.setdefault(current_agent, {})
+        counts[next_agent] = counts.get(next_agent, 0) + 1
+
+    def predict_next_agent(self, current_agent: str, min_share: float = 0.5) -> Optional[str]:
+        """
+        Predict the agent most likely to work after `current_agent`.
+        
+        Returns None until a transition has been observed, or when no agent
+        has at least `min_share` of the observed transitions.
+        """
+        counts = self.transition_counts.get(current_agent)
+        if not counts:
+            return None
+        next_agent, count = max(counts.items(), key=lambda item: item[1])
+        return next_agent if count / sum(counts.values()) >= min_share else None
+
+    @classmethod
+    def clear_decision_cache(cls) -> None:
+        """Drop all cached routing decisions."""
+        cls._decision_cache.clear()
+
+    def get_routing_stats(self) -> Dict[str, Any]:
+        """Get counters of how routing decisions were made and routing call latency."""
+        avoided = self.routing_stats["rule"] + self.routing_stats["cache"]
+        decided = avoided + self.routing_stats["llm"]
+        latencies = list(self.routing_latencies)
+        return {
+            **self.routing_stats,
+            "llm_avoided_rate": avoided / decided if decided else 0.0,
+            "llm_latency_avg_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            "llm_latency_last_ms": latencies[-1] * 1000 if latencies else 0.0
+        }
+
+    def get_execution_setting(self, key: str, default: Any = None) -> Any:
+        """Read a setting from the team's execution config (raw YAML dict or model)."""
+        execution = getattr(self.task.team_config, 'execution', None) if self.task else None
+        if isinstance(execution, dict):
+            return execution.get(key, default)
+        if isinstance(execution, BaseModel):
+            return getattr(execution, key, default)
+        return default
+
+    @property
+    def parallel_enabled(self) -> bool:
+        """Whether the team allows fan-out of sub-goals to several agents at once."""
+        return self.get_execution_setting('mode') == 'parallel'
+
     # ============================================================================
     # AGENT ROUTING - Intelligent coordination decisions
     # ============================================================================
@@ -133,6 +291,7 @@ class Orchestrator:
         """
         # No task: complete immediately
         if not self.task:
+            self.routing_stats["shortcut"] += 1
             return {
                 "action": "COMPLETE",
                 "next_agent": context.get("current_agent", "assistant"),
@@ -141,6 +300,7 @@ class Orchestrator:
         
         # Single-agent teams: complete after response
         if len(self.task.agents) <= 1:
+            self.routing_stats["shortcut"] += 1
             return {
                 "action": "COMPLETE",
                 "next_agent": context.get("current_agent", "assistant"),
@@ -190,32 +350,61 @@ class Orchestrator:
         """
         current_agent = context.get("current_agent")
         
+        # Declarative rules decide locally without an LLM round-trip
+        rule_decision = self._match_routing_rules(current_agent, last_response)
+        if rule_decision:
+            self.routing_stats["rule"] += 1
+            logger.debug(f"Routing decided by rule: {rule_decision}")
+            return rule_decision
+        
+        # Key the cache on the prompt actually sent, which only has the start of the response
+        filtered_handoffs = self._filter_relevant_handoffs(current_agent)
+        prompt = self._build_prompt(current_agent, last_response, filtered_handoffs)
+        cache_key = self._decision_cache_key(prompt)
+        cached = self._decision_cache.get(cache_key)
+        if cached is not None:
+            self._decision_cache.move_to_end(cache_key)
+            self.routing_stats["cache"] += 1
+            return dict(cached)
+        
+        self.routing_stats["llm"] += 1
         try:
             # Ensure routing brain is initialized
             self._ensure_routing_brain()
             
-            # Get relevant handoffs for current agent
-            filtered_handoffs = self._filter_relevant_handoffs(current_agent)
-            
-            # Build prompt with all necessary context
-            prompt = self._build_prompt(current_agent, last_response, filtered_handoffs)
-            
             # Get brain decision
             if not self.routing_brain:
                 raise RuntimeError("Routing brain is None after initialization attempt")
             
+            started = time.perf_counter()
             brain_response = await self.routing_brain.generate_response(
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                json_mode=True
             )
+            latency = time.perf_counter() - started
+            self.routing_latencies.append(latency)
+            logger.debug(f"Routing call took {latency * 1000:.0f}ms")
             
-            decision = json.loads(brain_response.content)
-            return {
-                "action": decision.get("action", "CONTINUE"),
-                "next_agent": decision.get("next_agent", current_agent),
-                "reason": "Brain handoff decision"
-            }
+            decision = self._parse_decision(brain_response.content)
+            if decision["action"] == "PARALLEL":
+                result = self._parallel_decision(decision, current_agent)
+            else:
+                next_agent = decision.get("next_agent") or current_agent
+                if decision["action"] == "HANDOFF" and next_agent not in self.task.agents:
+                    raise ValueError(f"Routing brain chose unknown agent '{next_agent}'")
+                result = {
+                    "action": decision["action"],
+                    "next_agent": next_agent,
+                    "reason": "Brain handoff decision"
+                }
+            
+            self._decision_cache[cache_key] = dict(result)
+            if len(self._decision_cache) > self.DECISION_CACHE_SIZE:
+                self._decision_cache.popitem(last=False)
+            return result
             
         except Exception as e:
+            self.routing_stats["llm_error"] += 1
             logger.error(f"Handoff determination failed: {e}")
             return {
                 "action": "CONTINUE",
@@ -223,6 +412,74 @@ class Orchestrator:
                 "reason": f"Error fallback: {e}"
             }
     
+    def _decision_cache_key(self, prompt: str) -> Tuple:
+        """Key a routing decision by team and a digest of the routing prompt.
+        
+        The prompt names the current agent, the available agents and whether
+        parallel dispatch is offered, so those are covered by the digest.
+        """
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return (getattr(self.task.team_config, 'name', None), digest)
+    
+    @staticmethod
+    def _parse_decision(content: Optional[str]) -> Dict[str, Any]:
+        """
+        Parse the routing brain's JSON decision.
+        
+        Tolerates text or code fences around the JSON object, as returned by
+        providers without a JSON mode.
+        """
+        if not content:
+            raise ValueError("Empty routing response")
+        
+        try:
+            decision = json.loads(content)
+        except json.JSONDecodeError:
+            match = re.search(r"\{.*\}", content, re.DOTALL)
+            if not match:
+                raise ValueError(f"No JSON object in routing response: {content[:100]}")
+            decision = json.loads(match.group(0))
+        
+        if not isinstance(decision, dict):
+            raise ValueError("Routing response is not a JSON object")
+        
+        decision["action"] = str(decision.get("action", "CONTINUE")).upper()
+        if decision["action"] not in ROUTING_ACTIONS:
+            raise ValueError(f"Unknown routing action '{decision['action']}'")
+        return decision
+    
+    def _parallel_decision(self, decision: Dict[str, Any], current_agent: str) -> Dict[str, Any]:
+        """
+        Validate a PARALLEL decision from the routing brain.
+        
+        Branches naming unknown agents are dropped. Without parallel mode or
+        without any valid branch, the current agent continues instead.
+        """
+        branches = [
+            {"agent": branch["agent"], "goal": str(branch.get("goal", ""))}
+            for branch in decision.get("branches") or []
+            if isinstance(branch, dict) and branch.get("agent") in self.task.agents
+        ]
+        
+        if not self.parallel_enabled or not branches:
+            return {
+                "action": "CONTINUE",
+                "next_agent": current_agent,
+                "reason": "Parallel dispatch unavailable"
+            }
+        
+        # The merge agent continues once all branches are back
+        next_agent = decision.get("next_agent")
+        if next_agent not in self.task.agents:
+            next_agent = current_agent
+        
+        return {
+            "action": "PARALLEL",
+            "next_agent": next_agent,
+            "branches": branches,
+            "reason": "Brain parallel dispatch decision"
+        }
+    
     def _filter_relevant_handoffs(self, current_agent: str) -> List[str]:
         """
         Filter handoffs relevant to the current agent.
@@ -250,10 +507,17 @@ Based on the current agent's response, decide:
 - CONTINUE: Keep working with {current_agent}
 - HANDOFF: Switch to another agent (specify which one)
 - COMPLETE: Task is finished
+"""
+        if not self.parallel_enabled:
+            return prompt + """
+Return JSON: {"action": "CONTINUE|HANDOFF|COMPLETE", "next_agent": "agent_name"}
+"""
+        
+        return prompt + """- PARALLEL: Split the remaining work into independent sub-goals that several agents work on at the same time
 
-Return JSON: {{"action": "CONTINUE|HANDOFF|COMPLETE", "next_agent": "agent_name"}}
+Return JSON: {"action": "CONTINUE|HANDOFF|COMPLETE|PARALLEL", "next_agent": "agent_name"}
+For PARALLEL also include "branches": [{"agent": "agent_name", "goal": "sub-goal"}], and use next_agent for the agent that merges the results.
 """
-        return prompt
 
 
 
@@ -0,0 +1,315 @@
+"""
+Process-wide rate limiting and adaptive concurrency for LLM calls.
+
+Every Brain in the process shares one RateLimiter. Requests to the same
+provider or model draw from the same token buckets (requests and estimated
+tokens per minute) and the same concurrency limit. The concurrency limit
+adapts AIMD-style: it grows by about one slot per round of successful calls
+and is cut when the provider answers 429 or responses slow down sharply.
+Callers queue instead of receiving rate limit errors, and the time spent
+queueing is reported in the limiter stats.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from .config import RateLimitConfig
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_request_tokens(call_params: Dict[str, Any]) -> int:
+    """Rough token count for a request: prompt characters / 4 plus the completion budget."""
+    prompt = json.dumps(call_params.get("messages") or [], default=str)
+    if call_params.get("tools"):
+        prompt += json.dumps(call_params["tools"], default=str)
+    return len(prompt) // 4 + (call_params.get("max_tokens") or 0)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception is the provider saying 429 Too Many Requests."""
+    return getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError"
+
+
+# Transient failures worth retrying; anything else (bad request, auth) will fail again
+_RETRYABLE_ERRORS = {
+    "RateLimitError", "Timeout", "APITimeoutError", "TimeoutError", "APIConnectionError",
+    "ServiceUnavailableError", "InternalServerError", "ConnectionError"
+}
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Whether an LLM call failure is transient: 429, 5xx, timeouts and connection errors."""
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int) and (status == 429 or status >= 500):
+        return True
+    return isinstance(error, (asyncio.TimeoutError, ConnectionError)) or type(error).__name__ in _RETRYABLE_ERRORS
+
+
+class TokenBucket:
+    """
+    Per-minute token bucket that hands out reservations.
+
+    A reservation may drive the balance negative; the caller then waits until
+    the bucket has refilled past its place in line. This keeps callers in
+    arrival order without holding a lock while they wait.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` tokens and return the seconds to wait before using them."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return max(0.0, -self.tokens / self.rate)
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens, e.g. when a request used fewer than estimated."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class LimiterState:
+    """Buckets, concurrency window and stats for one provider or model."""
+
+    def __init__(self, name: str, config: RateLimitConfig):
+        self.name = name
+        self.config = config
+        self.requests = TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        self.tokens = TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        self.limit = float(config.initial_concurrency)
+        self.in_flight = 0
+        self.waiters: deque = deque()
+        self.epoch = 0  # Bumped on every decrease so one overload only cuts the limit once
+        # Decaying minimum latency per kind: "first_byte" (streaming) or "per_token" (complete responses)
+        self.latency_baselines: Dict[str, float] = {}
+        self.stats = {
+            "requests": 0,
+            "rate_limited": 0,
+            "latency_backoffs": 0,
+            "queued": 0,
+            "queue_wait_seconds": 0.0,
+            "max_queue_wait_seconds": 0.0
+        }
+
+    def has_capacity(self) -> bool:
+        return self.in_flight < max(1, int(self.limit))
+
+    def wake_waiters(self) -> None:
+        while self.waiters and self.has_capacity():
+            waiter = self.waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                waiter.set_result(None)
+            except RuntimeError:
+                continue  # Its event loop has closed
+            self.in_flight += 1
+
+    def increase(self) -> None:
+        """Additive increase: about one extra slot per `limit` successful calls."""
+        self.limit = min(self.config.max_concurrency, self.limit + 1.0 / self.limit)
+        self.wake_waiters()
+
+    def decrease(self, factor: float, epoch: int) -> bool:
+        """Multiplicative decrease, once per epoch."""
+        if epoch != self.epoch:
+            return False
+        self.limit = max(self.config.min_concurrency, self.limit * factor)
+        self.epoch += 1
+        return True
+
+
+class Permit:
+    """
+    A granted request slot. Release it exactly once when the call is over.
+
+    Call `responded()` when the provider starts answering so the latency
+    signal covers time to first response rather than generation length.
+    For a complete (non-streaming) response, pass its output tokens so the
+    latency is measured per token.
+    """
+
+    def __init__(self, limiter: "RateLimiter", state: LimiterState, estimated_tokens: int):
+        self.limiter = limiter
+        self.state = state
+        self.estimated_tokens = estimated_tokens
+        self.epoch = state.epoch
+        self.started = time.monotonic()
+        self.latency: Optional[float] = None
+        self.latency_kind = "first_byte"
+        self.released = False
+
+    def responded(self, output_tokens: Optional[int] = None) -> None:
+        if self.latency is None:
+            self.latency = time.monotonic() - self.started
+            if output_tokens:
+                self.latency /= output_tokens
+                self.latency_kind = "per_token"
+
+    def record_usage(self, total_tokens: Any) -> None:
+        """Give back estimated tokens the request did not use."""
+        if self.state.tokens and isinstance(total_tokens, int) and total_tokens < self.estimated_tokens:
+            self.state.tokens.refund(self.estimated_tokens - total_tokens)
+            self.estimated_tokens = total_tokens
+
+    def release(self, error: Optional[BaseException] = None) -> None:
+        if not self.released:
+            self.released = True
+            self.limiter._release(self, error)
+
+
+class RateLimiter:
+    """
+    Shared limiter for all LLM calls in the process.
+
+    Limits are configured per provider (e.g. "deepseek") or per model
+    (e.g. "deepseek/deepseek-chat"); a model setting wins over its
+    provider's. Requests to names without a setting use the defaults.
+    """
+
+    def __init__(self, default: Optional[RateLimitConfig] = None):
+        self.default = default or RateLimitConfig()
+        self._configs: Dict[str, RateLimitConfig] = {}
+        self._states: Dict[str, LimiterState] = {}
+
+    def configure(self, name: str, config: RateLimitConfig) -> None:
+        """Set the limits for a provider or model, replacing any current state."""
+        if self._configs.get(name) == config:
+            return
+        self._configs[name] = config
+        self._states.pop(name, None)
+
+    def set_default(self, config: RateLimitConfig) -> None:
+        """Set the limits for providers and models without their own setting."""
+        self.default = config
+        for name in [n for n in self._states if n not in self._configs]:
+            del self._states[name]
+
+    def _state_for(self, model: str) -> LimiterState:
+        provider = model.split("/", 1)[0] if "/" in model else None
+        name = model if model in self._configs or provider not in self._configs else provider
+        state = self._states.get(name)
+        if state is None:
+            state = LimiterState(name, self._configs.get(name, self.default))
+            self._states[name] = state
+        return state
+
+    async def acquire(self, call_params: Dict[str, Any]) -> Permit:
+        """
+        Wait for a request slot.
+
+        Args:
+            call_params: The completion request about to be sent
+
+        Returns:
+            Permit to release once the call has finished
+        """
+        state = self._state_for(call_params.get("model") or "default")
+        estimated = estimate_request_tokens(call_params)
+        start = time.monotonic()
+
+        delay = 0.0
+        if state.requests:
+            delay = state.requests.reserve(1)
+        if state.tokens:
+            delay = max(delay, state.tokens.reserve(estimated))
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            if state.has_capacity() and not state.waiters:
+                state.in_flight += 1
+            else:
+                waiter = asyncio.get_running_loop().create_future()
+                state.waiters.append(waiter)
+                try:
+                    await waiter
+                except asyncio.CancelledError:
+                    if waiter in state.waiters:
+                        state.waiters.remove(waiter)
+                    elif waiter.done() and not waiter.cancelled():
+                        # Granted just as we were cancelled: pass the slot on
+                        state.in_flight -= 1
+                        state.wake_waiters()
+                    raise
+        except asyncio.CancelledError:
+            if state.requests:
+                state.requests.refund(1)
+            if state.tokens:
+                state.tokens.refund(estimated)
+            raise
+
+        waited = time.monotonic() - start
+        state.stats["requests"] += 1
+        if waited > 0.001:
+            state.stats["queued"] += 1
+        state.stats["queue_wait_seconds"] += waited
+        state.stats["max_queue_wait_seconds"] = max(state.stats["max_queue_wait_seconds"], waited)
+        return Permit(self, state, estimated)
+
+    def _release(self, permit: Permit, error: Optional[BaseException]) -> None:
+        state = permit.state
+        state.in_flight -= 1
+        config = state.config
+
+        if error is not None and is_rate_limit_error(error):
+            state.stats["rate_limited"] += 1
+            if state.decrease(config.backoff_factor, permit.epoch):
+                logger.warning(f"Rate limited by '{state.name}', concurrency limit now {state.limit:.1f}")
+        elif error is None and config.latency_tolerance is None:
+            state.increase()
+        elif error is None and permit.latency is not None:
+            latency = permit.latency
+            baseline = state.latency_baselines.get(permit.latency_kind, latency)
+            if latency > baseline * config.latency_tolerance:
+                if state.decrease(config.latency_backoff_factor, permit.epoch):
+                    state.stats["latency_backoffs"] += 1
+            else:
+                state.increase()
+            # Drift up toward recent latencies so one unusually fast call does not set the bar forever
+            if latency < baseline:
+                baseline = latency
+            else:
+                baseline += (latency - baseline) * config.latency_baseline_decay
+            state.latency_baselines[permit.latency_kind] = baseline
+        state.wake_waiters()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per provider/model request counts, 429s, queue wait and current concurrency limit."""
+        stats = {}
+        for name, state in self._states.items():
+            requests = state.stats["requests"]
+            stats[name] = {
+                **state.stats,
+                "avg_queue_wait_seconds": state.stats["queue_wait_seconds"] / requests if requests else 0.0,
+                "concurrency_limit": round(state.limit, 2),
+                "in_flight": state.in_flight,
+                "waiting": len(state.waiters)
+            }
+        return stats
+
+
+_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter."""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter()
+    return _limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Replace the process-wide rate limiter (None creates a fresh default one on next use)."""
+    global _limiter
+    _limiter = limiter
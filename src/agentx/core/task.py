@@ -22,11 +22,12 @@ from .agent import Agent
 from .orchestrator import Orchestrator
 from .brain import Brain
 from .message import TaskStep, TextPart, ToolCallPart, ToolResultPart, Artifact
+from .event import ParallelExecutionStartEvent, ParallelExecutionSyncEvent
 from .tool import ToolCall
 from .config import TeamConfig, AgentConfig, BrainConfig
-from ..config.team_loader import load_team_config
+from .journal import TaskJournal
+from .template import get_team_template
 from ..config.agent_loader import load_agents_config
-from ..config.prompt_loader import PromptLoader
 from ..utils.logger import get_logger, setup_clean_chat_logging
 from ..utils.id import generate_short_id
 from ..tool.manager import ToolManager
@@ -34,6 +35,47 @@ from ..tool.manager import ToolManager
 logger = get_logger(__name__)
 
 
+def _step_to_messages(step: TaskStep) -> List[Dict[str, Any]]:
+    """Convert a single task step to conversation messages for agents."""
+    messages = []
+    
+    if step.agent_name == "user":
+        # User messages
+        for part in step.parts:
+            if isinstance(part, TextPart):
+                messages.append({
+                    "role": "user",
+                    "content": part.text
+                })
+    elif step.agent_name == "system":
+        # Tool results
+        for part in step.parts:
+            if isinstance(part, ToolResultPart):
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": part.tool_call_id,
+                    "name": part.tool_name,
+                    "content": json.dumps({
+                        "success": not part.is_error,
+                        "result": part.result
+                    })
+                })
+    else:
+        # Agent messages
+        for part in step.parts:
+            if isinstance(part, TextPart):
+                messages.append({
+                    "role": "assistant",
+                    "content": part.text
+                })
+            elif isinstance(part, ToolCallPart):
+                # This would be part of an assistant message with tool calls
+                # We'll handle this in a more sophisticated way if needed
+                pass
+    
+    return messages
+
+
 class Task:
     """
     Pure data container for task state and context.
@@ -64,8 +106,15 @@ class Task:
         # Agent storage (will be populated by TaskExecutor)
         self.agents: Dict[str, Agent] = {}
         
+        # Conversation messages derived from history, appended step by step
+        self._messages: List[Dict[str, Any]] = []
+        self._synced_steps: int = 0
+        self._last_synced_step: Optional[TaskStep] = None
+        
+        # Append-only event journal (set by TaskExecutor when storage is available)
+        self.journal: Optional[TaskJournal] = None
+        
         # Setup workspace
-        self.workspace_dir.mkdir(parents=True, exist_ok=True)
         self._setup_workspace()
         
         logger.info(f"🎯 Task {self.task_id} initialized")
@@ -99,8 +148,35 @@ class Task:
         }
     
     def add_step(self, step: TaskStep) -> None:
-        """Add step to task history."""
+        """Add step to task history and extend the cached message log."""
         self.history.append(step)
+        self._sync_messages()
+        if self.journal:
+            self.journal.record("step", step.model_dump(mode="json"))
+    
+    def get_messages(self) -> List[Dict[str, Any]]:
+        """
+        Get the conversation messages for the task history.
+        
+        Each step is converted once and cached, so a turn only pays for the
+        steps added since the previous call. The returned list is shared;
+        callers must copy it before mutating.
+        """
+        self._sync_messages()
+        return self._messages
+    
+    def _sync_messages(self) -> None:
+        """Convert history steps that are not yet in the message log."""
+        synced = self._synced_steps
+        if synced and (len(self.history) < synced or self.history[synced - 1] is not self._last_synced_step):
+            # History was rewritten outside add_step - rebuild from scratch
+            self._messages = []
+            self._synced_steps = 0
+        
+        for step in self.history[self._synced_steps:]:
+            self._messages.extend(_step_to_messages(step))
+        self._synced_steps = len(self.history)
+        self._last_synced_step = self.history[-1] if self.history else None
     
     def set_current_agent(self, agent_name: str) -> None:
         """Set current agent."""
@@ -121,6 +197,8 @@ class Task:
             "metadata": metadata or {},
             "created_at": datetime.now()
         }
+        if self.journal:
+            self.journal.record("artifact", {"name": name, **self.artifacts[name]})
         logger.info(f"📄 Task {self.task_id} added artifact '{name}'")
     
     def _generate_task_id(self) -> str:
@@ -128,10 +206,13 @@ class Task:
         return generate_short_id()
     
     def _setup_workspace(self) -> None:
-        """Setup task workspace directories."""
-        (self.workspace_dir / "artifacts").mkdir(exist_ok=True)
-        (self.workspace_dir / "logs").mkdir(exist_ok=True)
-        (self.workspace_dir / "temp").mkdir(exist_ok=True)
+        """
+        Setup task workspace directories.
+        
+        Only the workspace root is created up front; storage creates the
+        artifacts repository and other subdirectories on first write.
+        """
+        self.workspace_dir.mkdir(parents=True, exist_ok=True)
 
 
 class TaskExecutor:
@@ -146,21 +227,34 @@ class TaskExecutor:
     
     def __init__(self, config_path: str, task_id: str = None, workspace_dir: Path = None):
         """Initialize TaskExecutor with config path and setup all systems."""
-        # Load team configuration
+        # Compiled team config and agent definitions, shared across tasks
         self.config_path = Path(config_path)
+        self.template = get_team_template(self.config_path)
         self.task = Task(
-            team_config=load_team_config(self.config_path),
+            team_config=self.template.team_config,
             config_dir=self.config_path.parent,
             task_id=task_id,
             workspace_dir=workspace_dir
         )
         
+        # Duration of the most recent turn setup (prompt + message log), in seconds
+        self.last_turn_setup_time: float = 0.0
+        
+        # Speculative next-agent turns (see _start_speculative_turn)
+        self.speculation_stats: Dict[str, Any] = {"attempts": 0, "hits": 0, "misses": 0, "latency_saved": 0.0}
+        
         # Create task-level tool manager (unified registry + executor)
-        self.tool_manager = ToolManager(task_id=self.task.task_id)
+        self.tool_manager = ToolManager(task_id=self.task.task_id, config=self.template.tools_config)
         
         # Initialize all systems (except orchestrator)
         self._initialize_systems()
         
+        # Journal task events into the workspace so the task can be resumed
+        self.journal = TaskJournal(self.storage.file_storage) if self.storage else None
+        self.task.journal = self.journal
+        # Last routing decision journaled; it is applied to the task only after state is saved
+        self._last_routing: Optional[Dict[str, Any]] = None
+        
         # Register task-specific tools AFTER systems are initialized
         self._register_tools()
         
@@ -174,6 +268,26 @@ class TaskExecutor:
         setup_clean_chat_logging()
         
         logger.info(f"✅ TaskExecutor initialized for task {self.task.task_id}")
+    
+    @classmethod
+    async def create(cls, config_path: str, task_id: str = None, workspace_dir: Path = None) -> 'TaskExecutor':
+        """
+        Create a TaskExecutor without blocking the event loop.
+        
+        Construction touches the filesystem (config stat/parse, workspace
+        directories, tool registration), so it runs in a worker thread. Use
+        this instead of the constructor from async code such as the server
+        or the benchmark, where many tasks start concurrently.
+        
+        Args:
+            config_path: Path to team configuration file
+            task_id: Optional task ID (generated if omitted)
+            workspace_dir: Optional workspace directory
+        
+        Returns:
+            Initialized TaskExecutor
+        """
+        return await asyncio.to_thread(cls, config_path, task_id, workspace_dir)
 
     def _initialize_systems(self):
         """Initialize storage, search, memory systems."""
@@ -255,63 +369,8 @@ class TaskExecutor:
             return None
     
     def _create_agents(self):
-        """Create agent instances from team config with task-level tool manager."""
-        # Initialize prompt loader if prompts directory exists
-        prompt_loader = None
-        prompts_dir = self.config_path.parent / "prompts"
-        if prompts_dir.exists():
-            try:
-                prompt_loader = PromptLoader(str(prompts_dir))
-            except Exception as e:
-                logger.warning(f"Could not initialize prompt loader: {e}")
-        
-        for agent_data in self.task.team_config.agents:
-            # Convert raw agent data to AgentConfig
-            name = agent_data.get('name')
-            if not name:
-                raise ValueError("Agent must have a 'name' field")
-            
-            # Load prompt template
-            prompt_template = None
-            prompt_file = agent_data.get('prompt_template')
-            
-            if prompt_file and prompt_loader:
-                try:
-                    # Strip "prompts/" prefix if present
-                    prompt_filename = prompt_file
-                    if prompt_filename.startswith("prompts/"):
-                        prompt_filename = prompt_filename[8:]
-                    
-                    prompt_template = prompt_loader.load_prompt(prompt_filename)
-                except Exception as e:
-                    logger.warning(f"Could not load prompt file {prompt_file}: {e}")
-            
-            if not prompt_template:
-                prompt_template = agent_data.get('system_message', f"You are a helpful AI assistant named {name}.")
-            
-            # Create brain config from llm_config
-            brain_config = None
-            if 'llm_config' in agent_data:
-                llm_config = agent_data['llm_config']
-                brain_config = BrainConfig(
-                    provider=llm_config.get('provider', 'deepseek'),
-                    model=llm_config.get('model', 'deepseek-chat'),
-                    temperature=llm_config.get('temperature', 0.7),
-                    max_tokens=llm_config.get('max_tokens', 4000),
-                    api_key=llm_config.get('api_key'),
-                    base_url=llm_config.get('base_url'),
-                    supports_function_calls=llm_config.get('supports_function_calls', True)
-                )
-            
-            # Create AgentConfig
-            agent_config = AgentConfig(
-                name=name,
-                description=agent_data.get('description', f"AI assistant named {name}"),
-                prompt_template=prompt_template,
-                tools=agent_data.get('tools', []),
-                brain_config=brain_config
-            )
-            
+        """Create agent instances from the compiled team template with task-level tool manager."""
+        for agent_config in self.template.agent_configs.values():
             # Create agent with tool manager
             agent = Agent(agent_config, tool_manager=self.tool_manager)
             self.task.agents[agent_config.name] = agent
@@ -320,6 +379,10 @@ class TaskExecutor:
         logger.info(f"🎯 Created {len(self.task.agents)} agents")
     
     # Properties to access task state (clean interface)
+    @property
+    def task_id(self) -> str:
+        return self.task.task_id
+    
     @property
     def is_complete(self) -> bool:
         return self.task.is_complete
@@ -402,6 +465,9 @@ class TaskExecutor:
             initial_agent_name = list(self.task.agents.keys())[0]
             self.task.set_current_agent(initial_agent_name)
         
+        if self.journal:
+            self.journal.record("start", {"initial_prompt": prompt, "current_agent": self.task.current_agent})
+        
         # Add the initial prompt as a user message to the conversation history
         if prompt:
             from datetime import datetime
@@ -450,52 +516,176 @@ class TaskExecutor:
             # Get routing decision
             context = self.task.get_context()
             routing_decision = await self.orchestrator.decide_next_step(context, response)
+            self._record_routing(routing_decision)
+            await self._save_state_async()
             
             if routing_decision["action"] == "COMPLETE":
                 self.task.complete_task()
                 break
             elif routing_decision["action"] == "HANDOFF":
                 self.task.set_current_agent(routing_decision["next_agent"])
+            elif routing_decision["action"] == "PARALLEL":
+                async for _ in self._run_parallel_branches(routing_decision):
+                    pass
     
     async def _stream_execute(self):
         """Execute the task with streaming."""
-        while not self.task.is_complete and self.task.round_count < self.task.max_rounds:
-            if self.task.is_paused:
-                break
+        speculation = None
+        try:
+            while not self.task.is_complete and self.task.round_count < self.task.max_rounds:
+                if self.task.is_paused:
+                    break
+                    
+                self.task.round_count += 1
                 
-            self.task.round_count += 1
-            
-            # Stream current agent turn
-            response_chunks = []
-            async for chunk in self._stream_agent_turn():
-                response_chunks.append(chunk)
-                yield chunk
-            
-            # Orchestrator makes routing decisions
-            full_response = "".join(chunk.get("content", "") for chunk in response_chunks if chunk.get("type") == "content")
-            context = self.task.get_context()
-            routing_decision = await self._orchestrator.decide_next_step(context, full_response)
-            
-            # Yield routing decision
-            yield {
-                "type": "routing_decision",
-                "action": routing_decision["action"],
-                "current_agent": self.task.current_agent,
-                "next_agent": routing_decision.get("next_agent"),
-                "reason": routing_decision.get("reason", "")
-            }
-            
-            if routing_decision["action"] == "COMPLETE":
-                self.task.complete_task()
-                break
-            elif routing_decision["action"] == "HANDOFF":
-                old_agent = self.task.current_agent
-                self.task.set_current_agent(routing_decision["next_agent"])
+                # Stream current agent turn, or commit the speculative one
+                response_chunks = []
+                if speculation is not None:
+                    turn = self._commit_speculative_turn(speculation)
+                    speculation = None
+                else:
+                    turn = self._stream_agent_turn()
+                async for chunk in turn:
+                    response_chunks.append(chunk)
+                    yield chunk
+                
+                # Orchestrator makes routing decisions, optionally overlapped
+                # with a speculative turn of the most likely next agent
+                full_response = "".join(chunk.get("content", "") for chunk in response_chunks if chunk.get("type") == "content")
+                context = self.task.get_context()
+                speculation = self._start_speculative_turn()
+                routing_decision = await self._orchestrator.decide_next_step(context, full_response)
+                if speculation is not None:
+                    speculation["routed_at"] = time.perf_counter()
+                self._record_routing(routing_decision)
+                await self._save_state_async()
+                
+                # Yield routing decision
                 yield {
-                    "type": "handoff",
-                    "from_agent": old_agent,
-                    "to_agent": routing_decision["next_agent"]
+                    "type": "routing_decision",
+                    "action": routing_decision["action"],
+                    "current_agent": self.task.current_agent,
+                    "next_agent": routing_decision.get("next_agent"),
+                    "reason": routing_decision.get("reason", "")
                 }
+                
+                if speculation is not None and not self._speculation_hit(speculation, routing_decision):
+                    await self._cancel_speculative_turn(speculation)
+                    speculation = None
+                
+                if routing_decision["action"] == "COMPLETE":
+                    self.task.complete_task()
+                    break
+                elif routing_decision["action"] == "HANDOFF":
+                    old_agent = self.task.current_agent
+                    self.task.set_current_agent(routing_decision["next_agent"])
+                    yield {
+                        "type": "handoff",
+                        "from_agent": old_agent,
+                        "to_agent": routing_decision["next_agent"]
+                    }
+                elif routing_decision["action"] == "PARALLEL":
+                    async for event in self._run_parallel_branches(routing_decision):
+                        yield event
+        finally:
+            if speculation is not None:
+                await self._cancel_speculative_turn(speculation)
+    
+    def _start_speculative_turn(self) -> Optional[Dict[str, Any]]:
+        """
+        Start the predicted next agent's turn while routing is decided.
+        
+        Opt-in via ``execution.speculative``. The prediction comes from the
+        orchestrator's handoff statistics. Agents with tools are never run
+        speculatively because tool side effects cannot be rolled back.
+        
+        Returns:
+            Speculation state, or None when nothing was started
+        """
+        if not self.orchestrator.get_execution_setting("speculative", False):
+            return None
+        if self.task.round_count >= self.task.max_rounds:
+            return None
+        
+        predicted = self.orchestrator.predict_next_agent(self.task.current_agent)
+        if predicted not in self.task.agents or self.task.agents[predicted].tools:
+            return None
+        
+        agent = self.task.get_agent(predicted)
+        context = {**self.task.get_context(), "round_count": self.task.round_count + 1, "current_agent": predicted}
+        system_prompt = agent.build_system_prompt(context)
+        turn_context = agent.build_turn_context(context)
+        messages = list(self.task.get_messages())
+        speculation = {"agent": predicted, "started_at": time.perf_counter(), "finished_at": None}
+        
+        async def run():
+            try:
+                return await agent.generate_response(
+                    messages=messages,
+                    system_prompt=system_prompt,
+                    orchestrator=self.orchestrator,
+                    turn_context=turn_context
+                )
+            finally:
+                speculation["finished_at"] = time.perf_counter()
+        
+        speculation["task"] = asyncio.create_task(run())
+        self.speculation_stats["attempts"] += 1
+        logger.debug(f"Speculatively started turn for '{predicted}'")
+        return speculation
+    
+    def _speculation_hit(self, speculation: Dict[str, Any], routing_decision: Dict[str, Any]) -> bool:
+        """Whether the routing decision selected the speculated agent for a normal next turn."""
+        if self.task.is_paused or self.task.round_count >= self.task.max_rounds:
+            return False
+        if routing_decision["action"] == "HANDOFF":
+            return routing_decision.get("next_agent") == speculation["agent"]
+        if routing_decision["action"] == "CONTINUE":
+            return self.task.current_agent == speculation["agent"]
+        return False
+    
+    async def _commit_speculative_turn(self, speculation: Dict[str, Any]):
+        """Use the speculative turn's response as the current agent turn, or run the turn again if it failed."""
+        try:
+            final_response = await speculation["task"]
+        except Exception as e:
+            self.speculation_stats["misses"] += 1
+            logger.warning(f"Speculative turn for '{speculation['agent']}' failed, running it normally: {e}")
+            async for chunk in self._stream_agent_turn():
+                yield chunk
+            return
+        
+        # Latency saved is the part of the turn that overlapped routing
+        overlap_end = min(speculation["routed_at"], speculation["finished_at"])
+        self.speculation_stats["hits"] += 1
+        self.speculation_stats["latency_saved"] += max(0.0, overlap_end - speculation["started_at"])
+        
+        yield {"type": "content", "content": final_response}
+        if final_response:
+            self.task.add_step(TaskStep(
+                agent_name=self.task.current_agent,
+                parts=[TextPart(text=final_response)]
+            ))
+    
+    async def _cancel_speculative_turn(self, speculation: Dict[str, Any]) -> None:
+        """Cancel a speculative turn whose prediction did not come true."""
+        self.speculation_stats["misses"] += 1
+        speculation["task"].cancel()
+        try:
+            await speculation["task"]
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Cancelled speculative turn failed: {e}")
+        logger.debug(f"Discarded speculative turn for '{speculation['agent']}'")
+    
+    def get_speculation_stats(self) -> Dict[str, Any]:
+        """Get speculative execution hit rate and latency saved."""
+        attempts = self.speculation_stats["attempts"]
+        return {
+            **self.speculation_stats,
+            "hit_rate": self.speculation_stats["hits"] / attempts if attempts else 0.0
+        }
 
     async def _step(self, user_input: str = None) -> Dict[str, Any]:
         """Execute one step - simple flow control."""
@@ -524,6 +714,8 @@ class TaskExecutor:
         # Get routing decision
         context = self.task.get_context()
         routing_decision = await self.orchestrator.decide_next_step(context, response)
+        self._record_routing(routing_decision)
+        await self._save_state_async()
         
         result = {
             "status": "continue",
@@ -542,6 +734,11 @@ class TaskExecutor:
             old_agent = self.task.current_agent
             self.task.set_current_agent(routing_decision["next_agent"])
             result["handoff"] = {"from": old_agent, "to": routing_decision["next_agent"]}
+        elif routing_decision["action"] == "PARALLEL":
+            result["parallel"] = [
+                event async for event in self._run_parallel_branches(routing_decision)
+                if event.get("type") == "parallel_branch_result"
+            ]
         
         return result
     
@@ -578,6 +775,8 @@ class TaskExecutor:
         full_response = "".join(chunk.get("content", "") for chunk in response_chunks if chunk.get("type") == "content")
         context = self.task.get_context()
         routing_decision = await self.orchestrator.decide_next_step(context, full_response)
+        self._record_routing(routing_decision)
+        await self._save_state_async()
         
         # Yield routing decision
         yield {
@@ -598,22 +797,40 @@ class TaskExecutor:
                 "from_agent": old_agent,
                 "to_agent": routing_decision["next_agent"]
             }
+        elif routing_decision["action"] == "PARALLEL":
+            async for event in self._run_parallel_branches(routing_decision):
+                yield event
 
-    async def _execute_agent_turn(self) -> str:
-        """Execute current agent turn - simple coordination."""
+    def _prepare_turn(self):
+        """Resolve the current agent and build its system prompt, turn context and messages."""
+        setup_start = time.perf_counter()
+        
         # Get agent and context from task
         agent = self.task.get_agent(self.task.current_agent)
         context = self.task.get_context()
         system_prompt = agent.build_system_prompt(context)
+        turn_context = agent.build_turn_context(context)
         
         # Get conversation history
         messages = self._convert_history_to_messages()
         
+        self.last_turn_setup_time = time.perf_counter() - setup_start
+        logger.debug(
+            f"Turn setup for '{agent.name}' took {self.last_turn_setup_time * 1000:.2f}ms "
+            f"({len(messages)} messages)"
+        )
+        return agent, system_prompt, turn_context, messages
+
+    async def _execute_agent_turn(self) -> str:
+        """Execute current agent turn - simple coordination."""
+        agent, system_prompt, turn_context, messages = self._prepare_turn()
+        
         # Agent executes with injected tool manager
         final_response = await agent.generate_response(
             messages=messages,
             system_prompt=system_prompt,
-            orchestrator=self.orchestrator
+            orchestrator=self.orchestrator,
+            turn_context=turn_context
         )
         
         # Add response to task history
@@ -626,13 +843,7 @@ class TaskExecutor:
 
     async def _stream_agent_turn(self):
         """Stream current agent turn - simple coordination."""
-        # Get agent and context from task
-        agent = self.task.get_agent(self.task.current_agent)
-        context = self.task.get_context()
-        system_prompt = agent.build_system_prompt(context)
-        
-        # Get conversation history
-        messages = self._convert_history_to_messages()
+        agent, system_prompt, turn_context, messages = self._prepare_turn()
         
         # Check if agent brain has streaming disabled
         if hasattr(agent.brain.config, 'streaming') and not agent.brain.config.streaming:
@@ -641,7 +852,8 @@ class TaskExecutor:
             final_response = await agent.generate_response(
                 messages=messages,
                 system_prompt=system_prompt,
-                orchestrator=self.orchestrator
+                orchestrator=self.orchestrator,
+                turn_context=turn_context
             )
             
             # Yield the complete response as a single chunk
@@ -659,7 +871,8 @@ class TaskExecutor:
             async for chunk in agent.stream_response(
                 messages=messages,
                 system_prompt=system_prompt,
-                orchestrator=self.orchestrator
+                orchestrator=self.orchestrator,
+                turn_context=turn_context
             ):
                 # Handle different chunk types
                 if isinstance(chunk, dict):
@@ -680,6 +893,107 @@ class TaskExecutor:
                     parts=[TextPart(text=final_response)]
                 ))
 
+    async def _run_parallel_branches(self, routing_decision: Dict[str, Any]):
+        """
+        Fan sub-goals out to several agents and merge the results.
+        
+        Every branch sees the same snapshot of the conversation plus its own
+        sub-goal, so branches cannot observe each other. At most
+        ``execution.max_parallel_agents`` branches run at once. Results are
+        merged into history in the order the orchestrator listed the
+        branches, not the order they finished, so replays are deterministic.
+        Branch conversations are not the task log, so each one is fitted with
+        its own trim-only context window; branches on the same agent never
+        touch the agent's summary state.
+        A branch that fails is merged as an error step in its place, and the
+        other branches keep their results. Afterwards the merge agent named
+        by the decision takes over.
+        
+        Yields:
+            Parallel start/sync events and one result per branch
+        """
+        branches = routing_decision["branches"]
+        agent_names = [branch["agent"] for branch in branches]
+        limit = max(1, int(self.orchestrator.get_execution_setting("max_parallel_agents", 3)))
+        semaphore = asyncio.Semaphore(limit)
+        
+        base_messages = list(self.task.get_messages())
+        context = self.task.get_context()
+        
+        yield ParallelExecutionStartEvent(
+            agents=agent_names,
+            coordination_agent=routing_decision.get("next_agent"),
+            timestamp=datetime.now(),
+            sync_points=["merge"]
+        ).model_dump(mode="json")
+        
+        async def run_branch(index: int, branch: Dict[str, Any]):
+            async with semaphore:
+                agent = self.task.get_agent(branch["agent"])
+                messages = base_messages
+                if branch["goal"]:
+                    messages = base_messages + [{"role": "user", "content": branch["goal"]}]
+                try:
+                    response = await agent.generate_response(
+                        messages=messages,
+                        system_prompt=agent.build_system_prompt(context),
+                        orchestrator=self.orchestrator,
+                        turn_context=agent.build_turn_context(context),
+                        context_window=agent.context_window.detached()
+                    )
+                except Exception as e:
+                    logger.error(f"Parallel branch for '{branch['agent']}' failed: {e}")
+                    return index, None, str(e)
+                return index, response, None
+        
+        started = time.perf_counter()
+        pending = [asyncio.create_task(run_branch(i, branch)) for i, branch in enumerate(branches)]
+        responses: Dict[int, str] = {}
+        errors: Dict[int, str] = {}
+        try:
+            for next_done in asyncio.as_completed(pending):
+                index, response, error = await next_done
+                responses[index] = response
+                if error is not None:
+                    errors[index] = error
+                yield ParallelExecutionSyncEvent(
+                    sync_point="merge",
+                    completed_agents=[agent_names[i] for i in sorted(responses)],
+                    waiting_agents=[name for i, name in enumerate(agent_names) if i not in responses],
+                    timestamp=datetime.now()
+                ).model_dump(mode="json")
+        finally:
+            for branch_task in pending:
+                branch_task.cancel()
+        
+        logger.info(
+            f"🔀 {len(branches)} parallel branches finished in {time.perf_counter() - started:.2f}s "
+            f"(max {limit} concurrent)"
+        )
+        
+        # Fan-in: merge in branch order
+        for index, branch in enumerate(branches):
+            content = responses[index]
+            if index in errors:
+                content = f"Error: branch failed: {errors[index]}"
+            text = f"{branch['goal']}\n\n{content}" if branch["goal"] else content
+            self.task.add_step(TaskStep(
+                step_id=self._generate_step_id(),
+                agent_name=branch["agent"],
+                parts=[TextPart(text=text)]
+            ))
+            result = {
+                "type": "parallel_branch_result",
+                "agent": branch["agent"],
+                "goal": branch["goal"],
+                "content": content
+            }
+            if index in errors:
+                result["error"] = errors[index]
+            yield result
+        
+        self.task.set_current_agent(routing_decision["next_agent"])
+
     async def _execute_single_tool(self, tool_call: Any) -> ToolResultPart:
         """Helper to execute one tool call and return a ToolResultPart."""
         tool_name = tool_call.function.name
@@ -704,45 +1018,8 @@ class TaskExecutor:
 
     
     def _convert_history_to_messages(self) -> List[Dict[str, Any]]:
-        """Convert task history to conversation message format for agents."""
-        messages = []
-        
-        for step in self.task.history:
-            if step.agent_name == "user":
-                # User messages
-                for part in step.parts:
-                    if isinstance(part, TextPart):
-                        messages.append({
-                            "role": "user",
-                            "content": part.text
-                        })
-            elif step.agent_name == "system":
-                # Tool results
-                for part in step.parts:
-                    if isinstance(part, ToolResultPart):
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": part.tool_call_id,
-                            "name": part.tool_name,
-                            "content": json.dumps({
-                                "success": not part.is_error,
-                                "result": part.result
-                            })
-                        })
-            else:
-                # Agent messages
-                for part in step.parts:
-                    if isinstance(part, TextPart):
-                        messages.append({
-                            "role": "assistant",
-                            "content": part.text
-                        })
-                    elif isinstance(part, ToolCallPart):
-                        # This would be part of an assistant message with tool calls
-                        # We'll handle this in a more sophisticated way if needed
-                        pass
-        
-        return messages
+        """Get conversation messages for agents from the task's cached message log."""
+        return self.task.get_messages()
     
     def _generate_task_id(self) -> str:
         """Generate a unique task ID."""
@@ -799,80 +1076,129 @@ class TaskExecutor:
         except Exception as e:
             logger.warning(f"Failed to setup task logging: {e}")
     
-    async def _save_state_async(self) -> None:
-        """Save task state and conversation history to workspace using storage layer."""
-        try:
-            if not hasattr(self, 'workspace_storage'):
-                logger.warning("Workspace storage not initialized, skipping state save")
-                return
-                
-            # Save task state
-            state = {
-                "task_id": self.task.task_id,
-                "initial_prompt": self.task.initial_prompt,
+    def _record_routing(self, routing_decision: Dict[str, Any]) -> None:
+        """Journal a routing decision before it is applied and update handoff statistics."""
+        self.orchestrator.observe_transition(self.task.current_agent, routing_decision)
+        if self.journal:
+            self._last_routing = {
+                "action": routing_decision["action"],
                 "current_agent": self.task.current_agent,
-                "round_count": self.task.round_count,
-                "is_complete": self.task.is_complete,
-                "is_paused": self.task.is_paused,
-                "created_at": self.task.created_at.isoformat(),
-                "artifacts": self.task.artifacts,
-                "history_length": len(self.task.history)
+                "next_agent": routing_decision.get("next_agent"),
+                "reason": routing_decision.get("reason", ""),
+                "round_count": self.task.round_count
             }
-            
-            await self.workspace_storage.file_storage.write_text(
-                "task_state.json", 
-                json.dumps(state, indent=2)
-            )
-            
-            # Save conversation history
-            await self._save_conversation_history_async()
-            
-        except Exception as e:
-            logger.warning(f"Failed to save task state: {e}")
+            self.journal.record("routing", self._last_routing)
+    
+    @staticmethod
+    def _apply_routing(state: Dict[str, Any], routing: Dict[str, Any], agents: Dict[str, Any]) -> None:
+        """Apply a journaled routing decision to the round, completion and current agent in `state`."""
+        state["round_count"] = routing["round_count"]
+        if routing["action"] == "COMPLETE":
+            state["is_complete"] = True
+        elif routing["action"] in ("HANDOFF", "PARALLEL") and routing.get("next_agent") in agents:
+            state["current_agent"] = routing["next_agent"]
+    
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """
+        Build the full task state written to compact snapshots.
+        
+        State is saved right after a routing decision is journaled but before
+        it is applied, and the snapshot folds in that record, so the decision
+        is applied to the snapshot here.
+        """
+        state = {
+            "task_id": self.task.task_id,
+            "initial_prompt": self.task.initial_prompt,
+            "current_agent": self.task.current_agent,
+            "round_count": self.task.round_count,
+            "is_complete": self.task.is_complete,
+            "is_paused": self.task.is_paused,
+            "created_at": self.task.created_at.isoformat(),
+            "artifacts": self.task.artifacts,
+            "history_length": len(self.task.history),
+            "history": [step.model_dump(mode="json") for step in self.task.history]
+        }
+        if self._last_routing:
+            self._apply_routing(state, self._last_routing, self.task.agents)
+        return state
     
-    async def _save_conversation_history_async(self) -> None:
-        """Save conversation history to JSONL file using storage layer."""
+    async def _save_state_async(self) -> None:
+        """
+        Persist task progress to the workspace.
+        
+        Appends the events recorded since the last save to the journal, and
+        writes a compact snapshot once enough events have accumulated or the
+        task is complete.
+        """
+        if not self.journal:
+            return
+        
         try:
-            # Prepare conversation history data
-            history_lines = []
-            for step in self.task.history:
-                step_data = {
-                    "step_id": step.step_id,
-                    "agent_name": step.agent_name,
-                    "timestamp": step.timestamp.isoformat(),
-                    "parts": []
-                }
-                
-                for part in step.parts:
-                    if hasattr(part, 'text'):
-                        step_data["parts"].append({
-                            "type": "text",
-                            "content": part.text
-                        })
-                    elif isinstance(part, ToolCallPart):
-                        step_data["parts"].append({
-                            "type": "tool_call",
-                            "tool_call_id": part.tool_call_id,
-                            "tool_name": part.tool_name,
-                            "arguments": part.args
-                        })
-                    elif hasattr(part, 'tool_result'):
-                        step_data["parts"].append({
-                            "type": "tool_result",
-                            "result": part.tool_result.result,
-                            "success": part.tool_result.success
-                        })
-                
-                history_lines.append(json.dumps(step_data))
-            
-            # Write to storage
-            await self.workspace_storage.file_storage.write_text(
-                "history/conversation.jsonl",
-                '\n'.join(history_lines) + '\n'
-            )
-                    
+            if self.journal.snapshot_due or self.task.is_complete:
+                await self.journal.snapshot(self._snapshot_state())
+            else:
+                await self.journal.flush()
         except Exception as e:
-            logger.warning(f"Failed to save conversation history: {e}")
+            logger.warning(f"Failed to save task state: {e}")
+    
+    @classmethod
+    async def resume(cls, task_id: str, config_path: str, workspace_dir: Path = None) -> 'TaskExecutor':
+        """
+        Resume a task from its workspace after a crash or restart.
+        
+        State is rebuilt from the latest snapshot plus the journal records
+        written after it.
+        
+        Args:
+            task_id: ID of the task to resume
+            config_path: Path to team configuration file
+            workspace_dir: Task workspace (defaults to ./workspace/<task_id>)
+        
+        Returns:
+            TaskExecutor ready for step() calls
+        """
+        executor = await cls.create(config_path, task_id=task_id, workspace_dir=workspace_dir)
+        if not executor.journal:
+            raise ValueError(f"Cannot resume task {task_id}: workspace storage is unavailable")
+        
+        snapshot, records = await executor.journal.load()
+        if snapshot is None and not records:
+            raise ValueError(f"No saved state found for task {task_id}")
+        
+        task = executor.task
+        if snapshot:
+            task.initial_prompt = snapshot.get("initial_prompt")
+            task.current_agent = snapshot.get("current_agent")
+            task.round_count = snapshot.get("round_count", 0)
+            task.is_complete = snapshot.get("is_complete", False)
+            task.is_paused = snapshot.get("is_paused", False)
+            if snapshot.get("created_at"):
+                task.created_at = datetime.fromisoformat(snapshot["created_at"])
+            task.artifacts = snapshot.get("artifacts", {})
+            task.history = [TaskStep.model_validate(step) for step in snapshot.get("history", [])]
+        
+        # Replay the journal tail directly onto the task so nothing is re-journaled
+        for record in records:
+            data = record["data"]
+            if record["type"] == "start":
+                task.initial_prompt = data["initial_prompt"]
+                task.current_agent = data["current_agent"]
+            elif record["type"] == "step":
+                task.history.append(TaskStep.model_validate(data))
+            elif record["type"] == "artifact":
+                task.artifacts[data.pop("name")] = data
+            elif record["type"] == "routing":
+                state = {"round_count": task.round_count, "is_complete": task.is_complete, "current_agent": task.current_agent}
+                executor._apply_routing(state, data, task.agents)
+                task.round_count, task.is_complete, task.current_agent = (
+                    state["round_count"], state["is_complete"], state["current_agent"]
+                )
+        
+        logger.info(
+            f"♻️ Task {task_id} resumed at round {task.round_count} "
+            f"({len(task.history)} steps, {len(records)} journal records replayed)"
+        )
+        return executor
 
     def setup_storage_tools(self):
         """Setup storage tools for the task."""
@@ -903,7 +1229,7 @@ async def execute_task(prompt: str, config_path: str, initial_agent: str = None,
     Yields:
         Stream chunks if stream=True, or completes silently if stream=False
     """
-    task_executor = TaskExecutor(config_path)
+    task_executor = await TaskExecutor.create(config_path)
     
     if stream:
         async for chunk in task_executor.execute_task(prompt, initial_agent, stream=True):
@@ -922,6 +1248,11 @@ def start_task(prompt: str, config_path: str, initial_agent: str = None) -> 'Tas
     
     Returns:
         TaskExecutor instance ready for step() calls
+    
+    Note:
+        This constructs the executor synchronously. From async code, prefer
+        ``executor = await TaskExecutor.create(config_path)`` followed by
+        ``executor.start_task(prompt)``.
     """
     task_executor = TaskExecutor(config_path)
     task_executor.start_task(prompt, initial_agent)
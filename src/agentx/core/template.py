@@ -0,0 +1,190 @@
+"""
+Compiled team templates shared by all tasks created from one config.
+
+Parsing team.yaml, building the Jinja environment and loading every agent's
+prompt is the same work for every task of a team. A TeamTemplate does it once
+and holds the immutable results; TaskExecutor only adds per-task state on top.
+Templates are cached per config path and recompiled when team.yaml or any
+prompt file changes on disk.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from .config import AgentConfig, BrainConfig, ContextPolicy
+from ..config.team_loader import TeamConfig, load_team_config
+from ..config.prompt_loader import PromptLoader
+from ..config.models import ToolsConfig
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (path, mtime_ns, size) for every file the compiled template depends on
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+class TeamTemplate:
+    """
+    Immutable compiled form of a team configuration.
+
+    Holds the parsed team config, the team's tool settings and one
+    AgentConfig per agent with its prompt already loaded. Agent configs are
+    shared between tasks and must not be mutated.
+    """
+
+    def __init__(self, config_path: Path, team_config: TeamConfig,
+                 agent_configs: Dict[str, AgentConfig], fingerprint: Fingerprint,
+                 tools_config: Optional[ToolsConfig] = None):
+        self.config_path = config_path
+        self.team_config = team_config
+        self.agent_configs = agent_configs
+        self.fingerprint = fingerprint
+        self.tools_config = tools_config  # None = executor defaults
+
+    @classmethod
+    def compile(cls, config_path: str) -> "TeamTemplate":
+        """
+        Parse a team config and load its agent prompts.
+
+        Args:
+            config_path: Path to team.yaml
+
+        Returns:
+            Compiled TeamTemplate
+        """
+        config_path = Path(config_path)
+        fingerprint = _fingerprint(config_path)
+        team_config = load_team_config(config_path)
+
+        # Initialize prompt loader if prompts directory exists
+        prompt_loader = None
+        prompts_dir = config_path.parent / "prompts"
+        if prompts_dir.exists():
+            try:
+                prompt_loader = PromptLoader(str(prompts_dir))
+            except Exception as e:
+                logger.warning(f"Could not initialize prompt loader: {e}")
+
+        agent_configs = {}
+        for agent_data in team_config.agents:
+            agent_config = _compile_agent_config(agent_data, prompt_loader)
+            agent_configs[agent_config.name] = agent_config
+
+        tools_config = ToolsConfig(**team_config.tools) if team_config.tools else None
+
+        logger.debug(f"Compiled team template '{team_config.name}' with {len(agent_configs)} agents")
+        return cls(config_path, team_config, agent_configs, fingerprint, tools_config)
+
+    def is_stale(self) -> bool:
+        """Whether team.yaml or a prompt file changed since compilation."""
+        return _fingerprint(self.config_path) != self.fingerprint
+
+
+_templates: Dict[Path, TeamTemplate] = {}
+_templates_lock = threading.Lock()
+
+
+def get_team_template(config_path: str) -> TeamTemplate:
+    """
+    Get the compiled template for a team config, compiling it if needed.
+
+    Args:
+        config_path: Path to team.yaml
+
+    Returns:
+        Cached TeamTemplate, recompiled if its files changed on disk
+    """
+    key = Path(config_path).resolve()
+    with _templates_lock:
+        template = _templates.get(key)
+        if template is None or template.is_stale():
+            template = TeamTemplate.compile(config_path)
+            _templates[key] = template
+        return template
+
+
+def clear_team_templates() -> None:
+    """Drop all cached team templates."""
+    with _templates_lock:
+        _templates.clear()
+
+
+def _fingerprint(config_path: Path) -> Fingerprint:
+    """Stat team.yaml and the prompt files next to it."""
+    files = [config_path]
+    prompts_dir = config_path.parent / "prompts"
+    if prompts_dir.is_dir():
+        files.extend(sorted(p for p in prompts_dir.rglob("*") if p.is_file()))
+
+    entries = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def _compile_agent_config(agent_data: Dict[str, Any], prompt_loader: Optional[PromptLoader]) -> AgentConfig:
+    """Convert raw agent data from team.yaml to an AgentConfig."""
+    name = agent_data.get('name')
+    if not name:
+        raise ValueError("Agent must have a 'name' field")
+
+    # Load prompt template
+    prompt_template = None
+    prompt_file = agent_data.get('prompt_template')
+
+    if prompt_file and prompt_loader:
+        try:
+            # Strip "prompts/" prefix if present
+            prompt_filename = prompt_file
+            if prompt_filename.startswith("prompts/"):
+                prompt_filename = prompt_filename[8:]
+
+            prompt_template = prompt_loader.load_prompt(prompt_filename)
+        except Exception as e:
+            logger.warning(f"Could not load prompt file {prompt_file}: {e}")
+
+    if not prompt_template:
+        prompt_template = agent_data.get('system_message', f"You are a helpful AI assistant named {name}.")
+
+    # Create brain config from llm_config
+    brain_config = None
+    if 'llm_config' in agent_data:
+        llm_config = agent_data['llm_config']
+        brain_config = BrainConfig(
+            provider=llm_config.get('provider', 'deepseek'),
+            model=llm_config.get('model', 'deepseek-chat'),
+            temperature=llm_config.get('temperature', 0.7),
+            max_tokens=llm_config.get('max_tokens', 4000),
+            api_key=llm_config.get('api_key'),
+            base_url=llm_config.get('base_url'),
+            supports_function_calls=llm_config.get('supports_function_calls', True),
+            parallel_function_calls=llm_config.get('parallel_function_calls', True),
+            max_context_length=llm_config.get('max_context_length'),
+            response_cache=llm_config.get('response_cache'),
+            rate_limit=llm_config.get('rate_limit'),
+            cascade=llm_config.get('cascade'),
+            failover=llm_config.get('failover'),
+            retry_policy={
+                **({'max_retries': llm_config['max_retries']} if 'max_retries' in llm_config else {}),
+                **(llm_config.get('retry_policy') or {})
+            }
+        )
+
+    # Context window budget and compaction policy
+    context_policy = None
+    if agent_data.get('context'):
+        context_policy = ContextPolicy(**agent_data['context'])
+
+    return AgentConfig(
+        name=name,
+        description=agent_data.get('description', f"AI assistant named {name}"),
+        prompt_template=prompt_template,
+        tools=agent_data.get('tools', []),
+        brain_config=brain_config,
+        context_policy=context_policy
+    )
@@ -6,6 +6,7 @@ Provides endpoints for creating and managing tasks, and accessing task memory.
 """
 
 import asyncio
+import os
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from ..utils.logger import get_logger
@@ -17,6 +18,8 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from ..core.task import TaskExecutor
+from ..core.config import BrainConfig
+from ..core.http_pool import warm_connections
 from .models import (
     TaskRequest, TaskResponse, TaskInfo, TaskStatus,
     MemoryRequest, MemoryResponse,
@@ -34,7 +37,8 @@ def create_app(
     title: str = "AgentX API",
     description: str = "REST API for AgentX task execution and memory management",
     version: str = "0.4.0",
-    enable_cors: bool = True
+    enable_cors: bool = True,
+    warm_providers: Optional[List[str]] = None
 ) -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -44,6 +48,9 @@ def create_app(
         description: API description  
         version: API version
         enable_cors: Whether to enable CORS middleware
+        warm_providers: LLM providers (e.g. "deepseek") to open pooled connections
+                        to at startup; defaults to the comma-separated
+                        AGENTX_WARM_PROVIDERS environment variable
         
     Returns:
         Configured FastAPI application
@@ -64,6 +71,14 @@ def create_app(
             allow_headers=["*"],
         )
     
+    # Open LLM provider connections before the first task needs them
+    if warm_providers is None:
+        warm_providers = [p.strip() for p in os.getenv("AGENTX_WARM_PROVIDERS", "").split(",") if p.strip()]
+    if warm_providers:
+        @app.on_event("startup")
+        async def warm_llm_connections():
+            await warm_connections([BrainConfig(provider=provider, model="default") for provider in warm_providers])
+    
     # Add routes
     add_routes(app)
     
@@ -88,7 +103,7 @@ def add_routes(app: FastAPI):
         """Create and start a new task"""
         try:
             # Create the task
-            task = create_task(request.config_path)
+            task = await TaskExecutor.create(request.config_path)
             active_tasks[task.task_id] = task
             
             # Start task execution in background
@@ -234,6 +234,33 @@ class LocalFileStorage(FileStorage):
                 error=str(e)
             )
     
+    async def move(self, source: str, destination: str) -> StorageResult:
+        """Move a file, atomically replacing the destination if it exists."""
+        try:
+            source_path = self._resolve_path(source)
+            destination_path = self._resolve_path(destination)
+            
+            if not await aiofiles.os.path.isfile(source_path):
+                return StorageResult(
+                    success=False,
+                    error=f"File not found: {source}"
+                )
+            
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.replace(source_path, destination_path)
+            
+            return StorageResult(
+                success=True,
+                path=destination,
+                metadata={"operation": "move", "source": source}
+            )
+            
+        except Exception as e:
+            return StorageResult(
+                success=False,
+                error=str(e)
+            )
+    
     async def create_directory(self, path: str) -> StorageResult:
         """Create a directory."""
         try:
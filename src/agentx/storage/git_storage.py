@@ -7,6 +7,7 @@ where we need proper diffs, branching, and version history.
 
 import json
 import asyncio
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
@@ -46,18 +47,34 @@ class GitArtifactStorage:
         
         self.workspace_path = Path(workspace_path)
         self.artifacts_path = self.workspace_path / "artifacts"
-        self.artifacts_path.mkdir(parents=True, exist_ok=True)
         
         # Thread pool for Git operations (Git operations are not async)
         self.executor = ThreadPoolExecutor(max_workers=2)
         
-        # Initialize or open Git repository
-        self.repo = self._init_repository()
+        # The repository is created on first use, so tasks that never store
+        # an artifact don't pay for git init and the initial commit
+        self._repo: Optional[Repo] = None
+        self._repo_lock = threading.Lock()
         
         logger.info(f"GitArtifactStorage initialized: {self.artifacts_path}")
     
+    @property
+    def repo(self) -> Repo:
+        """Git repository for artifacts, opened or initialized on first access."""
+        if self._repo is None:
+            with self._repo_lock:
+                if self._repo is None:
+                    self._repo = self._init_repository()
+        return self._repo
+    
+    async def _ensure_repository(self) -> None:
+        """Open or initialize the repository without blocking the event loop."""
+        if self._repo is None:
+            await asyncio.get_event_loop().run_in_executor(self.executor, lambda: self.repo)
+    
     def _init_repository(self) -> Repo:
         """Initialize or open Git repository."""
+        self.artifacts_path.mkdir(parents=True, exist_ok=True)
         try:
             # Try to open existing repository
             repo = Repo(self.artifacts_path)
@@ -92,6 +109,8 @@ class GitArtifactStorage:
     ) -> StorageResult:
         """Store an artifact with Git versioning."""
         try:
+            await self._ensure_repository()
+            
             # Determine file extension based on content type
             extension = self._get_extension_for_content_type(content_type)
             artifact_path = self.artifacts_path / f"{name}{extension}"
@@ -164,6 +183,9 @@ class GitArtifactStorage:
         try:
             artifacts = []
             
+            if not self.artifacts_path.exists():
+                return artifacts
+            
             # Get all artifact files (excluding metadata files)
             for file_path in self.artifacts_path.iterdir():
                 if file_path.is_file() and not file_path.name.startswith('.') and not file_path.name.endswith('.meta.json'):
@@ -304,6 +326,8 @@ class GitArtifactStorage:
     
     def _find_artifact_extension(self, name: str) -> Optional[str]:
         """Find the extension of an existing artifact."""
+        if not self.artifacts_path.exists():
+            return None
         for file_path in self.artifacts_path.iterdir():
             if file_path.stem == name and not file_path.name.endswith('.meta.json'):
                 return file_path.suffix
@@ -97,6 +97,11 @@ class FileStorage(StorageBackend):
     async def create_directory(self, path: str) -> StorageResult:
         """Create a directory."""
         pass
+    
+    @abstractmethod
+    async def move(self, source: str, destination: str) -> StorageResult:
+        """Move a file, atomically replacing the destination if it exists."""
+        pass
 
 
 class ArtifactStorage(StorageBackend):
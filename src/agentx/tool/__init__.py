@@ -9,7 +9,7 @@ This module provides:
 """
 
 from .registry import ToolRegistry, get_tool_registry, register_tool
-from .executor import ToolExecutor, ToolResult
+from .executor import ToolExecutor, ToolResult, ResultEncodingPolicy
 from .base import Tool, ToolFunction
 from .schemas import get_tool_schemas
 from .manager import ToolManager
@@ -31,6 +31,7 @@ __all__ = [
     # Execution
     'ToolExecutor',
     'ToolResult',
+    'ResultEncodingPolicy',
     
     # Base classes
     'Tool',
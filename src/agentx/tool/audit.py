@@ -0,0 +1,130 @@
+"""
+Asynchronous JSONL audit log of tool calls.
+
+ToolExecutor keeps only compact records of recent calls in memory. Teams
+that need full arguments and results for auditing can enable an audit log:
+each call is queued as-is, and a background thread serializes it and appends
+one JSON line to the file, so tool dispatch never waits on formatting or
+disk I/O. If the writer falls behind by more than its queue size, further
+records are dropped and counted rather than slowing tools down.
+"""
+
+import atexit
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..utils.logger import get_logger
+from .models import safe_json_serialize
+
+logger = get_logger(__name__)
+
+DEFAULT_QUEUE_SIZE = 10000
+
+
+class ToolAuditWriter:
+    """
+    Appends tool call records to a JSONL file from a background thread.
+
+    Records are serialized when written, not when queued, so callers must
+    not mutate arguments or results after handing them over.
+    """
+
+    def __init__(self, path: str, max_queue: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize the writer.
+
+        Args:
+            path: JSONL file to append to (parent directories are created)
+            max_queue: Records waiting to be written before new ones are dropped
+        """
+        self.path = Path(path).expanduser()
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.stats = {"written": 0, "dropped": 0, "errors": 0}
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Queue a record without blocking. Starts the writer thread on first use."""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.stats["dropped"] += 1
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tool-audit-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                record = self._queue.get()
+                try:
+                    if record is None:
+                        return
+                    # Write whatever else is queued in the same batch
+                    lines = [self._encode(record)]
+                    while len(lines) < 1000:
+                        try:
+                            record = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if record is None:
+                            self._queue.put(None)  # Stop after this batch
+                            break
+                        lines.append(self._encode(record))
+                    f.write("".join(line for line in lines if line))
+                    f.flush()
+                    self.stats["written"] += sum(1 for line in lines if line)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"Failed to write tool audit log {self.path}: {e}")
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        try:
+            return json.dumps(safe_json_serialize(record), ensure_ascii=False, default=str) + "\n"
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Skipping tool audit record that cannot be serialized: {e}")
+            return ""
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything queued so far, then stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Written, dropped and failed record counts with the current backlog."""
+        return {**self.stats, "path": str(self.path), "queued": self._queue.qsize()}
+
+
+_writers: Dict[Path, ToolAuditWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_audit_writer(path: str) -> ToolAuditWriter:
+    """Get the process-wide writer for an audit log file, so tasks sharing a file never interleave lines."""
+    key = Path(path).expanduser().resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = ToolAuditWriter(str(key))
+            _writers[key] = writer
+        return writer
+
+
+@atexit.register
+def _close_audit_writers() -> None:
+    """Flush audit logs on interpreter exit; writer threads are daemons and would otherwise lose queued records."""
+    for writer in list(_writers.values()):
+        writer.close()
@@ -14,6 +14,17 @@ class ToolFunction(BaseModel):
     description: str
     function: Callable
     parameters: Dict[str, Any]
+    read_only: bool = False  # Safe to run concurrently with other read-only calls
+    max_concurrency: Optional[int] = None  # Per-tool concurrency limit
+    cache_ttl: Optional[float] = None  # Seconds to reuse results of identical calls
+    cache_scope: str = "task"  # "task" or "global"
+    cache_key: Optional[List[str]] = None  # Arguments that determine the result
+    isolation: str = "thread"  # "thread" or "process"
+    memory_limit_mb: Optional[int] = None  # Per-call memory limit for process isolation
+    cpu_time_limit: Optional[float] = None  # Per-call CPU seconds for process isolation
+    backend: Optional[str] = None  # External service; tools naming it share a circuit breaker
+    result_fields: Optional[List[str]] = None  # Result fields sent to the LLM (None = all)
+    result_formatter: Optional[Callable[[Any], Any]] = None  # Turns the result into what the LLM sees
     
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,175 @@
+"""
+In-memory cache for results of idempotent tools.
+
+Search, extraction and weather tools return the same answer for the same
+arguments over short windows, yet agents call them repeatedly within and
+across tasks. Tools opt in with `@tool(cache_ttl=...)`. Entries are keyed by
+tool name and canonical arguments, expire after the tool's TTL and are
+evicted least-recently-used once the cache is full. Identical calls that
+arrive while the first is still running wait for it instead of executing again.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Awaitable, Iterable, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Cache scopes a tool can declare
+TASK_SCOPE = "task"
+GLOBAL_SCOPE = "global"
+CACHE_SCOPES = (TASK_SCOPE, GLOBAL_SCOPE)
+
+DEFAULT_TASK_CACHE_ENTRIES = 256
+DEFAULT_GLOBAL_CACHE_ENTRIES = 1024
+
+# Result posted to waiters when the call they joined was cancelled
+_RETRY = object()
+
+
+def tool_cache_key(tool_name: str, arguments: Dict[str, Any], key_fields: Optional[Iterable[str]] = None) -> str:
+    """
+    Canonical hash of a tool call.
+
+    Args:
+        tool_name: Name of the tool
+        arguments: Call arguments
+        key_fields: Arguments that determine the result (None = all arguments)
+    """
+    if key_fields is not None:
+        arguments = {field: arguments.get(field) for field in key_fields}
+    canonical = json.dumps(
+        {"tool": tool_name, "arguments": arguments},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ToolResultCache:
+    """
+    Bounded LRU cache of tool results with per-entry TTL and in-flight coalescing.
+
+    Only results the caller marks cacheable are stored. A failed execution is
+    shared with the calls that were waiting for it but never cached. If the
+    call that runs the tool is cancelled, one of its waiters runs it again,
+    since waiters may belong to other tasks that were not cancelled.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TASK_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, value)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (found, value) for an unexpired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for `ttl` seconds, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def get_or_run(
+        self,
+        key: str,
+        ttl: float,
+        run: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda value: True
+    ) -> Tuple[Any, bool]:
+        """
+        Return a cached value, join an identical call in flight, or run `run`.
+
+        Args:
+            key: Cache key from `tool_cache_key`
+            ttl: Seconds to keep the result
+            run: Coroutine factory that executes the tool
+            cacheable: Whether a result may be stored
+
+        Returns:
+            (value, cached) where cached is True if the tool did not run for this call
+        """
+        found, value = self.get(key)
+        if found:
+            self.stats["hits"] += 1
+            return value, True
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            value = await asyncio.shield(inflight)
+            while value is _RETRY:
+                # The call we joined was cancelled; run it or join whoever does
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    return await self._run(key, ttl, run, cacheable)
+                value = await asyncio.shield(inflight)
+            return value, True
+
+        self.stats["misses"] += 1
+        return await self._run(key, ttl, run, cacheable)
+
+    async def _run(
+        self,
+        key: str,
+        ttl: float,
+        run: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool]
+    ) -> Tuple[Any, bool]:
+        """Run the call for `key`, sharing its outcome with identical calls that arrive meanwhile."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await run()
+        except asyncio.CancelledError:
+            future.set_result(_RETRY)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no other call is waiting
+            raise
+        else:
+            if cacheable(value):
+                self.put(key, value, ttl)
+            future.set_result(value)
+            return value, False
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit, miss and eviction counts with the hit rate over all lookups."""
+        lookups = self.stats["hits"] + self.stats["coalesced"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": (self.stats["hits"] + self.stats["coalesced"]) / max(lookups, 1)
+        }
+
+
+# Shared by every executor for tools with global scope
+_global_cache = ToolResultCache(max_entries=DEFAULT_GLOBAL_CACHE_ENTRIES)
+
+
+def get_global_tool_cache() -> ToolResultCache:
+    """Get the process-wide cache for tools with global scope."""
+    return _global_cache
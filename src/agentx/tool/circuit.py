@@ -0,0 +1,138 @@
+"""
+Circuit breakers for tools that depend on an external backend.
+
+When a backend such as SerpAPI or Firecrawl is down, every call to its
+tools can run until the execution timeout before failing, and agents keep
+retrying. Tools name their backend with `@tool(backend=...)`. After repeated
+failures in a row the backend's circuit opens and its tools fail fast until
+a cooldown has passed. A single trial call then decides whether the circuit
+closes again. Circuits are shared by every executor in the process, so one
+task's failures spare the others the same wait.
+"""
+
+import time
+from typing import Dict, Any, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOLDOWN_SECONDS = 30.0
+
+
+class ToolUnavailable(Exception):
+    """A tool's backend circuit is open; the call was not attempted."""
+
+    def __init__(self, backend: str, retry_after: float):
+        self.backend = backend
+        self.retry_after = retry_after
+        super().__init__(
+            f"Backend '{backend}' is unavailable after repeated failures; retry after {retry_after:.0f}s"
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one backend."""
+
+    def __init__(
+        self,
+        backend: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS
+    ):
+        self.backend = backend
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.stats = {"calls": 0, "failures": 0, "rejected": 0, "circuit_opens": 0}
+
+    def state(self, now: Optional[float] = None) -> str:
+        """Circuit state: "closed" (healthy), "open" (failing fast) or "half_open" (ready for a trial call)."""
+        if self.opened_at is None:
+            return "closed"
+        now = time.monotonic() if now is None else now
+        return "open" if now - self.opened_at < self.cooldown_seconds else "half_open"
+
+    def before_call(self) -> bool:
+        """
+        Admit a call or reject it.
+
+        Returns:
+            True if the call is the trial call of a half-open circuit
+
+        Raises:
+            ToolUnavailable: If the circuit is open, or a trial call is already running
+        """
+        now = time.monotonic()
+        state = self.state(now)
+        if state == "closed":
+            return False
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            logger.info(f"Probing tool backend '{self.backend}' after {self.cooldown_seconds:.0f}s cooldown")
+            return True
+        self.stats["rejected"] += 1
+        retry_after = max(self.opened_at + self.cooldown_seconds - now, 1.0)
+        raise ToolUnavailable(self.backend, retry_after)
+
+    def record_success(self) -> None:
+        self.stats["calls"] += 1
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+        if self.opened_at is not None:
+            logger.info(f"Tool backend '{self.backend}' recovered")
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.stats["calls"] += 1
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        if self.trial_in_flight or (self.opened_at is None and self.consecutive_failures >= self.failure_threshold):
+            if self.opened_at is None:
+                self.stats["circuit_opens"] += 1
+                logger.warning(
+                    f"Tool backend '{self.backend}' failing, rejecting its calls for {self.cooldown_seconds:.0f}s"
+                )
+            self.opened_at = time.monotonic()
+        self.trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Let another call probe the backend when a trial call ended without an outcome, e.g. cancelled."""
+        self.trial_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Call, failure and rejection counts with the current state."""
+        state = self.state()
+        stats = {**self.stats, "state": state, "consecutive_failures": self.consecutive_failures}
+        if state == "open":
+            stats["retry_after"] = self.opened_at + self.cooldown_seconds - time.monotonic()
+        return stats
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(
+    backend: str,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS
+) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a backend, creating it on first use."""
+    breaker = _breakers.get(backend)
+    if breaker is None:
+        breaker = CircuitBreaker(backend, failure_threshold, cooldown_seconds)
+        _breakers[backend] = breaker
+    return breaker
+
+
+def get_circuit_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every backend that has a circuit breaker."""
+    return {backend: breaker.get_stats() for backend, breaker in _breakers.items()}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all circuit states."""
+    _breakers.clear()
@@ -11,16 +11,30 @@ The executor is responsible for:
 import time
 import asyncio
 import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import logging
+from collections import deque
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Dict, Any, List, Optional, AsyncGenerator, Tuple, Deque
 from pydantic import BaseModel
 from dataclasses import asdict, is_dataclass
 from ..utils.logger import get_logger
 from .registry import ToolRegistry, get_tool_registry
+from .base import ToolFunction
 from .models import ToolResult
+from .cache import ToolResultCache, tool_cache_key, get_global_tool_cache, GLOBAL_SCOPE
+from .isolation import get_process_tool_pool, PROCESS_ISOLATION
+from .circuit import ToolUnavailable, CircuitBreaker, get_circuit_breaker, get_circuit_stats
+from .audit import ToolAuditWriter
 
 logger = get_logger(__name__)
 
+# Compact records of recent calls kept in memory
+EXECUTION_HISTORY_SIZE = 1000
+# Characters of tool arguments and results shown in debug logs
+LOG_PREVIEW_CHARS = 500
+# Rough characters per prompt token, for result encoding savings
+CHARS_PER_TOKEN = 4
+
 
 def safe_json_serialize(obj):
     """
@@ -41,6 +55,14 @@ def safe_json_serialize(obj):
         return obj
 
 
+def _log_preview(value: Any) -> str:
+    """Compact JSON of a value for debug logs, truncated to LOG_PREVIEW_CHARS."""
+    text = safe_json_dumps(value, ensure_ascii=False, default=str)
+    if len(text) > LOG_PREVIEW_CHARS:
+        return text[:LOG_PREVIEW_CHARS] + "..."
+    return text
+
+
 def safe_json_dumps(obj, **kwargs):
     """
     Safely convert object to JSON string, handling complex nested objects.
@@ -54,13 +76,28 @@ def safe_json_dumps(obj, **kwargs):
         return json.dumps(safe_obj, **kwargs)
 
 
+def _is_cacheable(result: Any) -> bool:
+    """Tools report some failures as a returned ToolResult; those are not cached."""
+    return not (isinstance(result, ToolResult) and not result.success)
+
+
+class ToolQueueTimeout(Exception):
+    """A tool call waited longer than the queue allows for an execution slot."""
+
+
 class SecurityPolicy:
     """Security policies for tool execution."""
     
     # Resource limits
     MAX_EXECUTION_TIME = 60.0  # seconds
     MAX_TOOLS_PER_BATCH = 10
-    MAX_CONCURRENT_EXECUTIONS = 3
+    MAX_CONCURRENT_EXECUTIONS = 3  # Further executions wait for a free slot
+    MAX_CONCURRENT_EXECUTIONS_PER_AGENT = None  # Per-agent limit (None = only the global limit)
+    MAX_QUEUE_WAIT = 30.0  # seconds a call may wait for a slot before failing
+    
+    # Circuit breakers for tools that declare a backend
+    CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive failures before calls fail fast
+    CIRCUIT_COOLDOWN = 30.0  # seconds before a trial call is let through
     
     # Tool permissions per agent type
     TOOL_PERMISSIONS = {
@@ -98,6 +135,46 @@ class SecurityPolicy:
     ]
 
 
+class ResultEncodingPolicy:
+    """
+    How tool results are encoded in the tool messages sent back to the LLM.
+    
+    Tool messages stay in the conversation and are sent again as prompt
+    tokens on every later turn, so by default only the outcome is sent, as
+    compact JSON. Tools can narrow or reformat their own results with
+    `@tool(result_fields=..., result_formatter=...)`.
+    """
+    
+    def __init__(self, compact: bool = True, include_metadata: bool = False, track_savings: bool = False):
+        """
+        Initialize the policy.
+        
+        Args:
+            compact: Encode without indentation or spaces after separators
+            include_metadata: Also send execution time and executor metadata
+            track_savings: Also encode each result the verbose way to report the prompt
+                           tokens saved. Costs a second, indented serialization per call.
+        """
+        self.compact = compact
+        self.include_metadata = include_metadata
+        self.track_savings = track_savings
+    
+    def dumps(self, payload: Dict[str, Any]) -> str:
+        """Encode a tool message payload."""
+        if self.compact:
+            return safe_json_dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return safe_json_dumps(payload, ensure_ascii=False, indent=2)
+
+
+def _project_fields(value: Any, fields: List[str]) -> Any:
+    """Keep only `fields` of a dict, or of each dict in a list."""
+    if isinstance(value, dict):
+        return {field: value[field] for field in fields if field in value}
+    if isinstance(value, list):
+        return [_project_fields(item, fields) for item in value]
+    return value
+
+
 class ToolExecutor:
     """
     Secure tool executor with performance monitoring and security policies.
@@ -107,19 +184,76 @@ class ToolExecutor:
     - Resource limits and monitoring
     - Error handling and logging
     - Audit trails
+    
+    Independent read-only tool calls run concurrently, bounded by a global
+    limit and optional per-tool and per-agent limits. Calls over a limit wait
+    their turn, up to MAX_QUEUE_WAIT, instead of failing back to the model.
+    Tools that are not read-only run one at a time so writes to the task
+    workspace never interleave.
+    
+    Tools that opt into process isolation run in a shared pool of worker
+    processes, so a timed-out call is killed instead of holding a thread.
+    
+    Tools that declare a backend share a circuit breaker per backend. While
+    it is open their calls fail immediately with a retry-after hint.
+    
+    Tools declared with a cache TTL reuse successful results for identical
+    arguments, from a cache owned by this executor or one shared process-wide.
+    
+    Results are encoded for the LLM according to a ResultEncodingPolicy.
+    
+    Only compact records of recent calls are kept in memory. Full arguments
+    and results go to the optional audit writer, which writes them off the
+    event loop.
     """
     
-    def __init__(self, registry: Optional[ToolRegistry] = None):
+    def __init__(
+        self,
+        registry: Optional[ToolRegistry] = None,
+        max_concurrent_executions: Optional[int] = None,
+        max_concurrent_per_agent: Optional[int] = None,
+        max_queue_wait: Optional[float] = None,
+        audit_writer: Optional[ToolAuditWriter] = None,
+        result_encoding: Optional[ResultEncodingPolicy] = None
+    ):
         """
         Initialize tool executor.
         
         Args:
             registry: Tool registry to use (defaults to global registry)
+            max_concurrent_executions: Tools running at once across all agents
+                                       (defaults to the security policy)
+            max_concurrent_per_agent: Tools running at once for one agent
+                                      (defaults to the security policy)
+            max_queue_wait: Seconds a call waits for a free slot before it fails
+                            (defaults to the security policy)
+            audit_writer: Writer for full call records (none by default)
+            result_encoding: How results are encoded for the LLM (compact by default)
         """
         self.registry = registry or get_tool_registry()
         self.security_policy = SecurityPolicy()
+        if max_concurrent_executions is not None:
+            self.security_policy.MAX_CONCURRENT_EXECUTIONS = max_concurrent_executions
+        if max_concurrent_per_agent is not None:
+            self.security_policy.MAX_CONCURRENT_EXECUTIONS_PER_AGENT = max_concurrent_per_agent
+        if max_queue_wait is not None:
+            self.security_policy.MAX_QUEUE_WAIT = max_queue_wait
         self.active_executions = 0
-        self.execution_history: List[Dict[str, Any]] = []
+        self.execution_history: Deque[Dict[str, Any]] = deque(maxlen=EXECUTION_HISTORY_SIZE)
+        self.execution_counts = {"total": 0, "successful": 0}
+        self.audit_writer = audit_writer
+        self.result_encoding = result_encoding or ResultEncodingPolicy()
+        self.encoding_stats = {"results": 0, "chars": 0, "verbose_chars": 0}
+        
+        # Concurrency limits. Waiters queue in arrival order.
+        self._execution_semaphore = asyncio.Semaphore(self.security_policy.MAX_CONCURRENT_EXECUTIONS)
+        self._tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._agent_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.queue_stats = {"calls": 0, "waiting": 0, "total_wait": 0.0, "max_wait": 0.0, "timeouts": 0}
+        self._write_lock = asyncio.Lock()
+        
+        # Results of cacheable tools with task scope
+        self._result_cache = ToolResultCache()
         
         logger.info("🔧 ToolExecutor initialized with security policies")
     
@@ -148,14 +282,6 @@ class ToolExecutor:
             if not validation_result.success:
                 return validation_result
             
-            # Resource limit check
-            if self.active_executions >= self.security_policy.MAX_CONCURRENT_EXECUTIONS:
-                return ToolResult(
-                    success=False,
-                    error="Maximum concurrent executions exceeded",
-                    execution_time=time.time() - start_time
-                )
-            
             # Get tool function
             tool_function = self.registry.get_tool_function(tool_name)
             if not tool_function:
@@ -165,33 +291,65 @@ class ToolExecutor:
                     execution_time=time.time() - start_time
                 )
             
-            # Execute with monitoring
-            self.active_executions += 1
-            try:
-                result = await self._execute_with_timeout(
-                    tool_function.function, 
-                    kwargs,
-                    self.security_policy.MAX_EXECUTION_TIME
+            # Idempotent tools are served from the result cache when possible
+            cache_hit = False
+            if tool_function.cache_ttl:
+                result, cache_hit = await self._result_cache_for(tool_function).get_or_run(
+                    tool_cache_key(tool_name, kwargs, tool_function.cache_key),
+                    tool_function.cache_ttl,
+                    lambda: self._run_tool(tool_function, agent_name, kwargs),
+                    cacheable=_is_cacheable
                 )
+            else:
+                result = await self._run_tool(tool_function, agent_name, kwargs)
+            
+            execution_time = time.time() - start_time
+            
+            # Log successful execution
+            self._log_execution(tool_name, agent_name, kwargs, True, execution_time, result=result, cache_hit=cache_hit)
+            
+            metadata = {
+                "tool_name": tool_name,
+                "agent_name": agent_name
+            }
+            if cache_hit:
+                metadata["cache_hit"] = True
+            
+            return ToolResult(
+                success=True,
+                result=result,
+                execution_time=execution_time,
+                metadata=metadata
+            )
                 
-                execution_time = time.time() - start_time
-                
-                # Log successful execution
-                self._log_execution(tool_name, agent_name, kwargs, True, execution_time)
-                
-                return ToolResult(
-                    success=True,
-                    result=result,
-                    execution_time=execution_time,
-                    metadata={
-                        "tool_name": tool_name,
-                        "agent_name": agent_name
-                    }
-                )
-                
-            finally:
-                self.active_executions -= 1
-                
+        except ToolUnavailable as e:
+            execution_time = time.time() - start_time
+            error_msg = f"Tool '{tool_name}' unavailable: {e}"
+            self._log_execution(tool_name, agent_name, kwargs, False, execution_time, error_msg)
+            
+            return ToolResult(
+                success=False,
+                error=error_msg,
+                execution_time=execution_time,
+                metadata={
+                    "tool_name": tool_name,
+                    "agent_name": agent_name,
+                    "unavailable": True,
+                    "retry_after": round(e.retry_after)
+                }
+            )
+            
+        except ToolQueueTimeout as e:
+            execution_time = time.time() - start_time
+            error_msg = str(e)
+            self._log_execution(tool_name, agent_name, kwargs, False, execution_time, error_msg)
+            
+            return ToolResult(
+                success=False,
+                error=error_msg,
+                execution_time=execution_time
+            )
+            
         except asyncio.TimeoutError:
             execution_time = time.time() - start_time
             error_msg = f"Tool execution timed out after {self.security_policy.MAX_EXECUTION_TIME}s"
@@ -217,7 +375,8 @@ class ToolExecutor:
     async def execute_tool_calls(
         self, 
         tool_calls: List[Any], 
-        agent_name: str = "default"
+        agent_name: str = "default",
+        parallel: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Execute multiple tool calls and return formatted results for LLM.
@@ -225,9 +384,36 @@ class ToolExecutor:
         Args:
             tool_calls: List of tool call objects from LLM response
             agent_name: Name of the agent requesting execution
+            parallel: Whether independent read-only calls may run concurrently
             
         Returns:
-            List of tool result messages formatted for LLM conversation
+            List of tool result messages formatted for LLM conversation,
+            in the same order as `tool_calls`
+        """
+        tool_messages: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        async for index, message in self.stream_tool_calls(tool_calls, agent_name, parallel):
+            tool_messages[index] = message
+        return tool_messages
+    
+    async def stream_tool_calls(
+        self,
+        tool_calls: List[Any],
+        agent_name: str = "default",
+        parallel: bool = True
+    ) -> AsyncGenerator[Tuple[int, Dict[str, Any]], None]:
+        """
+        Execute multiple tool calls, yielding each result as soon as it is ready.
+        
+        Read-only calls run concurrently. Any other call waits for the calls
+        before it, and later calls wait for it, so side effects keep their order.
+        
+        Args:
+            tool_calls: List of tool call objects from LLM response
+            agent_name: Name of the agent requesting execution
+            parallel: Whether independent read-only calls may run concurrently
+            
+        Yields:
+            (index, message) pairs, where index is the call's position in `tool_calls`
         """
         # Validate batch size
         if len(tool_calls) > self.security_policy.MAX_TOOLS_PER_BATCH:
@@ -235,8 +421,8 @@ class ToolExecutor:
             logger.error(error_msg)
             
             # Return error for all tool calls
-            return [
-                {
+            for index, tc in enumerate(tool_calls):
+                yield index, {
                     "role": "tool",
                     "tool_call_id": tc.id,
                     "name": tc.function.name,
@@ -244,79 +430,257 @@ class ToolExecutor:
                         "success": False,
                         "error": error_msg
                     })
-                } for tc in tool_calls
-            ]
-        
-        tool_messages = []
+                }
+            return
         
+        batch = self.start_tool_calls(agent_name, parallel)
         for tool_call in tool_calls:
-            tool_name = tool_call.function.name
-            tool_call_id = tool_call.id
-            try:
-                # Parse tool arguments
-                tool_args = json.loads(tool_call.function.arguments)
-                
-                # Log tool call start
-                logger.info(f"🔧 TOOL CALL START | ID: {tool_call_id} | Tool: {tool_name} | Agent: {agent_name}")
-                logger.info(f"📝 TOOL ARGS | {safe_json_dumps(tool_args, indent=2)}")
-                
-                # Execute the tool
-                start_time = time.time()
-                result = await self.execute_tool(tool_name, agent_name, **tool_args)
-                execution_time = time.time() - start_time
-                
-                # Log tool call result
-                if result.success:
-                    logger.info(f"✅ TOOL CALL SUCCESS | ID: {tool_call_id} | Tool: {tool_name} | Time: {execution_time:.2f}s")
-                    logger.info(f"📤 TOOL RESULT | {safe_json_dumps(result.result, indent=2)[:500]}{'...' if len(str(result.result)) > 500 else ''}")
-                else:
-                    logger.error(f"❌ TOOL CALL FAILED | ID: {tool_call_id} | Tool: {tool_name} | Error: {result.error}")
-                    logger.error(f"⏱️  TOOL TIME | {execution_time:.2f}s")
-                
-                # Format result for LLM using safe serialization
-                if result.success:
-                    content = safe_json_dumps({
-                        "success": True,
-                        "result": result.result,
-                        "execution_time": result.execution_time,
-                        "metadata": result.metadata
-                    }, ensure_ascii=False, indent=2)
-                else:
-                    content = safe_json_dumps({
-                        "success": False,
-                        "error": result.error,
-                        "execution_time": result.execution_time
-                    }, ensure_ascii=False, indent=2)
-                    
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ TOOL CALL PARSE ERROR | ID: {tool_call_id} | Tool: {tool_name} | Error: Invalid JSON arguments")
-                logger.error(f"🔍 RAW ARGS | {tool_call.function.arguments}")
-                content = safe_json_dumps({
-                    "success": False,
-                    "error": f"Invalid tool arguments: {str(e)}"
-                })
+            batch.add(tool_call)
+        async for index, message in batch.results():
+            yield index, message
+    
+    def start_tool_calls(self, agent_name: str = "default", parallel: bool = True) -> "ToolCallBatch":
+        """
+        Open a batch for tool calls that arrive one at a time.
+        
+        Each call added to the batch starts right away, subject to the same
+        ordering rules as `stream_tool_calls`. This lets execution overlap
+        with the LLM still streaming the remaining calls.
+        
+        Args:
+            agent_name: Name of the agent requesting execution
+            parallel: Whether independent read-only calls may run concurrently
+            
+        Returns:
+            ToolCallBatch to add calls to and read results from
+        """
+        return ToolCallBatch(self, agent_name, parallel)
+    
+    async def _execute_tool_call(self, tool_call: Any, agent_name: str) -> Tuple[Dict[str, Any], bool]:
+        """Execute one tool call and format the result message for the LLM.
+        
+        Returns:
+            (message, success) pair
+        """
+        tool_name = tool_call.function.name
+        tool_call_id = tool_call.id
+        success = False
+        try:
+            # Parse tool arguments
+            tool_args = json.loads(tool_call.function.arguments)
+            
+            # Log tool call start. Payloads are only formatted when debug logging is on.
+            logger.info("🔧 TOOL CALL START | ID: %s | Tool: %s | Agent: %s", tool_call_id, tool_name, agent_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📝 TOOL ARGS | %s", _log_preview(tool_args))
+            
+            # Execute the tool
+            start_time = time.time()
+            result = await self.execute_tool(tool_name, agent_name, **tool_args)
+            execution_time = time.time() - start_time
+            
+            # Log tool call result
+            if result.success:
+                logger.info("✅ TOOL CALL SUCCESS | ID: %s | Tool: %s | Time: %.2fs", tool_call_id, tool_name, execution_time)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📤 TOOL RESULT | %s", _log_preview(result.result))
+            else:
+                logger.error("❌ TOOL CALL FAILED | ID: %s | Tool: %s | Time: %.2fs | Error: %s",
+                             tool_call_id, tool_name, execution_time, result.error)
+            
+            # Format result for LLM
+            content, success = self._encode_result(tool_name, result)
                 
-            except Exception as e:
-                logger.error(f"❌ TOOL CALL EXCEPTION | ID: {tool_call_id} | Tool: {tool_name} | Error: {str(e)}")
-                content = safe_json_dumps({
-                    "success": False,
-                    "error": f"Tool execution failed: {str(e)}"
-                })
+        except json.JSONDecodeError as e:
+            logger.error("❌ TOOL CALL PARSE ERROR | ID: %s | Tool: %s | Error: Invalid JSON arguments", tool_call_id, tool_name)
+            logger.debug("🔍 RAW ARGS | %s", tool_call.function.arguments)
+            content = safe_json_dumps({
+                "success": False,
+                "error": f"Invalid tool arguments: {str(e)}"
+            })
             
-            # Add tool result message
-            tool_messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "name": tool_name,
-                "content": content
+        except Exception as e:
+            logger.error("❌ TOOL CALL EXCEPTION | ID: %s | Tool: %s | Error: %s", tool_call_id, tool_name, e)
+            content = safe_json_dumps({
+                "success": False,
+                "error": f"Tool execution failed: {str(e)}"
             })
         
-        # Log batch summary
-        successful_calls = sum(1 for msg in tool_messages if '"success": true' in msg["content"])
-        failed_calls = len(tool_messages) - successful_calls
-        logger.info(f"📊 TOOL BATCH COMPLETE | Agent: {agent_name} | Total: {len(tool_messages)} | Success: {successful_calls} | Failed: {failed_calls}")
+        # Add tool result message
+        message = {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "name": tool_name,
+            "content": content
+        }
+        return message, success
+    
+    def _encode_result(self, tool_name: str, result: ToolResult) -> Tuple[str, bool]:
+        """
+        Encode a tool result as tool message content, following the result encoding policy.
+        
+        Returns:
+            (content, success) pair. A ToolResult returned by the tool itself
+            is unwrapped, so its success decides the outcome.
+        """
+        policy = self.result_encoding
+        value, success, error = result.result, result.success, result.error
+        if success and isinstance(value, ToolResult):
+            value, success, error = value.result, value.success, value.error
+        
+        if success:
+            payload = {"success": True, "result": self._format_result(tool_name, value)}
+        else:
+            payload = {"success": False, "error": error}
+            if result.metadata.get("unavailable"):
+                payload["retry_after"] = result.metadata["retry_after"]
+        if policy.include_metadata:
+            payload["execution_time"] = result.execution_time
+            if success:
+                payload["metadata"] = result.metadata
+        content = policy.dumps(payload)
+        
+        self.encoding_stats["results"] += 1
+        self.encoding_stats["chars"] += len(content)
+        if policy.track_savings:
+            # What the result cost before encoding policies: everything, pretty-printed
+            verbose = {"success": result.success, "execution_time": result.execution_time}
+            if result.success:
+                verbose.update(result=result.result, metadata=result.metadata)
+            else:
+                verbose["error"] = result.error
+            self.encoding_stats["verbose_chars"] += len(safe_json_dumps(verbose, ensure_ascii=False, indent=2))
+        
+        return content, success
+    
+    def _format_result(self, tool_name: str, value: Any) -> Any:
+        """Apply a tool's result projection and formatter."""
+        tool_function = self.registry.get_tool_function(tool_name)
+        if tool_function is None:
+            return value
+        if tool_function.result_fields:
+            value = _project_fields(safe_json_serialize(value), tool_function.result_fields)
+        if tool_function.result_formatter:
+            try:
+                value = tool_function.result_formatter(value)
+            except Exception as e:
+                logger.warning("Result formatter for tool '%s' failed, sending the unformatted result: %s", tool_name, e)
+        return value
+    
+    async def _run_tool(self, tool_function: ToolFunction, agent_name: str, kwargs: Dict[str, Any]) -> Any:
+        """Execute a tool, through its backend's circuit breaker if it has one."""
+        breaker = self._circuit_for(tool_function)
+        if breaker is None:
+            return await self._run_in_slot(tool_function, agent_name, kwargs)
+        
+        is_trial = breaker.before_call()
+        outcome_recorded = False
+        try:
+            result = await self._run_in_slot(tool_function, agent_name, kwargs)
+        except ToolQueueTimeout:
+            # Our own queue was full; says nothing about the backend
+            raise
+        except Exception:
+            breaker.record_failure()
+            outcome_recorded = True
+            raise
+        else:
+            if _is_cacheable(result):
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            outcome_recorded = True
+            return result
+        finally:
+            if is_trial and not outcome_recorded:
+                breaker.release_trial()
+    
+    def _circuit_for(self, tool_function: ToolFunction) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker for a tool's backend, if it declares one."""
+        if not tool_function.backend:
+            return None
+        return get_circuit_breaker(
+            tool_function.backend,
+            self.security_policy.CIRCUIT_FAILURE_THRESHOLD,
+            self.security_policy.CIRCUIT_COOLDOWN
+        )
+    
+    async def _run_in_slot(self, tool_function: ToolFunction, agent_name: str, kwargs: Dict[str, Any]) -> Any:
+        """Execute a tool with monitoring once a slot is free."""
+        async with self._execution_slot(tool_function, agent_name):
+            if tool_function.isolation == PROCESS_ISOLATION:
+                return await get_process_tool_pool().run(
+                    tool_function,
+                    kwargs,
+                    self.security_policy.MAX_EXECUTION_TIME
+                )
+            return await self._execute_with_timeout(
+                tool_function.function, 
+                kwargs,
+                self.security_policy.MAX_EXECUTION_TIME
+            )
+    
+    def _result_cache_for(self, tool_function: ToolFunction) -> ToolResultCache:
+        """Get the result cache matching a tool's declared scope."""
+        if tool_function.cache_scope == GLOBAL_SCOPE:
+            return get_global_tool_cache()
+        return self._result_cache
+    
+    @asynccontextmanager
+    async def _execution_slot(self, tool_function: ToolFunction, agent_name: str = "default"):
+        """
+        Wait for the locks and slots a tool execution needs.
+        
+        Tools that are not read-only take the workspace write lock first so they
+        don't hold a global slot while queued behind another write. Narrower
+        limits are taken before the global one for the same reason.
+        
+        Raises:
+            ToolQueueTimeout: If the slots are not free within MAX_QUEUE_WAIT
+        """
+        waits = []
+        if not tool_function.read_only:
+            waits.append(self._write_lock)
+        if tool_function.max_concurrency:
+            waits.append(self._tool_semaphores.setdefault(
+                tool_function.name, asyncio.Semaphore(tool_function.max_concurrency)
+            ))
+        agent_limit = self.security_policy.MAX_CONCURRENT_EXECUTIONS_PER_AGENT
+        if agent_limit:
+            waits.append(self._agent_semaphores.setdefault(agent_name, asyncio.Semaphore(agent_limit)))
+        waits.append(self._execution_semaphore)
+        
+        async with AsyncExitStack() as stack:
+            loop = asyncio.get_running_loop()
+            max_wait = self.security_policy.MAX_QUEUE_WAIT
+            queued_at = loop.time()
+            self.queue_stats["waiting"] += 1
+            try:
+                for lock in waits:
+                    remaining = queued_at + max_wait - loop.time()
+                    try:
+                        async with asyncio.timeout(max(remaining, 0)):
+                            await lock.acquire()
+                    except TimeoutError:
+                        self.queue_stats["timeouts"] += 1
+                        raise ToolQueueTimeout(
+                            f"Tool '{tool_function.name}' waited {max_wait:.0f}s for a free execution slot; "
+                            f"too many tool calls are running, try again shortly"
+                        ) from None
+                    stack.callback(lock.release)
+            finally:
+                self.queue_stats["waiting"] -= 1
             
-        return tool_messages
+            waited = loop.time() - queued_at
+            self.queue_stats["calls"] += 1
+            self.queue_stats["total_wait"] += waited
+            self.queue_stats["max_wait"] = max(self.queue_stats["max_wait"], waited)
+            
+            self.active_executions += 1
+            try:
+                yield
+            finally:
+                self.active_executions -= 1
     
     def _validate_execution(
         self, 
@@ -399,11 +763,16 @@ class ToolExecutor:
         kwargs: Dict[str, Any],
         success: bool,
         execution_time: float,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        result: Any = None,
+        cache_hit: bool = False
     ):
         """
         Log tool execution for audit trail.
         
+        The in-memory history keeps argument names only. Full arguments and
+        results are handed to the audit writer, if there is one.
+        
         Args:
             tool_name: Tool that was executed
             agent_name: Agent that requested execution
@@ -411,43 +780,176 @@ class ToolExecutor:
             success: Whether execution succeeded
             execution_time: Time taken for execution
             error: Error message if failed
+            result: Tool return value if succeeded
+            cache_hit: Whether the result came from the result cache
         """
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
+        timestamp = time.time()
+        self.execution_counts["total"] += 1
+        if success:
+            self.execution_counts["successful"] += 1
+        
+        # The deque drops the oldest entry once full
+        self.execution_history.append({
+            "timestamp": timestamp,
             "tool_name": tool_name,
             "agent_name": agent_name,
-            "arguments": kwargs,
+            "arguments": list(kwargs),
             "success": success,
             "execution_time": execution_time,
             "error": error
-        }
-        
-        self.execution_history.append(log_entry)
+        })
         
-        # Keep only last 1000 entries to prevent memory bloat
-        if len(self.execution_history) > 1000:
-            self.execution_history = self.execution_history[-1000:]
+        if self.audit_writer is not None:
+            self.audit_writer.write({
+                "timestamp": timestamp,
+                "tool_name": tool_name,
+                "agent_name": agent_name,
+                "arguments": kwargs,
+                "success": success,
+                "result": result,
+                "error": error,
+                "execution_time": execution_time,
+                "cache_hit": cache_hit
+            })
         
-        # Log to file/external system if needed
         if success:
-            logger.debug(f"✅ Tool '{tool_name}' executed successfully for '{agent_name}' in {execution_time:.2f}s")
+            logger.debug("✅ Tool '%s' executed successfully for '%s' in %.2fs", tool_name, agent_name, execution_time)
         else:
-            logger.debug(f"❌ Tool '{tool_name}' failed for '{agent_name}': {error}")
+            logger.debug("❌ Tool '%s' failed for '%s': %s", tool_name, agent_name, error)
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
-        total_executions = len(self.execution_history)
-        successful_executions = sum(1 for entry in self.execution_history if entry["success"])
+        total_executions = self.execution_counts["total"]
+        successful_executions = self.execution_counts["successful"]
         
         return {
             "total_executions": total_executions,
             "successful_executions": successful_executions,
             "failure_rate": (total_executions - successful_executions) / max(total_executions, 1),
             "active_executions": self.active_executions,
-            "recent_executions": self.execution_history[-10:] if self.execution_history else []
+            "queue": {
+                **self.queue_stats,
+                "average_wait": self.queue_stats["total_wait"] / max(self.queue_stats["calls"], 1)
+            },
+            "result_cache": {
+                "task": self._result_cache.get_stats(),
+                "global": get_global_tool_cache().get_stats()
+            },
+            "process_pool": get_process_tool_pool().get_stats(),
+            "circuits": get_circuit_stats(),
+            "audit": self.audit_writer.get_stats() if self.audit_writer else None,
+            "result_encoding": self._get_encoding_stats(),
+            "recent_executions": list(self.execution_history)[-10:]
+        }
+    
+    def _get_encoding_stats(self) -> Dict[str, Any]:
+        """Estimated prompt tokens of tool messages, and tokens saved versus the verbose encoding."""
+        stats = self.encoding_stats
+        result = {
+            "results": stats["results"],
+            "tokens": stats["chars"] // CHARS_PER_TOKEN
         }
+        if self.result_encoding.track_savings:
+            verbose_tokens = stats["verbose_chars"] // CHARS_PER_TOKEN
+            result["verbose_tokens"] = verbose_tokens
+            result["tokens_saved"] = max(verbose_tokens - result["tokens"], 0)
+            result["savings_rate"] = result["tokens_saved"] / max(verbose_tokens, 1)
+        return result
     
     def clear_history(self):
         """Clear execution history."""
         self.execution_history.clear()
-        logger.debug("Tool execution history cleared") 
\ No newline at end of file
+        self.execution_counts = {"total": 0, "successful": 0}
+        logger.debug("Tool execution history cleared")
+
+
+class ToolCallBatch:
+    """
+    Tool calls from one LLM response, executed as they are added.
+    
+    Read-only calls only wait for the last mutating call before them. A
+    mutating call waits for every call before it. Results are queued as
+    calls finish and read with `results()` once all calls have been added.
+    """
+    
+    def __init__(self, executor: ToolExecutor, agent_name: str = "default", parallel: bool = True):
+        self.executor = executor
+        self.agent_name = agent_name
+        self.parallel = parallel
+        self.tasks: List[asyncio.Task] = []
+        self._last_write: Optional[asyncio.Task] = None
+        self._done: asyncio.Queue = asyncio.Queue()
+    
+    def add(self, tool_call: Any) -> None:
+        """Start executing a tool call once the calls it depends on finish."""
+        index = len(self.tasks)
+        max_calls = self.executor.security_policy.MAX_TOOLS_PER_BATCH
+        if index >= max_calls:
+            error_msg = f"Too many tool calls: more than {max_calls}"
+            logger.error(error_msg)
+            self._post_error(index, tool_call, error_msg)
+            self.tasks.append(None)
+            return
+        
+        tool_function = self.executor.registry.get_tool_function(tool_call.function.name)
+        read_only = self.parallel and tool_function is not None and tool_function.read_only
+        if read_only:
+            wait_for = [self._last_write] if self._last_write else []
+        else:
+            wait_for = [task for task in self.tasks if task]
+        
+        task = asyncio.create_task(self._run(index, tool_call, wait_for))
+        self.tasks.append(task)
+        if not read_only:
+            self._last_write = task
+    
+    async def _run(self, index: int, tool_call: Any, wait_for: List[asyncio.Task]) -> None:
+        # Every call must post a result, or results() would wait for it forever
+        try:
+            if wait_for:
+                await asyncio.wait(wait_for)
+            message, success = await self.executor._execute_tool_call(tool_call, self.agent_name)
+        except asyncio.CancelledError:
+            self._post_error(index, tool_call, "Tool call cancelled")
+            raise
+        except BaseException as e:
+            self._post_error(index, tool_call, f"Tool execution failed: {e}")
+            if not isinstance(e, Exception):
+                raise
+            return
+        self._done.put_nowait((index, message, success))
+    
+    def _post_error(self, index: int, tool_call: Any, error_msg: str) -> None:
+        self._done.put_nowait((index, {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "name": tool_call.function.name,
+            "content": safe_json_dumps({"success": False, "error": error_msg})
+        }, False))
+    
+    async def results(self) -> AsyncGenerator[Tuple[int, Dict[str, Any]], None]:
+        """
+        Yield (index, message) pairs as calls finish, until every added call is done.
+        
+        Calls still running are cancelled if the consumer stops early.
+        """
+        successful_calls = 0
+        try:
+            for _ in range(len(self.tasks)):
+                index, message, success = await self._done.get()
+                if success:
+                    successful_calls += 1
+                yield index, message
+        finally:
+            self.cancel()
+        
+        # Log batch summary
+        failed_calls = len(self.tasks) - successful_calls
+        logger.info("📊 TOOL BATCH COMPLETE | Agent: %s | Total: %d | Success: %d | Failed: %d",
+                    self.agent_name, len(self.tasks), successful_calls, failed_calls)
+    
+    def cancel(self) -> None:
+        """Cancel calls that have not finished, e.g. when the LLM stream fails."""
+        for task in self.tasks:
+            if task and not task.done():
+                task.cancel()
@@ -0,0 +1,286 @@
+"""
+Process-isolated execution for tools that opt in with `@tool(isolation="process")`.
+
+Sync tools normally run on the event loop's default thread pool. A thread
+cannot be stopped, so a timed-out call keeps its worker busy, and CPU-heavy
+tools hold the GIL against the event loop. Isolated tools run in a small
+pool of reusable worker processes instead. A call that times out kills its
+worker, and each call can cap the worker's memory and CPU time.
+
+Functions are pickled once per tool and loaded into each worker once,
+outside the call's timeout; later calls only send the arguments. Bound methods pickle their tool instance, so
+isolated tools should keep clients and other unpicklable state out of
+instance attributes or create it lazily.
+"""
+
+import asyncio
+import atexit
+import itertools
+import multiprocessing
+import pickle
+import traceback
+import weakref
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from ..utils.logger import get_logger
+from .base import ToolFunction
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; limits are skipped there
+    resource = None
+
+logger = get_logger(__name__)
+
+# Isolation modes a tool can declare
+THREAD_ISOLATION = "thread"
+PROCESS_ISOLATION = "process"
+ISOLATION_MODES = (THREAD_ISOLATION, PROCESS_ISOLATION)
+
+DEFAULT_MAX_WORKERS = 3
+
+# Seconds a new worker may take to import a tool's module and load the
+# function. Not counted against the tool's execution timeout.
+WORKER_LOAD_TIMEOUT = 60.0
+
+# Spawned workers don't inherit the parent's threads, locks or event loop
+_context = multiprocessing.get_context("spawn")
+
+
+class ToolProcessError(Exception):
+    """A tool failed inside a worker process, or the worker died."""
+
+
+def _apply_limits(memory_limit_mb: Optional[int], cpu_time_limit: Optional[float]) -> None:
+    """Set soft resource limits for the next call. Hard limits stay untouched so they can be raised again."""
+    if resource is None:
+        return
+    _, memory_hard = resource.getrlimit(resource.RLIMIT_AS)
+    memory_soft = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb else memory_hard
+    resource.setrlimit(resource.RLIMIT_AS, (memory_soft, memory_hard))
+
+    # CPU time is cumulative for the process, so the limit counts from now
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_time_limit:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        cpu_soft = int(usage.ru_utime + usage.ru_stime + cpu_time_limit) + 1
+        if cpu_hard != resource.RLIM_INFINITY:
+            cpu_soft = min(cpu_soft, cpu_hard)
+    else:
+        cpu_soft = cpu_hard
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_soft, cpu_hard))
+
+
+def _worker_main(connection) -> None:
+    """Worker loop: receive calls, run them under limits, send back results."""
+    functions: Dict[str, Any] = {}
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if message is None:
+            return
+
+        if message[0] == "load":
+            _, name, payload = message
+            try:
+                functions[name] = pickle.loads(payload)
+                reply = ("ok", None)
+            except BaseException as e:
+                reply = ("error", f"Cannot load tool in worker process: {type(e).__name__}: {e}", traceback.format_exc())
+            connection.send(reply)
+            continue
+
+        _, name, kwargs, memory_limit_mb, cpu_time_limit = message
+        try:
+            func = functions[name]
+            _apply_limits(memory_limit_mb, cpu_time_limit)
+            try:
+                if asyncio.iscoroutinefunction(func):
+                    result = asyncio.run(func(**kwargs))
+                else:
+                    result = func(**kwargs)
+            finally:
+                _apply_limits(None, None)
+            reply = ("ok", result)
+        except BaseException as e:
+            reply = ("error", f"{type(e).__name__}: {e}", traceback.format_exc())
+
+        try:
+            connection.send(reply)
+        except Exception as e:
+            # The result itself could not be pickled
+            connection.send(("error", f"Unpicklable tool result: {e}", ""))
+
+
+class _Worker:
+    """One worker process and the tool functions it has already loaded."""
+
+    def __init__(self):
+        self.connection, child_connection = _context.Pipe()
+        self.process = _context.Process(target=_worker_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.loaded: Set[str] = set()
+
+    def load(self, name: str, payload: bytes) -> None:
+        """Load a pickled tool function into the worker. Runs in a helper thread."""
+        self.connection.send(("load", name, payload))
+        reply = self._receive()
+        if reply[0] == "error":
+            raise ToolProcessError(reply[1])
+        self.loaded.add(name)
+
+    def call(self, name: str, kwargs: Dict[str, Any], tool_function: ToolFunction) -> Any:
+        """Send a call and block until the reply arrives. Runs in a helper thread."""
+        try:
+            self.connection.send((
+                "call",
+                name,
+                kwargs,
+                tool_function.memory_limit_mb,
+                tool_function.cpu_time_limit
+            ))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise ToolProcessError(f"Tool arguments cannot be sent to a worker process: {e}") from e
+        return self._receive()
+
+    def _receive(self) -> Any:
+        try:
+            return self.connection.recv()
+        except (EOFError, OSError):
+            # Killed on timeout, or stopped by the OS for exceeding a limit
+            self.process.join(timeout=1)
+            raise ToolProcessError(f"Worker process exited with code {self.process.exitcode}")
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.connection.close()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+
+class ProcessToolPool:
+    """
+    Pool of reusable worker processes for isolated tool calls.
+
+    Workers start on first use and are kept for later calls. A worker whose
+    call times out or crashes is killed and replaced on demand.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._idle: List[_Worker] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        # function -> (name workers cache it under, pickled function)
+        self._payloads: "weakref.WeakKeyDictionary[Any, Tuple[str, bytes]]" = weakref.WeakKeyDictionary()
+        self._names = itertools.count()
+        self.stats = {"calls": 0, "timeouts": 0, "crashes": 0, "workers_started": 0}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # The pool is process-wide, but semaphores belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    def _payload(self, tool_function: ToolFunction) -> Tuple[str, bytes]:
+        entry = self._payloads.get(tool_function.function)
+        if entry is None:
+            try:
+                payload = pickle.dumps(tool_function.function)
+            except Exception as e:
+                raise ToolProcessError(
+                    f"Tool '{tool_function.name}' cannot run in a separate process: {e}"
+                ) from e
+            entry = (f"{tool_function.name}:{next(self._names)}", payload)
+            self._payloads[tool_function.function] = entry
+        return entry
+
+    async def run(self, tool_function: ToolFunction, kwargs: Dict[str, Any], timeout: float) -> Any:
+        """
+        Run a tool in a worker process.
+
+        Args:
+            tool_function: Tool to run
+            kwargs: Tool arguments (must be picklable)
+            timeout: Seconds before the worker is killed
+
+        Returns:
+            The tool's return value
+
+        Raises:
+            asyncio.TimeoutError: If the call exceeds the timeout
+            ToolProcessError: If the tool raised, or the worker died
+        """
+        name, payload = self._payload(tool_function)
+        loop = asyncio.get_running_loop()
+
+        async with self._semaphore():
+            worker = self._idle.pop() if self._idle else None
+            if worker is None or not worker.alive():
+                worker = await loop.run_in_executor(None, _Worker)
+                self.stats["workers_started"] += 1
+
+            self.stats["calls"] += 1
+            healthy = False
+            try:
+                if name not in worker.loaded:
+                    await asyncio.wait_for(
+                        loop.run_in_executor(None, worker.load, name, payload),
+                        timeout=WORKER_LOAD_TIMEOUT
+                    )
+                reply = await asyncio.wait_for(
+                    loop.run_in_executor(None, worker.call, name, kwargs, tool_function),
+                    timeout=timeout
+                )
+                healthy = True
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                logger.warning(f"Killing worker for tool '{tool_function.name}' after {timeout}s timeout")
+                raise
+            except ToolProcessError:
+                self.stats["crashes"] += 1
+                raise
+            finally:
+                if healthy:
+                    self._idle.append(worker)
+                else:
+                    worker.kill()
+
+        if reply[0] == "error":
+            logger.debug(f"Tool '{tool_function.name}' failed in worker process:\n{reply[2]}")
+            raise ToolProcessError(reply[1])
+        return reply[1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Call, timeout and crash counts with the number of idle workers."""
+        return {**self.stats, "idle_workers": len(self._idle)}
+
+    def shutdown(self) -> None:
+        """Stop all idle workers."""
+        while self._idle:
+            self._idle.pop().stop()
+
+
+# Shared by every executor; workers are expensive to start
+_process_pool = ProcessToolPool()
+atexit.register(_process_pool.shutdown)
+
+
+def get_process_tool_pool() -> ProcessToolPool:
+    """Get the process-wide worker pool for isolated tools."""
+    return _process_pool
@@ -6,12 +6,16 @@ that provides both tool registration and execution capabilities.
 This simplifies the Agent interface and ensures task-level tool isolation.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple, TYPE_CHECKING
 from .registry import ToolRegistry
-from .executor import ToolExecutor, ToolResult
+from .executor import ToolExecutor, ToolResult, ToolCallBatch, ResultEncodingPolicy
+from .audit import get_audit_writer
 from .base import Tool
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..config.models import ToolsConfig
+
 logger = get_logger(__name__)
 
 
@@ -24,16 +28,31 @@ class ToolManager:
     instance to prevent tool conflicts between tasks.
     """
     
-    def __init__(self, task_id: str = "default"):
+    def __init__(self, task_id: str = "default", config: Optional["ToolsConfig"] = None):
         """
         Initialize tool manager with task isolation.
         
         Args:
             task_id: Unique identifier for this task (for logging/debugging)
+            config: Team tool settings; execution limits default to the security policy
         """
         self.task_id = task_id
         self.registry = ToolRegistry()
-        self.executor = ToolExecutor(registry=self.registry)
+        if config:
+            self.executor = ToolExecutor(
+                registry=self.registry,
+                max_concurrent_executions=config.max_parallel_executions,
+                max_concurrent_per_agent=config.max_parallel_executions_per_agent,
+                max_queue_wait=config.max_queue_wait,
+                audit_writer=get_audit_writer(config.audit_log_path) if config.audit_log_path else None,
+                result_encoding=ResultEncodingPolicy(
+                    compact=config.compact_results,
+                    include_metadata=config.include_result_metadata,
+                    track_savings=config.track_result_savings
+                )
+            )
+        else:
+            self.executor = ToolExecutor(registry=self.registry)
         
         logger.debug(f"ToolManager initialized for task {task_id}")
     
@@ -60,9 +79,27 @@ class ToolManager:
         """Execute a single tool."""
         return await self.executor.execute_tool(tool_name, agent_name, **kwargs)
     
-    async def execute_tool_calls(self, tool_calls: List[Any], agent_name: str = "default") -> List[Dict[str, Any]]:
-        """Execute multiple tool calls."""
-        return await self.executor.execute_tool_calls(tool_calls, agent_name)
+    async def execute_tool_calls(
+        self,
+        tool_calls: List[Any],
+        agent_name: str = "default",
+        parallel: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Execute multiple tool calls, returning results in call order."""
+        return await self.executor.execute_tool_calls(tool_calls, agent_name, parallel)
+    
+    def stream_tool_calls(
+        self,
+        tool_calls: List[Any],
+        agent_name: str = "default",
+        parallel: bool = True
+    ) -> AsyncGenerator[Tuple[int, Dict[str, Any]], None]:
+        """Execute multiple tool calls, yielding (index, message) pairs as they finish."""
+        return self.executor.stream_tool_calls(tool_calls, agent_name, parallel)
+    
+    def start_tool_calls(self, agent_name: str = "default", parallel: bool = True) -> ToolCallBatch:
+        """Open a batch that starts each tool call as soon as it is added."""
+        return self.executor.start_tool_calls(agent_name, parallel)
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
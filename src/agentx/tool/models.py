@@ -250,18 +250,68 @@ def safe_json_dumps(obj: Any, **kwargs) -> str:
 # TOOL DECORATOR AND UTILITIES
 # ============================================================================
 
-def tool(description: str = "", return_description: str = ""):
+def tool(
+    description: str = "",
+    return_description: str = "",
+    read_only: bool = False,
+    max_concurrency: Optional[int] = None,
+    cache_ttl: Optional[float] = None,
+    cache_scope: str = "task",
+    cache_key: Optional[List[str]] = None,
+    isolation: str = "thread",
+    memory_limit_mb: Optional[int] = None,
+    cpu_time_limit: Optional[float] = None,
+    backend: Optional[str] = None,
+    result_fields: Optional[List[str]] = None,
+    result_formatter: Optional[Callable[[Any], Any]] = None
+):
     """
     Decorator to mark methods as available tool calls.
     
     Args:
         description: Clear description of what this tool does
         return_description: Description of what the tool returns
+        read_only: Whether the tool has no side effects. Read-only calls in one
+                   turn run concurrently; other calls run one at a time.
+        max_concurrency: Maximum concurrent executions of this tool (None = no per-tool limit)
+        cache_ttl: Seconds to reuse a successful result for identical arguments
+                   (None = never cached). Only set this for idempotent tools.
+        cache_scope: "task" to share results within one task, "global" to share
+                     them across all tasks in the process
+        cache_key: Arguments that determine the result (None = all arguments)
+        isolation: "thread" to run sync tools on the shared thread pool, or
+                   "process" to run the tool in a worker process that is killed
+                   on timeout. Process tools and their arguments must be picklable.
+        memory_limit_mb: Address space limit for a process-isolated call
+        cpu_time_limit: CPU seconds allowed for a process-isolated call
+        backend: External service the tool depends on, e.g. "serpapi". Tools
+                 naming the same backend share a circuit breaker that fails
+                 their calls fast while the backend keeps failing.
+        result_fields: Fields of the result to send to the LLM (None = all).
+                       Applies to a dict result or to each dict in a list result.
+        result_formatter: Function that turns the result into what the LLM
+                          sees, e.g. a short text summary. Runs after projection.
     """
+    if cache_scope not in ("task", "global"):
+        raise ValueError(f"cache_scope must be 'task' or 'global', got '{cache_scope}'")
+    if isolation not in ("thread", "process"):
+        raise ValueError(f"isolation must be 'thread' or 'process', got '{isolation}'")
+    
     def decorator(func):
         func._is_tool_call = True
         func._tool_description = description or func.__doc__ or ""
         func._return_description = return_description
+        func._tool_read_only = read_only
+        func._tool_max_concurrency = max_concurrency
+        func._tool_cache_ttl = cache_ttl
+        func._tool_cache_scope = cache_scope
+        func._tool_cache_key = cache_key
+        func._tool_isolation = isolation
+        func._tool_memory_limit_mb = memory_limit_mb
+        func._tool_cpu_time_limit = cpu_time_limit
+        func._tool_backend = backend
+        func._tool_result_fields = result_fields
+        func._tool_result_formatter = result_formatter
         return func
     return decorator
 
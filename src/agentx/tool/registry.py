@@ -12,10 +12,29 @@ from typing import Dict, List, Any, Optional, Callable
 import inspect
 from ..utils.logger import get_logger
 from .base import Tool, ToolFunction
+from .cache import TASK_SCOPE
+from .isolation import THREAD_ISOLATION
 
 logger = get_logger(__name__)
 
 
+def _tool_metadata(func: Callable) -> Dict[str, Any]:
+    """Read the execution settings the `@tool` decorator attached to a function."""
+    return {
+        "read_only": getattr(func, '_tool_read_only', False),
+        "max_concurrency": getattr(func, '_tool_max_concurrency', None),
+        "cache_ttl": getattr(func, '_tool_cache_ttl', None),
+        "cache_scope": getattr(func, '_tool_cache_scope', TASK_SCOPE),
+        "cache_key": getattr(func, '_tool_cache_key', None),
+        "isolation": getattr(func, '_tool_isolation', THREAD_ISOLATION),
+        "memory_limit_mb": getattr(func, '_tool_memory_limit_mb', None),
+        "cpu_time_limit": getattr(func, '_tool_cpu_time_limit', None),
+        "backend": getattr(func, '_tool_backend', None),
+        "result_fields": getattr(func, '_tool_result_fields', None),
+        "result_formatter": getattr(func, '_tool_result_formatter', None),
+    }
+
+
 class ToolRegistry:
     """
     Registry for managing tool definitions and metadata.
@@ -24,6 +43,11 @@ class ToolRegistry:
     Tool execution is handled by ToolExecutor for security and performance.
     """
     
+    # Parameter schemas keyed by underlying function. Every task registers its
+    # own tool instances, but the signatures are the same, so reflection only
+    # runs once per function per process. Cached schemas are shared read-only.
+    _parameter_cache: Dict[Callable, Dict[str, Any]] = {}
+    
     def __init__(self):
         """Initialize empty tool registry."""
         self.tools: Dict[str, ToolFunction] = {}
@@ -51,7 +75,8 @@ class ToolRegistry:
                 name=method_name,
                 description=inspect.getdoc(method) or f"Execute {method_name}",
                 function=method,
-                parameters=self._extract_parameters(method)
+                parameters=self._extract_parameters(method),
+                **_tool_metadata(method)
             )
             
             self.tools[method_name] = tool_function
@@ -72,7 +97,8 @@ class ToolRegistry:
             name=tool_name,
             description=inspect.getdoc(func) or f"Execute {tool_name}",
             function=func,
-            parameters=self._extract_parameters(func)
+            parameters=self._extract_parameters(func),
+            **_tool_metadata(func)
         )
         
         self.tools[tool_name] = tool_function
@@ -135,6 +161,18 @@ class ToolRegistry:
         Returns:
             Parameter schema in JSON Schema format
         """
+        # Bound methods of different instances share one underlying function
+        key = getattr(func, '__func__', func)
+        cached = self._parameter_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        schema = self._build_parameters(func)
+        self._parameter_cache[key] = schema
+        return schema
+    
+    def _build_parameters(self, func: Callable) -> Dict[str, Any]:
+        """Reflect a parameter schema from a function signature and docstring."""
         sig = inspect.signature(func)
         properties = {}
         required = []
@@ -0,0 +1,142 @@
+"""
+Unit tests for Brain retries and hedged requests.
+"""
+
+import asyncio
+import time
+import litellm
+import pytest
+from litellm.types.utils import ModelResponseStream
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig, RetryPolicy
+from agentx.core.llm_provider import LLMProvider
+from agentx.core.rate_limiter import set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    set_rate_limiter(None)
+    yield
+    set_rate_limiter(None)
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _response(content="done"):
+    return litellm.ModelResponse(
+        model="deepseek-chat",
+        choices=[{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        usage={"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}
+    )
+
+
+class FlakyProvider(LLMProvider):
+    """Fails with the given errors, then answers."""
+
+    def __init__(self, errors, delays=()):
+        self.errors = list(errors)
+        self.delays = list(delays)
+        self.calls = 0
+
+    async def acompletion(self, **params):
+        self.calls += 1
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        if self.errors:
+            raise self.errors.pop(0)
+        if params.get("stream"):
+            return self._stream()
+        return _response(f"answer {self.calls}")
+
+    async def _stream(self):
+        yield ModelResponseStream(model="deepseek-chat", choices=[{"index": 0, "delta": {"content": "ok"}}])
+        yield ModelResponseStream(model="deepseek-chat", choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+
+
+def _brain(provider, **policy):
+    config = BrainConfig(model="deepseek-chat", supports_function_calls=False,
+                         retry_policy=RetryPolicy(initial_delay=0.001, **policy))
+    return Brain(config, provider=provider)
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class TestRetries:
+    """Test retries with backoff."""
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        """Test that 429 and 5xx responses are retried and counted in usage."""
+        provider = FlakyProvider([ProviderError(429), ProviderError(503)])
+        brain = _brain(provider)
+
+        response = await brain.generate_response(MESSAGES)
+
+        assert response.content == "answer 3"
+        assert response.usage["retries"] == 2
+        assert brain.get_call_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_fail_fast(self):
+        """Test that client errors are not retried."""
+        provider = FlakyProvider([ProviderError(400)])
+        response = await _brain(provider).generate_response(MESSAGES)
+
+        assert provider.calls == 1
+        assert response.finish_reason == "error"
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self):
+        """Test that the error surfaces once max_retries is used up."""
+        provider = FlakyProvider([ProviderError(500)] * 5)
+        response = await _brain(provider, max_retries=2).generate_response(MESSAGES)
+
+        assert provider.calls == 3
+        assert response.finish_reason == "error"
+
+    @pytest.mark.asyncio
+    async def test_stream_is_retried_before_first_chunk(self):
+        """Test that a stream that fails to start is retried."""
+        provider = FlakyProvider([ProviderError(429)])
+        chunks = [chunk async for chunk in _brain(provider).stream_response(MESSAGES)]
+
+        assert [c["content"] for c in chunks if c["type"] == "text-delta"] == ["ok"]
+        assert not any(c["type"] == "error" for c in chunks)
+        assert provider.calls == 2
+
+
+class TestHedging:
+    """Test hedged requests for slow calls."""
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        """Test that a call slower than the latency percentile gets a duplicate that wins."""
+        provider = FlakyProvider([], delays=[1.0, 0.0])
+        brain = _brain(provider, hedge_percentile=50, hedge_min_samples=3)
+        brain._latencies.extend([0.02, 0.03, 0.05])
+
+        start = time.perf_counter()
+        response = await brain.generate_response(MESSAGES)
+
+        assert time.perf_counter() - start < 0.5
+        assert response.content == "answer 2"
+        assert response.usage["hedged"] is True
+        assert brain.get_call_stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedging_until_warmed_up(self):
+        """Test that hedging waits for enough latency samples."""
+        provider = FlakyProvider([])
+        brain = _brain(provider, hedge_percentile=50, hedge_min_samples=3)
+
+        response = await brain.generate_response(MESSAGES)
+
+        assert provider.calls == 1
+        assert "hedged" not in response.usage
+        assert len(brain._latencies) == 1
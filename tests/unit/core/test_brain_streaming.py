@@ -0,0 +1,50 @@
+"""
+Unit tests for Brain stream handling.
+"""
+
+import pytest
+from types import SimpleNamespace
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig
+
+
+def _chunk(tool_calls=None, content=None, finish_reason=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)], model=None, usage=None)
+
+
+def _call_delta(id=None, name=None, arguments=None):
+    return SimpleNamespace(id=id, type="function", function=SimpleNamespace(name=name, arguments=arguments))
+
+
+class TestNativeToolCallStream:
+    """Test early emission of streamed tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_emitted_when_arguments_complete(self):
+        """Test that a tool call is emitted before the stream finishes once its JSON closes."""
+        async def stream():
+            yield _chunk([_call_delta("a", "get_weather", '{"location": ')])
+            yield _chunk([_call_delta(arguments='"Paris"}')])
+            yield _chunk([_call_delta("b", "get_weather", '{"location": "Rome"')])
+            yield _chunk(content="Checking both cities.")
+            yield _chunk(finish_reason="stop")
+
+        brain = Brain(BrainConfig(model="deepseek/deepseek-chat"))
+        events = [event async for event in brain._handle_native_function_calling_stream(stream())]
+
+        kinds = [(event["type"], event.get("tool_call", {}).get("id")) for event in events]
+        # "a" is complete before the text arrives; "b" never closes and is emitted at finish
+        assert kinds == [("tool-call", "a"), ("text-delta", None), ("tool-call", "b"), ("finish", None)]
+        assert events[0]["tool_call"]["function"]["arguments"] == '{"location": "Paris"}'
+
+    def test_partial_arguments_are_not_complete(self):
+        """Test that unbalanced or non-object arguments are not treated as complete."""
+        def call(arguments, name="get_weather"):
+            return {"function": {"name": name, "arguments": arguments}}
+
+        assert Brain._tool_call_complete(call('{"a": {"b": 1}}'))
+        assert not Brain._tool_call_complete(call('{"a": {"b": 1}'))
+        assert not Brain._tool_call_complete(call('{"a": "}"'))
+        assert not Brain._tool_call_complete(call('{}', name=""))
@@ -0,0 +1,159 @@
+"""
+Unit tests for the agent context window manager.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from agentx.core.agent import Agent, ContextWindowManager
+from agentx.core.config import AgentConfig, BrainConfig, ContextPolicy
+
+
+def _brain(max_context_length=None, max_tokens=100):
+    brain = Mock()
+    brain.config = BrainConfig(max_context_length=max_context_length, max_tokens=max_tokens)
+    brain.generate_response = AsyncMock(return_value=Mock(content="the summary", finish_reason="stop"))
+    return brain
+
+
+def _messages(count, size=400):
+    messages = [{"role": "user", "content": "initial prompt"}]
+    for i in range(count):
+        role = "assistant" if i % 2 == 0 else "user"
+        messages.append({"role": role, "content": f"{i}:" + "x" * size})
+    return messages
+
+
+class TestContextWindowManager:
+    """Test token budgeting and compaction."""
+
+    def test_unbounded_window_passes_messages_through(self):
+        """Test that no budget means no changes."""
+        window = ContextWindowManager(ContextPolicy(), _brain())
+        messages = _messages(50)
+
+        assert window.fit(messages) is messages
+
+    def test_over_budget_keeps_head_and_recent_tail(self):
+        """Test truncation keeps the initial prompt and the newest messages."""
+        window = ContextWindowManager(ContextPolicy(summarize=False), _brain(max_context_length=1000))
+        messages = _messages(50)
+
+        fitted = window.fit(messages)
+
+        assert fitted[0] == messages[0]
+        assert fitted[-1] == messages[-1]
+        assert "omitted" in fitted[1]["content"]
+        assert sum(window.estimate_tokens(m) for m in fitted) <= 1000
+
+    @pytest.mark.asyncio
+    async def test_compaction_runs_in_background_and_replaces_old_span(self):
+        """Test that a summary replaces older messages once it is ready."""
+        brain = _brain(max_context_length=2000)
+        window = ContextWindowManager(ContextPolicy(tail_messages=4), brain)
+        messages = _messages(30)
+
+        first = window.fit(messages)
+        # The turn is not held up by summarization
+        assert brain.generate_response.await_count == 0
+        assert "omitted" in first[1]["content"]
+
+        await window._pending
+
+        second = window.fit(messages)
+        assert second[0] == messages[0]
+        assert second[1]["content"].endswith("the summary")
+        assert second[-4:] == messages[-4:]
+
+    @pytest.mark.asyncio
+    async def test_summary_discarded_for_shorter_history(self):
+        """Test that a summary from a longer history is not applied to a new one."""
+        window = ContextWindowManager(ContextPolicy(tail_messages=2), _brain(max_context_length=2000))
+        window.fit(_messages(30))
+        await window._pending
+
+        fitted = window.fit(_messages(3, size=10))
+
+        assert all("summary" not in (m["content"] or "") for m in fitted)
+
+
+    def test_tool_result_keeps_its_tool_call(self):
+        """Test that an oversized tool result is never sent without its tool call."""
+        window = ContextWindowManager(ContextPolicy(summarize=False), _brain(max_context_length=1000))
+        messages = _messages(4) + [
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "call_1"}]},
+            {"role": "tool", "tool_call_id": "call_1", "content": "x" * 8000},
+        ]
+
+        fitted = window.fit(messages)
+
+        assert fitted[-2:] == messages[-2:]
+        assert "omitted" in fitted[1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_tool_results_are_fitted_before_next_call(self):
+        """Test that messages added in the tool loop are fitted before the follow-up call."""
+        agent = Agent(AgentConfig(
+            name="researcher", description="Researcher", prompt_template="You research.",
+            context_policy=ContextPolicy(summarize=False)
+        ))
+        brain = _brain(max_context_length=1000)
+        brain.config.streaming = False
+        brain.generate_response = AsyncMock(side_effect=[
+            Mock(content="", tool_calls=[{"id": "call_1", "type": "function",
+                                         "function": {"name": "web_search", "arguments": "{}"}}]),
+            Mock(content="done", tool_calls=None),
+        ])
+        agent.brain = agent.context_window.brain = brain
+        agent.tool_manager = Mock()
+        agent.tool_manager.execute_tool_calls = AsyncMock(return_value=[
+            {"role": "tool", "tool_call_id": "call_1", "name": "web_search", "content": "x" * 2400}
+        ])
+
+        assert await agent.generate_response(_messages(4)) == "done"
+
+        first, second = [call.kwargs["messages"] for call in brain.generate_response.await_args_list]
+        assert len(first) == 5
+        assert "omitted" in second[1]["content"]
+        assert second[-1]["role"] == "tool" and second[-2]["tool_calls"][0]["id"] == "call_1"
+        assert sum(agent.context_window.estimate_tokens(m) for m in second) <= 1000
+
+    @pytest.mark.asyncio
+    async def test_tool_loop_does_not_move_summary_past_the_task_log(self):
+        """Test that a turn after a tool loop still sends the last answer and the follow-up."""
+        agent = Agent(AgentConfig(
+            name="researcher", description="Researcher", prompt_template="You research.",
+            context_policy=ContextPolicy(tail_messages=2, chars_per_token=1)
+        ))
+        brain = _brain(max_context_length=400)
+        brain.config.streaming = False
+        tool_call = Mock(content="", tool_calls=[{"id": "call_1", "type": "function",
+                                                   "function": {"name": "web_search", "arguments": "{}"}}])
+        replies = [tool_call, tool_call, Mock(content="the answer", tool_calls=None),
+                   Mock(content="done", tool_calls=None)]
+        sent = []
+
+        async def generate_response(messages, **kwargs):
+            if "tools" not in kwargs:  # Compaction
+                return Mock(content="the summary", finish_reason="stop")
+            sent.append(messages)
+            return replies.pop(0)
+
+        brain.generate_response = generate_response
+        agent.brain = agent.context_window.brain = brain
+        agent.tool_manager = Mock()
+        agent.tool_manager.execute_tool_calls = AsyncMock(return_value=[
+            {"role": "tool", "tool_call_id": "call_1", "name": "web_search", "content": "x" * 160}
+        ])
+
+        log = [{"role": "user", "content": "initial prompt"}, {"role": "user", "content": "find sources"}]
+        assert await agent.generate_response(log) == "the answer"
+        if agent.context_window._pending:
+            await agent.context_window._pending
+
+        log += [{"role": "assistant", "content": "the answer"}, {"role": "user", "content": "follow-up"}]
+        assert await agent.generate_response(log) == "done"
+
+        contents = [m["content"] for m in sent[-1]]
+        assert "the answer" in contents and contents[-1] == "follow-up"
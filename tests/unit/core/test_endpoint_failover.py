@@ -0,0 +1,170 @@
+"""
+Unit tests for health-based failover between equivalent LLM endpoints.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig, EndpointConfig, FailoverConfig, RetryPolicy
+from agentx.core.endpoint_router import EndpointRouter, reset_endpoint_health
+from agentx.core.llm_provider import set_llm_provider
+from agentx.core.rate_limiter import set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    reset_endpoint_health()
+    set_rate_limiter(None)
+    set_llm_provider(None)
+    yield
+    reset_endpoint_health()
+    set_rate_limiter(None)
+
+
+class StubServer:
+    """Local OpenAI-compatible endpoint that answers with a fixed status."""
+
+    def __init__(self, status=200, content="ok"):
+        self.status = status
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.requests.append(json.loads(body))
+                if stub.status != 200:
+                    payload = {"error": {"message": "unavailable", "type": "server_error"}}
+                else:
+                    payload = {
+                        "id": "chatcmpl-1", "object": "chat.completion", "created": int(time.time()),
+                        "model": "stub-model",
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": content}}],
+                        "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4}
+                    }
+                data = json.dumps(payload).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(status=200, content="ok"):
+        server = StubServer(status, content)
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def _config(primary_url, *fallback_urls, **failover):
+    return BrainConfig(
+        provider="openai", model="stub-model", api_key="test-key", base_url=primary_url,
+        supports_function_calls=False, retry_policy=RetryPolicy(max_retries=0),
+        failover=FailoverConfig(
+            endpoints=[EndpointConfig(model="stub-model", api_key="test-key", base_url=url) for url in fallback_urls],
+            **failover
+        )
+    )
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class TestFailover:
+    """Test failover through Brain against local stub endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_and_routes_around_open_circuit(self, servers):
+        """Test that a failing endpoint is skipped within the call and, once its circuit opens, for later calls."""
+        down = servers(status=503)
+        up = servers(content="from backup")
+        brain = Brain(_config(down.url, up.url, failure_threshold=1, cooldown_seconds=60))
+
+        first = await brain.generate_response(MESSAGES)
+        second = await brain.generate_response(MESSAGES)
+
+        assert first.content == "from backup"
+        assert second.content == "from backup"
+        assert len(down.requests) == 1
+        assert len(up.requests) == 2
+        assert brain.get_call_stats()["failovers"] == 1
+        stats = brain.get_endpoint_stats()
+        assert stats[f"openai/stub-model @ {down.url}"]["circuit"] == "open"
+        assert stats[f"openai/stub-model @ {up.url}"]["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_conversation_is_resent_to_backup(self, servers):
+        """Test that the backup endpoint receives the full conversation."""
+        down = servers(status=503)
+        up = servers()
+        brain = Brain(_config(down.url, up.url))
+        history = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"},
+                   {"role": "user", "content": "continue"}]
+
+        await brain.generate_response(history, system_prompt="Be brief.")
+
+        assert up.requests[0]["messages"] == down.requests[0]["messages"]
+        assert [m["content"] for m in up.requests[0]["messages"][1:4]] == ["hi", "hello", "continue"]
+
+
+class TestEndpointRouter:
+    """Test endpoint selection and circuit breaking."""
+
+    def test_circuit_half_opens_after_cooldown(self):
+        """Test that an open circuit allows one trial request after the cooldown and closes on success."""
+        router = EndpointRouter(_config("http://a", "http://b", failure_threshold=2, cooldown_seconds=0.05))
+        router.record(0, failed=True)
+        assert router.choose() == 0
+        router.record(0, failed=True)
+        assert router.choose() == 1
+
+        time.sleep(0.06)
+        assert router.choose() == 0  # The trial request
+        assert router.choose() == 1  # No second trial while the first is in flight
+        router.record(0, latency=0.1)
+        assert router.get_stats()["openai/stub-model @ http://a"]["circuit"] == "closed"
+
+    def test_ordered_routing_skips_slow_endpoint(self):
+        """Test that ordered routing passes over an endpoint much slower than another healthy one."""
+        router = EndpointRouter(_config("http://a", "http://b", slow_factor=2.0))
+        for _ in range(5):
+            router.record(0, latency=3.0)
+            router.record(1, latency=0.5)
+
+        assert router.choose() == 1
+        assert router.choose(exclude=[1]) == 0
+
+    def test_weighted_routing_favours_weight(self):
+        """Test that weighted routing splits traffic by configured weight."""
+        config = _config("http://a", "http://b", strategy="weighted")
+        config.failover.endpoints[0].weight = 9.0
+        router = EndpointRouter(config)
+
+        picks = [router.choose() for _ in range(500)]
+
+        assert picks.count(1) > picks.count(0) * 3
@@ -0,0 +1,107 @@
+"""
+Unit tests for shared LLM HTTP clients and memoized capability checks.
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from agentx.core import brain as brain_module
+from agentx.core import http_pool
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig
+from agentx.core.http_pool import POOL_ENV, get_pooled_client, warm_connections
+from agentx.core.llm_provider import set_llm_provider
+from agentx.core.rate_limiter import set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(http_pool, "_clients", {})
+    monkeypatch.setattr(brain_module, "_function_calling_support", {})
+    monkeypatch.delenv(POOL_ENV, raising=False)
+    set_llm_provider(None)
+    set_rate_limiter(None)
+    yield
+    set_llm_provider(None)
+    set_rate_limiter(None)
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route pooled clients through an in-memory transport that records requests."""
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+    requests = []
+
+    def handle(request):
+        requests.append(request)
+        return httpx.Response(200, json={
+            "id": "r1", "object": "chat.completion", "created": 1, "model": "deepseek-chat",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "pong"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        })
+
+    def create_client(provider, base_url, api_key):
+        handler = AsyncHTTPHandler(timeout=30)
+        handler.client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        return handler, handler.client
+
+    monkeypatch.setattr(http_pool, "_create_client", create_client)
+    return requests
+
+
+class TestPooledClients:
+    """Test that brains share connection pools."""
+
+    @pytest.mark.asyncio
+    async def test_brains_share_one_client_per_endpoint(self):
+        """Test that brains on the same provider endpoint reuse one client."""
+        agent_brain = Brain(BrainConfig(provider="deepseek", model="deepseek-chat"))
+        routing_brain = Brain(BrainConfig(provider="deepseek", model="deepseek-chat", temperature=0.0, max_tokens=100))
+
+        first = agent_brain._prepare_call_params([{"role": "user", "content": "hi"}])["client"]
+        second = routing_brain._prepare_call_params([{"role": "user", "content": "hi"}])["client"]
+
+        assert first is second
+        assert get_pooled_client(BrainConfig(provider="deepseek", base_url="https://other.example.com")) is not first
+
+    @pytest.mark.asyncio
+    async def test_pooling_can_be_disabled(self, monkeypatch):
+        """Test the opt-out and providers without a pooled client."""
+        assert get_pooled_client(BrainConfig(provider="ollama", model="llama3")) is None
+        monkeypatch.setenv(POOL_ENV, "0")
+        assert get_pooled_client(BrainConfig(provider="deepseek")) is None
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_pooled_client(self, mock_transport):
+        """Test that litellm sends the request over the shared client."""
+        brain = Brain(BrainConfig(provider="deepseek", model="deepseek-chat", api_key="test-key",
+                                  supports_function_calls=False))
+
+        response = await brain.generate_response([{"role": "user", "content": "ping"}])
+
+        assert response.content == "pong"
+        assert [str(r.url) for r in mock_transport] == ["https://api.deepseek.com/chat/completions"]
+
+    @pytest.mark.asyncio
+    async def test_warm_connections(self, mock_transport):
+        """Test that warming contacts each distinct endpoint once."""
+        configs = [BrainConfig(provider="deepseek"), BrainConfig(provider="deepseek", temperature=0.0)]
+
+        assert await warm_connections(configs) == 1
+        assert [r.method for r in mock_transport] == ["HEAD"]
+
+
+class TestCapabilityMemoization:
+    """Test that function calling support is looked up once per model."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_shared_across_brains(self):
+        """Test that new brains on a known model skip the litellm lookup."""
+        with patch("litellm.supports_function_calling", return_value=False) as lookup:
+            brains = [Brain(BrainConfig(provider="deepseek", model="deepseek-chat")) for _ in range(3)]
+            for brain in brains:
+                await brain._ensure_initialized()
+
+        assert lookup.call_count == 1
+        assert all(not brain.config.supports_function_calls for brain in brains)
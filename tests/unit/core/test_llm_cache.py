@@ -0,0 +1,126 @@
+"""
+Unit tests for the persistent LLM response cache.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig, ResponseCacheConfig
+from agentx.core.llm_cache import ResponseCache, cache_key
+
+
+@pytest.fixture
+def cache_config(temp_dir):
+    """Fixture for cache settings in a temporary directory."""
+    return ResponseCacheConfig(directory=str(temp_dir / "llm_cache"))
+
+
+class TestResponseCache:
+    """Test the on-disk store."""
+
+    def test_key_ignores_transport_settings(self):
+        """Test that credentials and timeouts don't affect the key, but the request does."""
+        request = {"model": "deepseek/deepseek-chat", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.7}
+
+        assert cache_key({**request, "api_key": "a", "timeout": 5}) == cache_key({**request, "api_key": "b"})
+        assert cache_key(request) != cache_key({**request, "temperature": 0.0})
+        assert cache_key(request) != cache_key({**request, "stream": True})
+
+    def test_entries_persist_across_instances(self, cache_config):
+        """Test that a new cache over the same directory serves stored entries."""
+        ResponseCache(cache_config).put("k", {"model": "m", "response": {"content": "hello"}})
+
+        cache = ResponseCache(cache_config)
+        assert cache.get("k")["response"]["content"] == "hello"
+        assert cache.get("other") is None
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_expired_entries_are_dropped(self, cache_config):
+        """Test that entries older than the TTL are misses."""
+        cache = ResponseCache(cache_config.model_copy(update={"ttl_seconds": -1}))
+        cache.put("k", {"model": "m"})
+
+        assert cache.get("k") is None
+        assert not list(cache.directory.glob("*.json"))
+
+    def test_least_recently_used_entry_is_evicted(self, cache_config):
+        """Test that the size budget evicts the entry accessed longest ago."""
+        payload = "x" * 400
+        cache = ResponseCache(cache_config.model_copy(update={"max_size_mb": 1100 / (1024 * 1024)}))
+        cache.put("a", {"data": payload})
+        cache.put("b", {"data": payload})
+        cache._index["a"][1] += 10  # "a" was read more recently than "b"
+
+        cache.put("c", {"data": payload})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats["evictions"] == 1
+
+
+def _completion(content):
+    message = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(
+        model="deepseek-chat",
+        choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        usage=SimpleNamespace(dict=lambda: {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12})
+    )
+
+
+def _stream(*parts):
+    async def stream():
+        for part in parts:
+            delta = SimpleNamespace(content=part, tool_calls=None)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)], model="deepseek-chat", usage=None)
+        delta = SimpleNamespace(content=None, tool_calls=None)
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason="stop")], model="deepseek-chat", usage=None)
+    return stream()
+
+
+class TestBrainResponseCache:
+    """Test that Brain serves identical requests from the cache."""
+
+    def _brain(self, cache_config):
+        return Brain(BrainConfig(model="deepseek-chat", supports_function_calls=False, response_cache=cache_config))
+
+    @pytest.mark.asyncio
+    async def test_generate_response_hit_reports_no_usage(self, cache_config):
+        """Test that a repeated request skips the provider and is reported as a cache hit."""
+        brain = self._brain(cache_config)
+        usage_events = []
+        brain.add_usage_callback(lambda model, usage, response: usage_events.append(usage))
+        messages = [{"role": "user", "content": "hi"}]
+
+        with patch("litellm.acompletion", new=AsyncMock(return_value=_completion("hello"))) as acompletion:
+            first = await brain.generate_response(messages)
+            second = await brain.generate_response(messages)
+
+        assert acompletion.await_count == 1
+        assert second.content == first.content == "hello"
+        assert second.usage["cache_hit"] is True
+        assert usage_events[-1]["total_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_is_replayed_as_chunks(self, cache_config):
+        """Test that a cached stream yields the same chunks without calling the provider."""
+        brain = self._brain(cache_config)
+        messages = [{"role": "user", "content": "hi"}]
+
+        with patch("litellm.acompletion", new=AsyncMock(side_effect=lambda **_: _stream("hel", "lo"))) as acompletion:
+            live = [chunk async for chunk in brain.stream_response(messages)]
+            replayed = [chunk async for chunk in brain.stream_response(messages)]
+
+        assert acompletion.await_count == 1
+        assert [c["content"] for c in replayed if c["type"] == "text-delta"] == ["hel", "lo"]
+        assert [c["type"] for c in replayed] == [c["type"] for c in live]
+        assert replayed[-1]["usage"]["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, monkeypatch):
+        """Test that Brain does not cache unless configured."""
+        monkeypatch.delenv("AGENTX_LLM_CACHE_DIR", raising=False)
+
+        assert Brain(BrainConfig()).response_cache is None
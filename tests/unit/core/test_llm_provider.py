@@ -0,0 +1,99 @@
+"""
+Unit tests for the record/replay LLM provider layer.
+"""
+
+import asyncio
+import time
+import litellm
+import pytest
+from litellm.types.utils import ModelResponseStream
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig
+from agentx.core.llm_provider import (
+    LLMProvider, RecordingProvider, ReplayProvider, TraceMissError, trace_key
+)
+
+
+class ScriptedProvider(LLMProvider):
+    """Test provider that answers like a live model, with a delay between chunks."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def acompletion(self, **params):
+        self.calls += 1
+        if params.get("stream"):
+            return self._stream()
+        return litellm.ModelResponse(
+            model="deepseek-chat",
+            choices=[{"index": 0, "message": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}],
+            usage={"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}
+        )
+
+    async def _stream(self):
+        for part, finish in (("hel", None), ("lo", None), (None, "stop")):
+            await asyncio.sleep(self.delay)
+            yield ModelResponseStream(
+                model="deepseek-chat",
+                choices=[{"index": 0, "delta": {"content": part}, "finish_reason": finish}]
+            )
+
+
+def _brain(provider):
+    return Brain(BrainConfig(model="deepseek-chat", supports_function_calls=False), provider=provider)
+
+
+class TestRecordReplay:
+    """Test that recorded runs replay offline."""
+
+    @pytest.mark.asyncio
+    async def test_generate_response_round_trip(self, temp_dir):
+        """Test that a recorded completion is replayed without the live provider."""
+        trace = temp_dir / "trace.jsonl"
+        live = ScriptedProvider()
+        messages = [{"role": "user", "content": "hi"}]
+
+        recorded = await _brain(RecordingProvider(trace, live)).generate_response(messages, system_prompt="Be brief.")
+        replayed = await _brain(ReplayProvider(trace)).generate_response(messages, system_prompt="Be brief.")
+
+        assert live.calls == 1
+        assert replayed.content == recorded.content == "hello"
+        assert replayed.usage["total_tokens"] == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_chunks_with_latency(self, temp_dir):
+        """Test that stream chunks replay in order and can reproduce recorded timing."""
+        trace = temp_dir / "trace.jsonl"
+        messages = [{"role": "user", "content": "hi"}]
+        recorder = _brain(RecordingProvider(trace, ScriptedProvider(delay=0.02)))
+        [chunk async for chunk in recorder.stream_response(messages)]
+
+        start = time.perf_counter()
+        replayed = [chunk async for chunk in _brain(ReplayProvider(trace, reproduce_latency=True)).stream_response(messages)]
+        elapsed = time.perf_counter() - start
+
+        assert [c["content"] for c in replayed if c["type"] == "text-delta"] == ["hel", "lo"]
+        assert replayed[-1]["type"] == "finish"
+        assert elapsed >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request_is_a_miss(self, temp_dir):
+        """Test that replay fails loudly for requests not in the trace."""
+        trace = temp_dir / "trace.jsonl"
+        await RecordingProvider(trace, ScriptedProvider()).acompletion(model="m", messages=[{"role": "user", "content": "a"}])
+
+        with pytest.raises(TraceMissError):
+            await ReplayProvider(trace).acompletion(model="m", messages=[{"role": "user", "content": "b"}])
+
+    def test_prompt_timestamp_does_not_affect_key(self):
+        """Test that the current time Brain sends with each request is ignored for matching."""
+        def request(when):
+            return {"model": "m", "messages": [
+                {"role": "system", "content": "Be brief."},
+                {"role": "user", "content": "hi"},
+                {"role": "user", "content": f"Current date and time: {when}\nRound: 2"}
+            ]}
+
+        assert trace_key(request("Monday, 09:00 AM")) == trace_key(request("Tuesday, 10:30 PM"))
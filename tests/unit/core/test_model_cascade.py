@@ -0,0 +1,138 @@
+"""
+Unit tests for the per-agent model cascade in Brain.
+"""
+
+import litellm
+import pytest
+from litellm.types.utils import ModelResponseStream
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig, CascadeConfig, RetryPolicy
+from agentx.core.llm_provider import LLMProvider
+from agentx.core.rate_limiter import set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    set_rate_limiter(None)
+    yield
+    set_rate_limiter(None)
+
+
+TOOLS = [{"type": "function", "function": {"name": "search", "parameters": {"type": "object", "properties": {}}}}]
+MESSAGES = [{"role": "user", "content": "find it"}]
+
+
+class TieredProvider(LLMProvider):
+    """Answers each model with a scripted message: (content, tool call arguments or None)."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.requests = []
+
+    async def acompletion(self, **params):
+        self.requests.append(params)
+        content, arguments = self.answers[params["model"]]
+        tool_calls = None
+        if arguments is not None:
+            tool_calls = [{"id": "call_1", "type": "function", "function": {"name": "search", "arguments": arguments}}]
+        if params.get("stream"):
+            return self._stream(params["model"], content, tool_calls)
+        return litellm.ModelResponse(
+            model=params["model"],
+            choices=[{"index": 0, "finish_reason": "tool_calls" if tool_calls else "stop",
+                      "message": {"role": "assistant", "content": content, "tool_calls": tool_calls}}],
+            usage={"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12}
+        )
+
+    async def _stream(self, model, content, tool_calls):
+        delta = {"content": content} if content else {"tool_calls": [{**tool_calls[0], "index": 0}]}
+        yield ModelResponseStream(model=model, choices=[{"index": 0, "delta": delta}])
+        yield ModelResponseStream(model=model, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+
+
+def _brain(provider, **cascade):
+    config = BrainConfig(
+        model="deepseek-reasoner",
+        retry_policy=RetryPolicy(max_retries=0),
+        cascade=CascadeConfig(models=["deepseek-chat"], **cascade)
+    )
+    brain = Brain(config, provider=provider)
+    brain.initialized = True  # Skip the litellm capability lookup
+    return brain
+
+
+class TestCascade:
+    """Test escalation between cascade tiers."""
+
+    @pytest.mark.asyncio
+    async def test_good_cheap_answer_is_kept(self):
+        """Test that a valid answer from the cheap tier is returned without calling the main model."""
+        provider = TieredProvider({"deepseek/deepseek-chat": (None, '{"query": "x"}')})
+        brain = _brain(provider)
+
+        response = await brain.generate_response(MESSAGES, system_prompt="Be brief.", tools=TOOLS)
+
+        assert [r["model"] for r in provider.requests] == ["deepseek/deepseek-chat"]
+        assert response.tool_calls[0].function.name == "search"
+        assert "[LOW_CONFIDENCE]" in provider.requests[0]["messages"][0]["content"]
+        assert brain.get_cascade_stats()["deepseek-chat"]["accepted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_tool_arguments_escalate(self):
+        """Test that unparseable tool arguments send the turn to the main model."""
+        provider = TieredProvider({
+            "deepseek/deepseek-chat": (None, '{"query": '),
+            "deepseek/deepseek-reasoner": (None, '{"query": "x"}')
+        })
+        brain = _brain(provider)
+
+        response = await brain.generate_response(MESSAGES, system_prompt="Be brief.", tools=TOOLS)
+
+        assert [r["model"] for r in provider.requests] == ["deepseek/deepseek-chat", "deepseek/deepseek-reasoner"]
+        assert response.model == "deepseek/deepseek-reasoner"
+        assert provider.requests[1]["messages"][0]["content"] == "Be brief."
+        stats = brain.get_cascade_stats()
+        assert stats["deepseek-chat"]["escalation_reasons"] == {"invalid_tool_arguments": 1}
+        assert stats["deepseek-reasoner"]["calls"] == 1
+        assert stats["deepseek-chat"]["prompt_tokens"] == 10
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_and_empty_answers_escalate(self):
+        """Test that a low-confidence marker or an empty answer escalates."""
+        for cheap_answer, reason in [("[LOW_CONFIDENCE]", "low_confidence"), ("  ", "empty_response")]:
+            provider = TieredProvider({
+                "deepseek/deepseek-chat": (cheap_answer, None),
+                "deepseek/deepseek-reasoner": ("the answer", None)
+            })
+            brain = _brain(provider)
+
+            response = await brain.generate_response(MESSAGES)
+
+            assert response.content == "the answer"
+            assert brain.get_cascade_stats()["deepseek-chat"]["escalation_reasons"] == {reason: 1}
+
+    @pytest.mark.asyncio
+    async def test_disabled_checks_do_not_escalate(self):
+        """Test that only the configured checks trigger escalation."""
+        provider = TieredProvider({"deepseek/deepseek-chat": ("[LOW_CONFIDENCE]", None)})
+        brain = _brain(provider, escalate_on=["empty_response"])
+
+        response = await brain.generate_response(MESSAGES, system_prompt="Be brief.")
+
+        assert response.content == "[LOW_CONFIDENCE]"
+        assert provider.requests[0]["messages"][0]["content"] == "Be brief."
+
+    @pytest.mark.asyncio
+    async def test_stream_hides_rejected_tier(self):
+        """Test that a streamed answer from a rejected tier is never yielded."""
+        provider = TieredProvider({
+            "deepseek/deepseek-chat": ("[LOW_CONFIDENCE]", None),
+            "deepseek/deepseek-reasoner": ("the answer", None)
+        })
+        brain = _brain(provider)
+
+        chunks = [chunk async for chunk in brain.stream_response(MESSAGES)]
+
+        assert [c["content"] for c in chunks if c["type"] == "text-delta"] == ["the answer"]
+        assert brain.get_cascade_stats()["deepseek-reasoner"]["accepted"] == 1
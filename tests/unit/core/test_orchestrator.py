@@ -5,9 +5,16 @@ import json
 
 from agentx.core.orchestrator import Orchestrator
 from agentx.core.task import Task
-from agentx.core.config import TeamConfig, AgentConfig, BrainConfig
+from agentx.core.config import TeamConfig, AgentConfig, BrainConfig, CascadeConfig, FailoverConfig, ResponseCacheConfig
 from agentx.core.agent import Agent
 
+@pytest.fixture(autouse=True)
+def clear_routing_cache():
+    """Keep cached routing decisions from leaking between tests."""
+    Orchestrator.clear_decision_cache()
+    yield
+    Orchestrator.clear_decision_cache()
+
 @pytest.fixture
 def mock_task():
     """Fixture for a mock Task object."""
@@ -206,4 +213,217 @@ class TestAgentRouting:
 
 
 
- 
\ No newline at end of file
+ 
+
+class TestParallelDispatch:
+    """Test PARALLEL routing decisions."""
+
+    def _orchestrator(self, mock_task, content, mode="parallel"):
+        mock_task.team_config.execution = {"mode": mode}
+        orchestrator = Orchestrator(mock_task)
+        orchestrator.routing_brain = Mock()
+        orchestrator.routing_brain.generate_response = AsyncMock(return_value=Mock(content=content))
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_parallel_decision_keeps_valid_branches_in_order(self, mock_task):
+        """Test that branches are validated and returned in the brain's order."""
+        orchestrator = self._orchestrator(mock_task, json.dumps({
+            "action": "PARALLEL",
+            "next_agent": "agent1",
+            "branches": [
+                {"agent": "agent2", "goal": "find prices"},
+                {"agent": "unknown", "goal": "ignored"},
+                {"agent": "agent1", "goal": "find reviews"}
+            ]
+        }))
+
+        decision = await orchestrator.determine_handoff({"current_agent": "agent1"}, "split it up")
+
+        assert decision["action"] == "PARALLEL"
+        assert decision["next_agent"] == "agent1"
+        assert [b["agent"] for b in decision["branches"]] == ["agent2", "agent1"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_decision_ignored_outside_parallel_mode(self, mock_task):
+        """Test that sequential teams never fan out."""
+        orchestrator = self._orchestrator(mock_task, json.dumps({
+            "action": "PARALLEL",
+            "branches": [{"agent": "agent2", "goal": "find prices"}]
+        }), mode="autonomous")
+
+        decision = await orchestrator.determine_handoff({"current_agent": "agent1"}, "split it up")
+
+        assert decision["action"] == "CONTINUE"
+        assert "PARALLEL" not in orchestrator._build_prompt("agent1", "", ["agent2"])
+
+
+class TestRoutingRules:
+    """Test declarative routing rules."""
+
+    def _orchestrator(self, mock_task, rules):
+        mock_task.team_config.orchestrator = {"rules": rules}
+        orchestrator = Orchestrator(mock_task)
+        orchestrator.routing_brain = Mock()
+        orchestrator.routing_brain.generate_response = AsyncMock(
+            return_value=Mock(content='{"action": "CONTINUE", "next_agent": "agent1"}')
+        )
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_first_matching_rule_skips_llm(self, mock_task):
+        """Test that a matching rule decides without calling the routing brain."""
+        orchestrator = self._orchestrator(mock_task, [
+            {"after": "agent2", "to": "agent1"},
+            {"after": "agent1", "contains": ["done", "finished"], "action": "complete"},
+            {"after": "agent1", "to": "agent2"},
+        ])
+
+        decision = await orchestrator.decide_next_step({"current_agent": "agent1"}, "All DONE here")
+
+        assert decision["action"] == "COMPLETE"
+        assert decision["reason"] == "Routing rule 1 matched"
+        orchestrator.routing_brain.generate_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_regex_rule_and_llm_fallback(self, mock_task):
+        """Test regex matching and fallback to the routing brain when nothing matches."""
+        orchestrator = self._orchestrator(mock_task, [
+            {"matches": r"(?i)needs\s+review", "to": "agent2"},
+        ])
+
+        handoff = await orchestrator.decide_next_step({"current_agent": "agent1"}, "Draft Needs Review")
+        fallback = await orchestrator.decide_next_step({"current_agent": "agent1"}, "still drafting")
+
+        assert handoff["action"] == "HANDOFF"
+        assert handoff["next_agent"] == "agent2"
+        assert fallback["action"] == "CONTINUE"
+        assert orchestrator.routing_brain.generate_response.await_count == 1
+        stats = orchestrator.get_routing_stats()
+        assert stats["rule"] == 1
+        assert stats["llm"] == 1
+        assert stats["llm_avoided_rate"] == 0.5
+
+    def test_handoff_rule_requires_target(self, mock_task):
+        """Test that a handoff rule without a target is rejected."""
+        with pytest.raises(ValueError):
+            self._orchestrator(mock_task, [{"after": "agent1"}])
+
+
+class TestRoutingProfile:
+    """Test the low-latency routing brain profile and decision handling."""
+
+    def _orchestrator(self, mock_task, content):
+        orchestrator = Orchestrator(mock_task)
+        orchestrator.routing_brain = Mock()
+        orchestrator.routing_brain.generate_response = AsyncMock(return_value=Mock(content=content))
+        return orchestrator
+
+    def test_profile_overrides_agent_budget(self, mock_task):
+        """Test that routing uses a small, deterministic profile of the agent's model."""
+        mock_task.agents["agent1"].config.brain_config = BrainConfig(model="deepseek-chat", max_tokens=4000)
+        mock_task.team_config.orchestrator = {"llm_config": {"timeout": 5}}
+        orchestrator = Orchestrator(mock_task)
+
+        config = orchestrator._routing_brain_config(mock_task.team_config.orchestrator)
+
+        assert config.model == "deepseek-chat"
+        assert config.max_tokens == 100
+        assert config.temperature == 0.0
+        assert config.timeout == 5
+        assert config.supports_function_calls is False
+
+    def test_profile_does_not_inherit_cascade_or_failover(self, mock_task):
+        """Test that routing calls go straight to the agent's model."""
+        mock_task.agents["agent1"].config.brain_config = BrainConfig(
+            model="deepseek-chat",
+            api_key="sk-test",
+            cascade=CascadeConfig(models=["deepseek/deepseek-lite"]),
+            failover=FailoverConfig(),
+            response_cache=ResponseCacheConfig()
+        )
+        mock_task.team_config.orchestrator = None
+        orchestrator = Orchestrator(mock_task)
+
+        config = orchestrator._routing_brain_config(None)
+
+        assert config.model == "deepseek-chat" and config.api_key == "sk-test"
+        assert config.cascade is None and config.failover is None
+        assert config.response_cache is None
+
+    @pytest.mark.asyncio
+    async def test_json_wrapped_in_text_is_parsed(self, mock_task):
+        """Test that a decision surrounded by prose or code fences still parses."""
+        orchestrator = self._orchestrator(
+            mock_task, 'Sure:\n```json\n{"action": "handoff", "next_agent": "agent2"}\n```'
+        )
+
+        decision = await orchestrator.determine_handoff({"current_agent": "agent1"}, "draft ready")
+
+        assert decision["action"] == "HANDOFF"
+        assert decision["next_agent"] == "agent2"
+        assert orchestrator.routing_brain.generate_response.call_args.kwargs["json_mode"] is True
+        assert orchestrator.get_routing_stats()["llm_latency_last_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent_falls_back_to_continue(self, mock_task):
+        """Test that a handoff to a non-existent agent does not derail the task."""
+        orchestrator = self._orchestrator(mock_task, '{"action": "HANDOFF", "next_agent": "ghost"}')
+
+        decision = await orchestrator.determine_handoff({"current_agent": "agent1"}, "draft ready")
+
+        assert decision["action"] == "CONTINUE"
+        assert orchestrator.routing_stats["llm_error"] == 1
+
+    @pytest.mark.asyncio
+    async def test_decisions_cached_by_agent_and_response(self, mock_task):
+        """Test that an identical turn reuses the cached decision across orchestrators."""
+        first = self._orchestrator(mock_task, '{"action": "HANDOFF", "next_agent": "agent2"}')
+        second = self._orchestrator(mock_task, '{"action": "COMPLETE"}')
+
+        await first.determine_handoff({"current_agent": "agent1"}, "draft ready")
+        cached = await second.determine_handoff({"current_agent": "agent1"}, "draft ready")
+        other = await second.determine_handoff({"current_agent": "agent1"}, "something else")
+
+        assert cached["action"] == "HANDOFF"
+        assert other["action"] == "COMPLETE"
+        assert second.routing_stats["cache"] == 1
+        assert second.routing_brain.generate_response.await_count == 1
+
+
+    @pytest.mark.asyncio
+    async def test_decisions_cached_by_prompt_sent(self, mock_task):
+        """Test that responses differing only past the part sent to the router share a decision."""
+        orchestrator = self._orchestrator(mock_task, '{"action": "COMPLETE"}')
+        draft = "x" * 400
+
+        await orchestrator.determine_handoff({"current_agent": "agent1"}, draft + " first ending")
+        await orchestrator.determine_handoff({"current_agent": "agent1"}, draft + " second ending")
+
+        assert orchestrator.routing_stats["cache"] == 1
+        assert orchestrator.routing_brain.generate_response.await_count == 1
+
+class TestNextAgentPrediction:
+    """Test next-agent prediction from observed handoffs."""
+
+    def test_predicts_most_frequent_successor(self, orchestrator_with_task):
+        """Test that the dominant observed transition is predicted."""
+        orchestrator = orchestrator_with_task
+        assert orchestrator.predict_next_agent("agent1") is None
+
+        orchestrator.observe_transition("agent1", {"action": "HANDOFF", "next_agent": "agent2"})
+        orchestrator.observe_transition("agent1", {"action": "HANDOFF", "next_agent": "agent2"})
+        orchestrator.observe_transition("agent1", {"action": "CONTINUE"})
+        orchestrator.observe_transition("agent1", {"action": "COMPLETE"})
+
+        assert orchestrator.transition_counts["agent1"] == {"agent2": 2, "agent1": 1}
+        assert orchestrator.predict_next_agent("agent1") == "agent2"
+
+    def test_no_prediction_without_majority(self, orchestrator_with_task):
+        """Test that an evenly split history yields no prediction below the share threshold."""
+        orchestrator = orchestrator_with_task
+        orchestrator.observe_transition("agent1", {"action": "HANDOFF", "next_agent": "agent2"})
+        orchestrator.observe_transition("agent1", {"action": "CONTINUE"})
+        orchestrator.observe_transition("agent1", {"action": "HANDOFF", "next_agent": "agent3"})
+
+        assert orchestrator.predict_next_agent("agent1") is None
@@ -0,0 +1,168 @@
+"""
+Unit tests for parallel fan-out/fan-in agent execution.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from agentx.core.agent import Agent
+from agentx.core.config import AgentConfig, BrainConfig, ContextPolicy
+from agentx.core.task import Task, TaskExecutor
+from agentx.core.message import TaskStep, TextPart
+
+
+def _agent(name, delay, running):
+    async def generate_response(messages, system_prompt=None, orchestrator=None, turn_context=None, context_window=None):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(delay)
+        running["now"] -= 1
+        running.setdefault("seen", {})[name] = len(messages)
+        return f"{name} done"
+
+    agent = Mock()
+    agent.name = name
+    agent.build_system_prompt = Mock(return_value="system")
+    agent.generate_response = generate_response
+    return agent
+
+
+@pytest.fixture
+def executor(temp_dir):
+    """Fixture for a TaskExecutor wired to a bare task and mock agents."""
+    team_config = Mock()
+    team_config.max_rounds = 10
+    task = Task(team_config=team_config, config_dir=temp_dir, workspace_dir=temp_dir / "ws")
+    task.add_step(TaskStep(agent_name="user", parts=[TextPart(text="compare laptops")]))
+    task.current_agent = "lead"
+
+    executor = TaskExecutor.__new__(TaskExecutor)
+    executor.task = task
+    executor.orchestrator = Mock()
+    executor.orchestrator.get_execution_setting = Mock(return_value=2)
+    return executor
+
+
+class TestParallelBranches:
+    """Test branch dispatch, bounded concurrency and deterministic merge."""
+
+    @pytest.mark.asyncio
+    async def test_branches_merge_in_decision_order(self, executor):
+        """Test that results merge in branch order regardless of finish order."""
+        running = {"now": 0, "peak": 0}
+        executor.task.agents = {
+            "lead": _agent("lead", 0, running),
+            "slow": _agent("slow", 0.05, running),
+            "fast": _agent("fast", 0.0, running),
+        }
+        decision = {
+            "action": "PARALLEL",
+            "next_agent": "lead",
+            "branches": [
+                {"agent": "slow", "goal": "find prices"},
+                {"agent": "fast", "goal": "find reviews"},
+            ]
+        }
+
+        events = [event async for event in executor._run_parallel_branches(decision)]
+
+        types = [event["type"] for event in events]
+        assert types[0] == "event_parallel_start"
+        assert types.count("event_parallel_sync") == 2
+        assert [step.agent_name for step in executor.task.history[1:]] == ["slow", "fast"]
+        assert executor.task.history[1].parts[0].text == "find prices\n\nslow done"
+        # Each branch sees the shared history plus only its own sub-goal
+        assert running["seen"] == {"slow": 2, "fast": 2}
+        assert executor.task.current_agent == "lead"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, executor):
+        """Test that no more than max_parallel_agents branches run at once."""
+        running = {"now": 0, "peak": 0}
+        names = [f"agent{i}" for i in range(5)]
+        executor.task.agents = {name: _agent(name, 0.01, running) for name in names}
+        decision = {
+            "action": "PARALLEL",
+            "next_agent": "agent0",
+            "branches": [{"agent": name, "goal": ""} for name in names]
+        }
+
+        async for _ in executor._run_parallel_branches(decision):
+            pass
+
+        assert running["peak"] == 2
+        assert len(executor.task.history) == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_branch_is_merged_as_error(self, executor):
+        """Test that one failing branch does not discard the others' results."""
+        running = {"now": 0, "peak": 0}
+
+        async def failing_response(messages, system_prompt=None, orchestrator=None, turn_context=None, context_window=None):
+            raise ConnectionError("provider down")
+
+        broken = _agent("broken", 0, running)
+        broken.generate_response = failing_response
+        executor.task.agents = {
+            "lead": _agent("lead", 0, running),
+            "slow": _agent("slow", 0.02, running),
+            "broken": broken,
+        }
+        decision = {
+            "action": "PARALLEL",
+            "next_agent": "lead",
+            "branches": [
+                {"agent": "broken", "goal": "find prices"},
+                {"agent": "slow", "goal": "find reviews"},
+            ]
+        }
+
+        events = [event async for event in executor._run_parallel_branches(decision)]
+
+        results = [event for event in events if event["type"] == "parallel_branch_result"]
+        assert [result["agent"] for result in results] == ["broken", "slow"]
+        assert results[0]["error"] == "provider down"
+        assert results[1]["content"] == "slow done"
+        assert [step.agent_name for step in executor.task.history[1:]] == ["broken", "slow"]
+        assert "branch failed: provider down" in executor.task.history[1].parts[0].text
+        assert executor.task.current_agent == "lead"
+
+    @pytest.mark.asyncio
+    async def test_branches_on_one_agent_keep_separate_windows(self, executor):
+        """Test that two branches on the same agent fit separately and leave its summary state alone."""
+        agent = Agent(AgentConfig(
+            name="researcher", description="Researcher", prompt_template="You research.",
+            context_policy=ContextPolicy(tail_messages=1, chars_per_token=1)
+        ))
+        agent.brain = agent.context_window.brain = brain = Mock()
+        brain.config = BrainConfig(max_context_length=200, max_tokens=10, streaming=False)
+        sent = {}
+
+        async def generate_response(messages, **kwargs):
+            goal = messages[-1]["content"]
+            await asyncio.sleep(0.01)
+            sent[goal] = [m["content"] for m in messages]
+            return Mock(content=f"done: {goal}", tool_calls=None)
+
+        brain.generate_response = generate_response
+        for i in range(4):
+            executor.task.add_step(TaskStep(agent_name="user", parts=[TextPart(text=f"{i}:" + "x" * 60)]))
+        executor.task.agents = {"lead": Mock(), "researcher": agent}
+        decision = {
+            "action": "PARALLEL",
+            "next_agent": "lead",
+            "branches": [
+                {"agent": "researcher", "goal": "find prices"},
+                {"agent": "researcher", "goal": "find reviews"},
+            ]
+        }
+
+        [event async for event in executor._run_parallel_branches(decision)]
+
+        assert "find reviews" not in sent["find prices"] and "find prices" not in sent["find reviews"]
+        assert [step.parts[0].text for step in executor.task.history[-2:]] == [
+            "find prices\n\ndone: find prices", "find reviews\n\ndone: find reviews"
+        ]
+        window = agent.context_window
+        assert window._pending is None and window._summary is None and window._summarized_upto == 0
@@ -0,0 +1,108 @@
+"""
+Unit tests for the prompt-cache-friendly message layout.
+"""
+
+from datetime import datetime
+import litellm
+import pytest
+from unittest.mock import patch
+
+from agentx.core.agent import Agent
+from agentx.core.brain import Brain
+from agentx.core.config import AgentConfig, BrainConfig
+from agentx.core.llm_cache import cache_key
+from agentx.core.llm_provider import LLMProvider
+from agentx.core.rate_limiter import set_rate_limiter
+
+
+class FakeDatetime(datetime):
+    current = datetime(2025, 1, 6, 9, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+def _format_at(brain, when, messages, **kwargs):
+    FakeDatetime.current = when
+    with patch("agentx.core.brain.datetime", FakeDatetime):
+        return brain._format_messages(messages, **kwargs)
+
+
+class TestMessageLayout:
+    """Test that volatile content never precedes stable content."""
+
+    def test_prefix_is_stable_across_calls(self):
+        """Test that only the trailing context message changes over time and rounds."""
+        brain = Brain(BrainConfig())
+        history = [{"role": "user", "content": "hello"}]
+
+        first = _format_at(brain, datetime(2025, 1, 6, 9, 0), history, system_prompt="You help.", turn_context="Round: 1")
+        second = _format_at(brain, datetime(2025, 1, 7, 17, 45), history, system_prompt="You help.", turn_context="Round: 2")
+
+        assert first[:-1] == second[:-1] == [{"role": "system", "content": "You help."}] + history
+        assert first[-1]["role"] == "user"
+        assert "Round: 1" in first[-1]["content"] and "Current date and time:" in first[-1]["content"]
+        assert cache_key({"messages": first}) != cache_key({"messages": second})  # The round still matters
+
+    def test_system_messages_hold_nothing_volatile(self):
+        """Test that the clock and turn context stay out of system messages, which some providers hoist."""
+        brain = Brain(BrainConfig())
+        history = [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "hi"}]
+
+        first = _format_at(brain, datetime(2025, 1, 6, 9, 0), history, system_prompt="You help.", turn_context="Round: 1")
+        second = _format_at(brain, datetime(2025, 1, 7, 17, 45), history, system_prompt="You help.", turn_context="Round: 2")
+
+        system_messages = [m for m in first if m["role"] == "system"]
+        assert system_messages == [m for m in second if m["role"] == "system"]
+        assert all("Current date and time:" not in m["content"] and "Round:" not in m["content"] for m in system_messages)
+
+    def test_clock_does_not_change_cache_key(self):
+        """Test that the response cache matches requests sent at different times."""
+        brain = Brain(BrainConfig())
+        history = [{"role": "user", "content": "hello"}]
+
+        first = _format_at(brain, datetime(2025, 1, 6, 9, 0), history, system_prompt="You help.")
+        second = _format_at(brain, datetime(2025, 1, 6, 9, 1), history, system_prompt="You help.")
+
+        assert first != second
+        assert cache_key({"messages": first}) == cache_key({"messages": second})
+
+    def test_agent_system_prompt_ignores_round(self):
+        """Test that the agent's system prompt is identical across rounds of a task."""
+        agent = Agent(AgentConfig(name="writer", description="Writer", prompt_template="You write."))
+        context = {"task_id": "t1", "workspace_dir": "/ws", "round_count": 1}
+
+        assert agent.build_system_prompt(context) == agent.build_system_prompt({**context, "round_count": 7})
+        assert agent.build_system_prompt(context).startswith("You write.")
+        assert agent.build_turn_context({**context, "round_count": 7}) == "Round: 7"
+
+
+class TestCachedTokenReporting:
+    """Test that provider prompt-cache hits show up in usage."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_limiter(self):
+        set_rate_limiter(None)
+        yield
+        set_rate_limiter(None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("usage_fields", [
+        {"prompt_tokens_details": {"cached_tokens": 80}},
+        {"prompt_cache_hit_tokens": 80},
+    ])
+    async def test_cached_prompt_tokens_reported(self, usage_fields):
+        """Test that OpenAI- and DeepSeek-style cache hit counts are normalized."""
+        class CachingProvider(LLMProvider):
+            async def acompletion(self, **params):
+                return litellm.ModelResponse(
+                    model="deepseek-chat",
+                    choices=[{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+                    usage={"prompt_tokens": 100, "completion_tokens": 1, "total_tokens": 101, **usage_fields}
+                )
+
+        brain = Brain(BrainConfig(supports_function_calls=False), provider=CachingProvider())
+        response = await brain.generate_response([{"role": "user", "content": "hi"}], system_prompt="You help.")
+
+        assert response.usage["cached_prompt_tokens"] == 80
@@ -0,0 +1,159 @@
+"""
+Unit tests for the shared LLM rate limiter.
+"""
+
+import asyncio
+import time
+import pytest
+
+from agentx.core.brain import Brain
+from agentx.core.config import BrainConfig, RateLimitConfig, RetryPolicy
+from agentx.core.llm_provider import LLMProvider
+from agentx.core.rate_limiter import RateLimiter, TokenBucket, get_rate_limiter, set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    set_rate_limiter(None)
+    yield
+    set_rate_limiter(None)
+
+
+def _request(model="deepseek/deepseek-chat"):
+    return {"model": model, "messages": [{"role": "user", "content": "hi"}], "max_tokens": 100}
+
+
+class RateLimitedError(Exception):
+    status_code = 429
+
+
+class TestRateLimiter:
+    """Test queueing, token buckets and AIMD concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_queues_callers(self):
+        """Test that callers beyond the limit wait and the wait is reported."""
+        limiter = RateLimiter(RateLimitConfig(initial_concurrency=2, max_concurrency=2))
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            permit = await limiter.acquire(_request())
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            permit.release()
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        stats = limiter.get_stats()["deepseek/deepseek-chat"]
+        assert peak == 2
+        assert stats["requests"] == 6
+        assert stats["queued"] >= 4
+        assert stats["max_queue_wait_seconds"] > 0.01
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_concurrency_once_per_overload(self):
+        """Test that a burst of 429s from one window cuts the limit only once."""
+        limiter = RateLimiter(RateLimitConfig(initial_concurrency=8))
+        permits = [await limiter.acquire(_request()) for _ in range(3)]
+        for permit in permits:
+            permit.release(RateLimitedError("Too Many Requests"))
+
+        stats = limiter.get_stats()["deepseek/deepseek-chat"]
+        assert stats["concurrency_limit"] == 4
+        assert stats["rate_limited"] == 3
+
+    @pytest.mark.asyncio
+    async def test_success_grows_concurrency(self):
+        """Test additive increase after successful, fast responses."""
+        limiter = RateLimiter(RateLimitConfig(initial_concurrency=2, max_concurrency=4))
+        for _ in range(10):
+            permit = await limiter.acquire(_request())
+            permit.responded()
+            permit.release()
+
+        assert limiter.get_stats()["deepseek/deepseek-chat"]["concurrency_limit"] == 4
+
+    @pytest.mark.asyncio
+    async def test_long_generations_do_not_back_off(self):
+        """Test that complete responses are compared per output token, not by total time."""
+        limiter = RateLimiter(RateLimitConfig(initial_concurrency=4, latency_tolerance=4.0))
+        for seconds, tokens in [(0.1, 10), (20.0, 2000), (30.0, 3000)]:
+            permit = await limiter.acquire(_request())
+            permit.started = time.monotonic() - seconds
+            permit.responded(tokens)
+            permit.release()
+
+        stats = limiter.get_stats()["deepseek/deepseek-chat"]
+        assert stats["latency_backoffs"] == 0
+        assert stats["concurrency_limit"] > 4
+
+    @pytest.mark.asyncio
+    async def test_latency_baseline_decays(self):
+        """Test that one unusually fast call stops causing backoffs once latency settles."""
+        limiter = RateLimiter(RateLimitConfig(initial_concurrency=8, latency_tolerance=4.0))
+        backoffs = []
+        for seconds in [0.01] + [0.1] * 60:
+            permit = await limiter.acquire(_request())
+            permit.started = time.monotonic() - seconds
+            permit.responded()
+            permit.release()
+            backoffs.append(limiter.get_stats()["deepseek/deepseek-chat"]["latency_backoffs"])
+
+        assert backoffs[1] == 1
+        assert backoffs[-1] == backoffs[-20]
+
+    @pytest.mark.asyncio
+    async def test_mixed_prompt_sizes_do_not_shrink_limit(self):
+        """Test that by default slow first bytes from large prompts are not treated as overload."""
+        limiter = RateLimiter(RateLimitConfig(initial_concurrency=8))
+        for i in range(200):
+            permit = await limiter.acquire(_request())
+            permit.started = time.monotonic() - (0.3 if i % 2 == 0 else 2.0)  # Routing vs agent prompts
+            permit.responded()
+            permit.release()
+
+        stats = limiter.get_stats()["deepseek/deepseek-chat"]
+        assert stats["latency_backoffs"] == 0
+        assert stats["concurrency_limit"] >= 8
+
+    def test_token_bucket_reservations_wait_in_line(self):
+        """Test that reservations past the bucket balance wait for the refill."""
+        bucket = TokenBucket(60)
+        assert bucket.reserve(60) == 0
+        assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+        assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+
+    def test_provider_settings_share_state_across_models(self):
+        """Test that a provider-level setting applies to all of its models together."""
+        limiter = RateLimiter()
+        limiter.configure("deepseek", RateLimitConfig(requests_per_minute=100))
+
+        assert limiter._state_for("deepseek/deepseek-chat") is limiter._state_for("deepseek/deepseek-reasoner")
+        assert limiter._state_for("openai/gpt-4o").config.requests_per_minute is None
+
+
+class TestBrainRateLimiting:
+    """Test that Brain calls go through the shared limiter."""
+
+    @pytest.mark.asyncio
+    async def test_brain_reports_provider_429s(self):
+        """Test that a 429 from the provider reaches the limiter and frees the slot."""
+        class ThrottledProvider(LLMProvider):
+            async def acompletion(self, **params):
+                raise RateLimitedError("Too Many Requests")
+
+        brain = Brain(
+            BrainConfig(model="deepseek-chat", rate_limit=RateLimitConfig(initial_concurrency=4),
+                        retry_policy=RetryPolicy(max_retries=0)),
+            provider=ThrottledProvider()
+        )
+        response = await brain.generate_response([{"role": "user", "content": "hi"}])
+
+        stats = get_rate_limiter().get_stats()["deepseek/deepseek-chat"]
+        assert response.finish_reason == "error"
+        assert stats["rate_limited"] == 1
+        assert stats["concurrency_limit"] == 2
+        assert stats["in_flight"] == 0
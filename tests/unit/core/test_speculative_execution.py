@@ -0,0 +1,130 @@
+"""
+Unit tests for speculative next-agent execution.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from agentx.core.task import Task, TaskExecutor
+from agentx.core.message import TaskStep, TextPart
+
+
+def _agent(name, delay=0.0, tools=None):
+    calls = []
+
+    async def generate_response(messages, system_prompt=None, orchestrator=None, turn_context=None):
+        calls.append(len(messages))
+        await asyncio.sleep(delay)
+        return f"{name} done"
+
+    agent = Mock()
+    agent.name = name
+    agent.tools = tools or []
+    agent.build_system_prompt = Mock(return_value="system")
+    agent.generate_response = generate_response
+    agent.calls = calls
+    return agent
+
+
+@pytest.fixture
+def executor(temp_dir):
+    """Fixture for a speculative TaskExecutor whose writer always hands off to the reviewer."""
+    team_config = Mock()
+    team_config.max_rounds = 10
+    task = Task(team_config=team_config, config_dir=temp_dir, workspace_dir=temp_dir / "ws")
+    task.add_step(TaskStep(agent_name="user", parts=[TextPart(text="write a poem")]))
+    task.current_agent = "writer"
+    task.agents = {"writer": _agent("writer"), "reviewer": _agent("reviewer", delay=0.01)}
+
+    executor = TaskExecutor.__new__(TaskExecutor)
+    executor.task = task
+    executor.journal = None
+    executor.speculation_stats = {"attempts": 0, "hits": 0, "misses": 0, "latency_saved": 0.0}
+    executor.orchestrator = Mock()
+    executor.orchestrator.get_execution_setting = Mock(side_effect=lambda key, default=None: key == "speculative")
+    executor.orchestrator.predict_next_agent = Mock(side_effect=lambda agent: "reviewer" if agent == "writer" else None)
+
+    async def writer_turn():
+        yield {"type": "content", "content": "a poem"}
+        executor.task.add_step(TaskStep(agent_name="writer", parts=[TextPart(text="a poem")]))
+
+    executor._stream_agent_turn = writer_turn
+    return executor
+
+
+def _route(executor, decisions):
+    async def decide_next_step(context, last_response):
+        await asyncio.sleep(0.02)
+        return decisions.pop(0)
+
+    executor.orchestrator.decide_next_step = decide_next_step
+
+
+class TestSpeculativeExecution:
+    """Test that correct predictions are committed and wrong ones discarded."""
+
+    @pytest.mark.asyncio
+    async def test_correct_prediction_is_committed(self, executor):
+        """Test that the speculated reviewer turn is used without a second LLM call."""
+        _route(executor, [
+            {"action": "HANDOFF", "next_agent": "reviewer"},
+            {"action": "COMPLETE"},
+        ])
+
+        chunks = [chunk async for chunk in executor._stream_execute()]
+
+        reviewer = executor.task.agents["reviewer"]
+        assert reviewer.calls == [2]  # Ran once, on the history including the writer's turn
+        assert {"type": "content", "content": "reviewer done"} in chunks
+        assert [step.agent_name for step in executor.task.history] == ["user", "writer", "reviewer"]
+        stats = executor.get_speculation_stats()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["latency_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_wrong_prediction_is_discarded(self, executor):
+        """Test that a mispredicted turn is cancelled and leaves no trace in history."""
+        _route(executor, [{"action": "COMPLETE"}])
+
+        [chunk async for chunk in executor._stream_execute()]
+
+        assert [step.agent_name for step in executor.task.history] == ["user", "writer"]
+        assert executor.get_speculation_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_speculation_falls_back_to_a_normal_turn(self, executor):
+        """Test that an error in the speculative call is counted as a miss and the turn runs normally."""
+        async def failing_response(messages, system_prompt=None, orchestrator=None, turn_context=None):
+            raise ConnectionError("provider down")
+
+        executor.task.agents["reviewer"].generate_response = failing_response
+        turns = []
+
+        async def stream_turn():
+            turns.append(executor.task.current_agent)
+            yield {"type": "content", "content": f"{executor.task.current_agent} streamed"}
+            executor.task.add_step(TaskStep(agent_name=executor.task.current_agent, parts=[TextPart(text="done")]))
+
+        executor._stream_agent_turn = stream_turn
+        _route(executor, [
+            {"action": "HANDOFF", "next_agent": "reviewer"},
+            {"action": "COMPLETE"},
+        ])
+
+        chunks = [chunk async for chunk in executor._stream_execute()]
+
+        assert turns == ["writer", "reviewer"]
+        assert {"type": "content", "content": "reviewer streamed"} in chunks
+        assert [step.agent_name for step in executor.task.history] == ["user", "writer", "reviewer"]
+        stats = executor.get_speculation_stats()
+        assert stats["hits"] == 0 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_agents_with_tools_are_not_speculated(self, executor):
+        """Test that agents with side-effecting tools only run after routing."""
+        executor.task.agents["reviewer"].tools = ["write_file"]
+
+        assert executor._start_speculative_turn() is None
+        assert executor.speculation_stats["attempts"] == 0
@@ -0,0 +1,146 @@
+"""
+Unit tests for the append-only task journal.
+"""
+
+import pytest
+
+from agentx.core.journal import TaskJournal
+from agentx.core.message import TaskStep, TextPart
+from agentx.core.task import TaskExecutor
+from agentx.core.template import clear_team_templates
+from agentx.storage.backends import LocalFileStorage
+
+
+@pytest.fixture
+def storage(temp_dir):
+    """Fixture for workspace file storage."""
+    return LocalFileStorage(temp_dir)
+
+
+@pytest.fixture
+def config_path(temp_dir):
+    """Fixture for a minimal one-agent team config."""
+    (temp_dir / "prompts").mkdir()
+    (temp_dir / "prompts" / "writer.md").write_text("You write.")
+    path = temp_dir / "team.yaml"
+    path.write_text(
+        "name: test_team\n"
+        "agents:\n"
+        "  - name: writer\n"
+        "    prompt_template: prompts/writer.md\n"
+        "    llm_config:\n"
+        "      model: deepseek-chat\n"
+    )
+    clear_team_templates()
+    yield path
+    clear_team_templates()
+
+
+def _step(text: str) -> dict:
+    return TaskStep(agent_name="writer", parts=[TextPart(text=text)]).model_dump(mode="json")
+
+
+class TestTaskJournal:
+    """Test journaling, snapshots and replay."""
+
+    @pytest.mark.asyncio
+    async def test_flush_appends_without_rewriting(self, storage):
+        """Test that each flush only appends the new records."""
+        journal = TaskJournal(storage)
+        journal.record("step", _step("one"))
+        await journal.flush()
+        journal.record("step", _step("two"))
+        await journal.flush()
+
+        lines = (await storage.read_text(TaskJournal.JOURNAL_PATH)).splitlines()
+
+        assert len(lines) == 2
+        snapshot, records = await TaskJournal(storage).load()
+        assert snapshot is None
+        assert [r["data"]["parts"][0]["text"] for r in records] == ["one", "two"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_truncates_journal(self, storage):
+        """Test that a snapshot folds in the journal and later records form the tail."""
+        journal = TaskJournal(storage, snapshot_interval=2)
+        journal.record("step", _step("one"))
+        journal.record("step", _step("two"))
+        assert journal.snapshot_due
+
+        await journal.snapshot({"history_length": 2})
+        journal.record("routing", {"action": "HANDOFF", "next_agent": "reviewer", "round_count": 1})
+        await journal.flush()
+
+        snapshot, records = await TaskJournal(storage).load()
+
+        assert snapshot["history_length"] == 2
+        assert snapshot["journal_seq"] == 2
+        assert [r["seq"] for r in records] == [3]
+
+    @pytest.mark.asyncio
+    async def test_records_covered_by_snapshot_are_skipped(self, storage):
+        """Test replay after a crash between the snapshot and the journal truncation."""
+        journal = TaskJournal(storage)
+        journal.record("step", _step("one"))
+        await journal.flush()
+        stale = await storage.read_text(TaskJournal.JOURNAL_PATH)
+
+        await journal.snapshot({"history_length": 1})
+        await storage.write_text(TaskJournal.JOURNAL_PATH, stale)
+
+        _, records = await TaskJournal(storage).load()
+
+        assert records == []
+
+    @pytest.mark.asyncio
+    async def test_torn_final_record_is_ignored(self, storage):
+        """Test that a partially written last line is dropped and records written after resuming survive."""
+        journal = TaskJournal(storage)
+        journal.record("step", _step("one"))
+        await journal.flush()
+        await storage.append_text(TaskJournal.JOURNAL_PATH, '{"seq": 2, "type": "st')
+
+        resumed = TaskJournal(storage)
+        _, records = await resumed.load()
+        resumed.record("step", _step("two"))
+        resumed.record("step", _step("three"))
+        await resumed.flush()
+        _, replayed = await TaskJournal(storage).load()
+
+        assert len(records) == 1
+        assert [r["seq"] for r in replayed] == [1, 2, 3]
+        assert [r["data"]["parts"][0]["text"] for r in replayed] == ["one", "two", "three"]
+
+
+class TestTaskResume:
+    """Test rebuilding a task from its workspace."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("snapshot_interval", [2, 100])
+    async def test_resume_rebuilds_state(self, config_path, temp_dir, snapshot_interval):
+        """Test that resume restores the task from snapshots or from the journal alone."""
+        workspace_dir = temp_dir / "workspace" / "t1"
+        executor = await TaskExecutor.create(str(config_path), task_id="t1", workspace_dir=workspace_dir)
+        executor.journal.snapshot_interval = snapshot_interval
+        executor.task.initial_prompt = "write a poem"
+        executor.journal.record("start", {"initial_prompt": "write a poem", "current_agent": "writer"})
+        executor.task.add_step(TaskStep(agent_name="user", parts=[TextPart(text="write a poem")]))
+        await executor._save_state_async()
+        executor.task.add_step(TaskStep(agent_name="writer", parts=[TextPart(text="roses")]))
+        executor.task.round_count = 1
+        # Saved after the routing decision is journaled but before it is applied, as in _execute
+        executor._record_routing({"action": "COMPLETE", "reason": "done"})
+        await executor._save_state_async()
+
+        resumed = await TaskExecutor.resume("t1", str(config_path), workspace_dir=workspace_dir)
+
+        task = resumed.task
+        assert task.initial_prompt == "write a poem"
+        assert [step.parts[0].text for step in task.history] == ["write a poem", "roses"]
+        assert task.round_count == 1 and task.is_complete
+
+    @pytest.mark.asyncio
+    async def test_resume_without_saved_state_fails(self, config_path, temp_dir):
+        """Test that resuming an unknown task raises instead of starting empty."""
+        with pytest.raises(ValueError, match="No saved state"):
+            await TaskExecutor.resume("missing", str(config_path), workspace_dir=temp_dir / "workspace" / "missing")
@@ -0,0 +1,106 @@
+"""
+Unit tests for the incremental conversation message log kept by Task.
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from agentx.core import task as task_module
+from agentx.core.task import Task, TaskExecutor
+from agentx.core.message import TaskStep, TextPart, ToolResultPart
+
+
+@pytest.fixture
+def task(temp_dir):
+    """Fixture for a Task with a minimal team config."""
+    team_config = Mock()
+    team_config.max_rounds = 10
+    return Task(team_config=team_config, config_dir=temp_dir, workspace_dir=temp_dir / "ws")
+
+
+def _text_step(agent_name: str, text: str) -> TaskStep:
+    return TaskStep(agent_name=agent_name, parts=[TextPart(text=text)])
+
+
+class TestTaskMessageLog:
+    """Test the cached message log derived from task history."""
+
+    def test_messages_follow_history(self, task):
+        """Test that each step type maps to the expected message role."""
+        task.add_step(_text_step("user", "hello"))
+        task.add_step(_text_step("writer", "hi there"))
+        task.add_step(TaskStep(agent_name="system", parts=[
+            ToolResultPart(tool_call_id="call_1", tool_name="web_search", result={"hits": 1})
+        ]))
+
+        messages = task.get_messages()
+
+        assert [m["role"] for m in messages] == ["user", "assistant", "tool"]
+        assert messages[1]["content"] == "hi there"
+        assert json.loads(messages[2]["content"]) == {"success": True, "result": {"hits": 1}}
+
+    def test_each_step_is_converted_once(self, task):
+        """Test that a turn only converts the steps added since the last call."""
+        with patch.object(task_module, "_step_to_messages", wraps=task_module._step_to_messages) as convert:
+            for i in range(200):
+                task.add_step(_text_step("user" if i % 2 == 0 else "writer", f"message {i}"))
+                task.get_messages()
+
+            assert convert.call_count == 200
+            assert len(task.get_messages()) == 200
+            assert convert.call_count == 200
+
+    def test_rewritten_history_is_rebuilt(self, task):
+        """Test that the log is rebuilt when history shrinks outside add_step."""
+        for i in range(3):
+            task.add_step(_text_step("user", f"message {i}"))
+
+        task.history = task.history[:1]
+
+        assert [m["content"] for m in task.get_messages()] == ["message 0"]
+
+    def test_replaced_step_is_rebuilt(self, task):
+        """Test that the log is rebuilt when a step is replaced without changing the length."""
+        for i in range(3):
+            task.add_step(_text_step("user", f"message {i}"))
+        task.get_messages()
+
+        task.history[-1] = _text_step("user", "edited")
+
+        assert [m["content"] for m in task.get_messages()] == ["message 0", "message 1", "edited"]
+
+    def test_direct_history_appends_are_picked_up(self, task):
+        """Test that steps appended directly to history still reach the log."""
+        task.add_step(_text_step("user", "first"))
+        task.history.append(_text_step("writer", "second"))
+
+        assert [m["content"] for m in task.get_messages()] == ["first", "second"]
+
+
+class TestTurnSetup:
+    """Test that preparing a turn does not scale with history length."""
+
+    def test_setup_only_converts_new_steps(self, task):
+        """Test that a turn on a long history only converts the step added since the last turn."""
+        agent = Mock()
+        agent.name = "writer"
+        agent.build_system_prompt = Mock(return_value="system")
+        agent.build_turn_context = Mock(return_value=None)
+        task.agents = {"writer": agent}
+        task.current_agent = "writer"
+        executor = TaskExecutor.__new__(TaskExecutor)
+        executor.task = task
+
+        for i in range(500):
+            task.add_step(_text_step("user", f"message {i}"))
+        executor._prepare_turn()
+
+        with patch.object(task_module, "_step_to_messages", wraps=task_module._step_to_messages) as convert:
+            task.add_step(_text_step("user", "latest"))
+            _, system_prompt, _, messages = executor._prepare_turn()
+
+        assert convert.call_count == 1
+        assert len(messages) == 501 and messages[-1]["content"] == "latest"
+        assert system_prompt == "system"
+        assert executor.last_turn_setup_time > 0
@@ -0,0 +1,93 @@
+"""
+Unit tests for compiled team templates.
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from agentx.core import brain as brain_module
+from agentx.core import template as template_module
+from agentx.core.brain import Brain
+from agentx.core.template import get_team_template, clear_team_templates
+
+
+@pytest.fixture
+def config_path(temp_dir):
+    """Fixture for a minimal team config with one prompt file."""
+    (temp_dir / "prompts").mkdir()
+    (temp_dir / "prompts" / "writer.md").write_text("You write.")
+    path = temp_dir / "team.yaml"
+    path.write_text(
+        "name: test_team\n"
+        "agents:\n"
+        "  - name: writer\n"
+        "    prompt_template: prompts/writer.md\n"
+        "    llm_config:\n"
+        "      model: deepseek-chat\n"
+        "      max_context_length: 8000\n"
+    )
+    clear_team_templates()
+    yield path
+    clear_team_templates()
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestTeamTemplate:
+    """Test template compilation and caching."""
+
+    def test_compiles_agent_configs(self, config_path):
+        """Test that prompts and brain settings are compiled into agent configs."""
+        template = get_team_template(config_path)
+
+        writer = template.agent_configs["writer"]
+        assert template.team_config.name == "test_team"
+        assert writer.prompt_template == "You write."
+        assert writer.brain_config.max_context_length == 8000
+
+    def test_compiles_tool_settings(self, config_path):
+        """Test that the team's tools section sets execution limits."""
+        config_path.write_text(config_path.read_text() + "tools:\n  max_parallel_executions: 8\n  max_queue_wait: 5\n")
+
+        template = get_team_template(config_path)
+
+        assert template.tools_config.max_parallel_executions == 8
+        assert template.tools_config.max_queue_wait == 5.0
+
+    def test_template_is_shared_until_files_change(self, config_path):
+        """Test that the config is parsed once and recompiled after an edit."""
+        with patch.object(template_module, "load_team_config", wraps=template_module.load_team_config) as load:
+            first = get_team_template(config_path)
+            assert get_team_template(config_path) is first
+            assert load.call_count == 1
+
+            _touch(config_path)
+            assert get_team_template(config_path) is not first
+            assert load.call_count == 2
+
+    def test_prompt_edit_invalidates_template(self, config_path):
+        """Test that changing a prompt file recompiles the template."""
+        first = get_team_template(config_path)
+
+        prompt = config_path.parent / "prompts" / "writer.md"
+        prompt.write_text("You write poems.")
+        _touch(prompt)
+
+        assert get_team_template(config_path).agent_configs["writer"].prompt_template == "You write poems."
+        assert first.is_stale()
+
+    @pytest.mark.asyncio
+    async def test_brains_do_not_mutate_shared_configs(self, config_path, monkeypatch):
+        """Test that one brain's capability check does not change the template for later tasks."""
+        monkeypatch.setattr(brain_module, "_function_calling_support", {"deepseek/deepseek-chat": False})
+        shared = get_team_template(config_path).agent_configs["writer"].brain_config
+
+        brain = Brain(shared)
+        await brain._ensure_initialized()
+
+        assert brain.config.supports_function_calls is False
+        assert shared.supports_function_calls is True
@@ -0,0 +1 @@
+"""Unit tests for storage components."""
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Unit tests for Git-based artifact storage.
+"""
+
+import pytest
+
+pytest.importorskip("git")
+
+from agentx.storage.git_storage import GitArtifactStorage
+
+
+class TestLazyRepository:
+    """Test that the artifacts repository is created on first write."""
+
+    def test_construction_does_not_touch_disk(self, temp_dir):
+        """Test that creating the storage does not init a repository."""
+        GitArtifactStorage(temp_dir)
+
+        assert not (temp_dir / "artifacts").exists()
+
+    @pytest.mark.asyncio
+    async def test_reads_before_first_write(self, temp_dir):
+        """Test that reads work before the repository exists."""
+        storage = GitArtifactStorage(temp_dir)
+
+        assert await storage.list_artifacts() == []
+        assert await storage.get_artifact("missing") is None
+        assert not (temp_dir / "artifacts").exists()
+
+    @pytest.mark.asyncio
+    async def test_first_write_initializes_repository(self, temp_dir):
+        """Test that storing an artifact creates the repository and commits."""
+        storage = GitArtifactStorage(temp_dir)
+
+        result = await storage.store_artifact("notes", "hello")
+
+        assert result.success
+        assert (temp_dir / "artifacts" / ".git").is_dir()
+        assert await storage.get_artifact("notes") == "hello"
+        assert len(await storage.get_artifact_versions("notes")) == 1
@@ -0,0 +1,82 @@
+"""
+Unit tests for tool call history and the JSONL audit log.
+"""
+
+import json
+import pytest
+
+from agentx.tool import executor as executor_module
+from agentx.tool.audit import ToolAuditWriter
+from agentx.tool.executor import ToolExecutor
+from agentx.tool.models import Tool, tool
+from agentx.tool.registry import ToolRegistry
+
+
+class NotesTool(Tool):
+    """Test tool with a large argument."""
+
+    @tool(description="Write")
+    async def write_file(self, title: str, content: str) -> dict:
+        return {"title": title, "length": len(content)}
+
+    @tool(description="Read", read_only=True)
+    async def read_file(self, path: str) -> str:
+        raise FileNotFoundError(path)
+
+
+@pytest.fixture
+def registry():
+    """Fixture for a registry with a NotesTool."""
+    registry = ToolRegistry()
+    registry.register_tool(NotesTool())
+    return registry
+
+
+class TestToolAudit:
+    """Test compact history records and full audit records."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_compact_and_bounded(self, registry, monkeypatch):
+        """Test that history keeps argument names only and drops the oldest records."""
+        monkeypatch.setattr(executor_module, "EXECUTION_HISTORY_SIZE", 5)
+        executor = ToolExecutor(registry=registry)
+
+        for i in range(8):
+            await executor.execute_tool("write_file", title=f"n{i}", content="x" * 10000)
+        await executor.execute_tool("read_file", path="missing.md")
+
+        assert len(executor.execution_history) == 5
+        last_success = executor.execution_history[-2]
+        assert last_success["arguments"] == ["title", "content"]
+        stats = executor.get_execution_stats()
+        assert stats["total_executions"] == 9
+        assert stats["successful_executions"] == 8
+        assert stats["audit"] is None
+
+    @pytest.mark.asyncio
+    async def test_audit_log_has_full_records(self, registry, tmp_path):
+        """Test that the audit writer gets full arguments, results and errors."""
+        writer = ToolAuditWriter(str(tmp_path / "audit" / "tools.jsonl"))
+        executor = ToolExecutor(registry=registry, audit_writer=writer)
+
+        await executor.execute_tool("write_file", agent_name="writer", title="plan", content="draft")
+        await executor.execute_tool("read_file", path="missing.md")
+        writer.close()
+
+        records = [json.loads(line) for line in (tmp_path / "audit" / "tools.jsonl").read_text().splitlines()]
+        assert records[0]["agent_name"] == "writer"
+        assert records[0]["arguments"] == {"title": "plan", "content": "draft"}
+        assert records[0]["result"] == {"title": "plan", "length": 5}
+        assert records[1]["success"] is False and "missing.md" in records[1]["error"]
+        assert executor.get_execution_stats()["audit"]["written"] == 2
+
+    def test_full_queue_drops_records(self, tmp_path):
+        """Test that writes never block when the writer falls behind."""
+        writer = ToolAuditWriter(str(tmp_path / "tools.jsonl"), max_queue=1)
+        writer._thread = object()  # Keep the writer thread from draining the queue
+
+        writer.write({"tool_name": "a"})
+        writer.write({"tool_name": "b"})
+
+        assert writer.get_stats()["dropped"] == 1
+        assert writer.get_stats()["queued"] == 1
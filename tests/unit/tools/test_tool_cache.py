@@ -0,0 +1,173 @@
+"""
+Unit tests for the tool result cache.
+"""
+
+import asyncio
+import pytest
+
+from agentx.tool.cache import ToolResultCache, tool_cache_key, get_global_tool_cache
+from agentx.tool.executor import ToolExecutor
+from agentx.tool.models import Tool, ToolResult, tool
+from agentx.tool.registry import ToolRegistry
+
+
+class LookupTool(Tool):
+    """Test tool that counts how often each method actually runs."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @tool(description="Search", read_only=True, cache_ttl=60, cache_key=["query"])
+    async def web_search(self, query: str, request_id: str = "", delay: float = 0.0) -> str:
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return f"results for {query}"
+
+    @tool(description="News", read_only=True, cache_ttl=60, cache_scope="global")
+    async def news_search(self, query: str, delay: float = 0.0) -> str:
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return f"news for {query}"
+
+    @tool(description="Extract", read_only=True, cache_ttl=60)
+    async def extract_content(self, url: str) -> ToolResult:
+        self.calls += 1
+        return ToolResult(success=False, error="backend down")
+
+    @tool(description="Read", read_only=True)
+    async def read_file(self, path: str) -> str:
+        self.calls += 1
+        return path
+
+
+def _executor(lookup_tool):
+    registry = ToolRegistry()
+    registry.register_tool(lookup_tool)
+    return ToolExecutor(registry=registry)
+
+
+class TestToolResultCache:
+    """Test caching, TTL, eviction and coalescing of tool results."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_is_served_from_cache(self):
+        """Test that an identical call reuses the first result."""
+        lookup_tool = LookupTool()
+        executor = _executor(lookup_tool)
+
+        first = await executor.execute_tool("web_search", query="agents")
+        second = await executor.execute_tool("web_search", query="agents")
+
+        assert first.result == second.result == "results for agents"
+        assert lookup_tool.calls == 1
+        assert second.metadata["cache_hit"] is True
+        assert "cache_hit" not in first.metadata
+
+    @pytest.mark.asyncio
+    async def test_key_fields_ignore_other_arguments(self):
+        """Test that only the declared key fields distinguish calls."""
+        lookup_tool = LookupTool()
+        executor = _executor(lookup_tool)
+
+        await executor.execute_tool("web_search", query="agents", request_id="1")
+        await executor.execute_tool("web_search", query="agents", request_id="2")
+        await executor.execute_tool("web_search", query="tools", request_id="1")
+
+        assert lookup_tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_run_once(self):
+        """Test that calls arriving while the first is running share its result."""
+        lookup_tool = LookupTool()
+        executor = _executor(lookup_tool)
+
+        results = await asyncio.gather(*[
+            executor.execute_tool("web_search", query="agents", delay=0.02) for _ in range(3)
+        ])
+
+        assert all(r.success and r.result == "results for agents" for r in results)
+        assert lookup_tool.calls == 1
+        stats = executor.get_execution_stats()["result_cache"]["task"]
+        assert stats["misses"] == 1 and stats["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_results_are_not_cached(self):
+        """Test that a tool reporting failure runs again next time."""
+        lookup_tool = LookupTool()
+        executor = _executor(lookup_tool)
+
+        await executor.execute_tool("extract_content", url="https://example.com")
+        await executor.execute_tool("extract_content", url="https://example.com")
+
+        assert lookup_tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_tools_always_run(self):
+        """Test that tools without a TTL bypass the cache."""
+        lookup_tool = LookupTool()
+        executor = _executor(lookup_tool)
+
+        await executor.execute_tool("read_file", path="a.md")
+        await executor.execute_tool("read_file", path="a.md")
+
+        assert lookup_tool.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_global_scope_is_shared_across_executors(self):
+        """Test that global-scope results are reused by other tasks' executors."""
+        get_global_tool_cache().clear()
+        lookup_tool = LookupTool()
+
+        await _executor(lookup_tool).execute_tool("news_search", query="agents")
+        result = await _executor(lookup_tool).execute_tool("news_search", query="agents")
+
+        assert result.metadata["cache_hit"] is True
+        assert lookup_tool.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_other_tasks(self):
+        """Test that a waiter from another executor reruns the call when the first caller is cancelled."""
+        get_global_tool_cache().clear()
+        lookup_tool = LookupTool()
+        first = asyncio.create_task(_executor(lookup_tool).execute_tool("news_search", query="agents", delay=0.05))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(_executor(lookup_tool).execute_tool("news_search", query="agents", delay=0.05))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        result = await asyncio.wait_for(second, timeout=2)
+
+        assert first.cancelled()
+        assert result.success and result.result == "news for agents"
+        assert lookup_tool.calls == 2
+
+    def test_expired_entries_are_dropped(self):
+        """Test that entries are not returned after their TTL."""
+        cache = ToolResultCache()
+        cache.put("fresh", "value", ttl=60)
+        cache.put("stale", "value", ttl=0)
+
+        assert cache.get("fresh") == (True, "value")
+        assert cache.get("stale") == (False, None)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that a full cache evicts the entry used longest ago."""
+        cache = ToolResultCache(max_entries=2)
+        cache.put("a", 1, ttl=60)
+        cache.put("b", 2, ttl=60)
+        cache.get("a")
+        cache.put("c", 3, ttl=60)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats["evictions"] == 1
+
+    def test_cache_key_is_argument_order_independent(self):
+        """Test that argument order does not change the key."""
+        assert tool_cache_key("web_search", {"a": 1, "b": 2}) == tool_cache_key("web_search", {"b": 2, "a": 1})
+
+    def test_invalid_scope_is_rejected(self):
+        """Test that the decorator only accepts known scopes."""
+        with pytest.raises(ValueError):
+            tool(cache_ttl=60, cache_scope="session")
@@ -0,0 +1,147 @@
+"""
+Unit tests for tool backend circuit breakers.
+"""
+
+import json
+import time
+import pytest
+from types import SimpleNamespace
+
+from agentx.tool.circuit import CircuitBreaker, ToolUnavailable, reset_circuit_breakers
+from agentx.tool.executor import ToolExecutor
+from agentx.tool.models import Tool, ToolResult, tool
+from agentx.tool.registry import ToolRegistry
+
+
+class FlakyBackendTool(Tool):
+    """Test tool whose backend can be switched between up and down."""
+
+    def __init__(self):
+        super().__init__()
+        self.up = False
+        self.calls = 0
+
+    @tool(description="Search", read_only=True, backend="search_api")
+    async def web_search(self, query: str) -> ToolResult:
+        self.calls += 1
+        if not self.up:
+            return ToolResult(success=False, error="Search backend not available")
+        return ToolResult(success=True, result=[query])
+
+    @tool(description="News", read_only=True, backend="search_api")
+    async def news_search(self, query: str) -> str:
+        self.calls += 1
+        if not self.up:
+            raise ConnectionError("connection refused")
+        return query
+
+    @tool(description="Read", read_only=True)
+    async def read_file(self, path: str) -> str:
+        self.calls += 1
+        raise FileNotFoundError(path)
+
+
+@pytest.fixture
+def flaky_tool():
+    """Fixture for an executor with a FlakyBackendTool and fresh circuits."""
+    reset_circuit_breakers()
+    registry = ToolRegistry()
+    flaky_tool = FlakyBackendTool()
+    registry.register_tool(flaky_tool)
+    flaky_tool.executor = ToolExecutor(registry=registry)
+    flaky_tool.executor.security_policy.CIRCUIT_COOLDOWN = 0.05
+    yield flaky_tool
+    reset_circuit_breakers()
+
+
+class TestToolCircuitBreaker:
+    """Test tripping, fast failure, half-open probes and stats."""
+
+    @pytest.mark.asyncio
+    async def test_trips_after_consecutive_failures(self, flaky_tool):
+        """Test that calls fail fast once the threshold is reached."""
+        executor = flaky_tool.executor
+        for _ in range(executor.security_policy.CIRCUIT_FAILURE_THRESHOLD):
+            await executor.execute_tool("web_search", query="agents")
+
+        result = await executor.execute_tool("web_search", query="agents")
+
+        assert flaky_tool.calls == executor.security_policy.CIRCUIT_FAILURE_THRESHOLD
+        assert not result.success and "unavailable" in result.error
+        assert result.metadata["unavailable"] is True
+        assert result.metadata["retry_after"] >= 1
+        assert executor.get_execution_stats()["circuits"]["search_api"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_tools_sharing_a_backend_share_the_circuit(self, flaky_tool):
+        """Test that exceptions from one tool open the circuit for the other."""
+        executor = flaky_tool.executor
+        for _ in range(3):
+            await executor.execute_tool("news_search", query="agents")
+
+        result = await executor.execute_tool("web_search", query="agents")
+
+        assert result.metadata.get("unavailable") is True
+        assert flaky_tool.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_circuit(self, flaky_tool):
+        """Test that a successful trial call after the cooldown closes the circuit."""
+        executor = flaky_tool.executor
+        for _ in range(3):
+            await executor.execute_tool("web_search", query="agents")
+        flaky_tool.up = True
+        time.sleep(0.06)
+
+        result = await executor.execute_tool("web_search", query="agents")
+
+        assert result.success
+        assert executor.get_execution_stats()["circuits"]["search_api"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_circuit(self, flaky_tool):
+        """Test that a failed trial call opens the circuit for another cooldown."""
+        executor = flaky_tool.executor
+        for _ in range(3):
+            await executor.execute_tool("web_search", query="agents")
+        time.sleep(0.06)
+
+        await executor.execute_tool("web_search", query="agents")
+        result = await executor.execute_tool("web_search", query="agents")
+
+        assert flaky_tool.calls == 4
+        assert result.metadata.get("unavailable") is True
+
+    @pytest.mark.asyncio
+    async def test_tools_without_backend_never_trip(self, flaky_tool):
+        """Test that ordinary tool errors are not short-circuited."""
+        executor = flaky_tool.executor
+        for _ in range(5):
+            await executor.execute_tool("read_file", path="missing.md")
+
+        assert flaky_tool.calls == 5
+        assert executor.get_execution_stats()["circuits"] == {}
+
+    @pytest.mark.asyncio
+    async def test_llm_message_includes_retry_after(self, flaky_tool):
+        """Test that the tool message tells the model when to retry."""
+        executor = flaky_tool.executor
+        for _ in range(3):
+            await executor.execute_tool("web_search", query="agents")
+        call = SimpleNamespace(id="a", function=SimpleNamespace(name="web_search", arguments=json.dumps({"query": "x"})))
+
+        [message] = await executor.execute_tool_calls([call])
+
+        content = json.loads(message["content"])
+        assert content["success"] is False and content["retry_after"] >= 1
+
+    def test_only_one_trial_call_at_a_time(self):
+        """Test that a half-open circuit admits one probe and rejects the rest."""
+        breaker = CircuitBreaker("search_api", failure_threshold=1, cooldown_seconds=0)
+        breaker.record_failure()
+
+        assert breaker.before_call() is True
+        with pytest.raises(ToolUnavailable):
+            breaker.before_call()
+        breaker.release_trial()
+        assert breaker.before_call() is True
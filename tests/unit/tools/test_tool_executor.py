@@ -0,0 +1,238 @@
+"""
+Unit tests for concurrent tool call execution.
+"""
+
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+
+from agentx.config.models import ToolsConfig
+from agentx.tool.executor import ToolExecutor
+from agentx.tool.manager import ToolManager
+from agentx.tool.models import Tool, tool
+from agentx.tool.registry import ToolRegistry
+
+
+class WorkspaceTool(Tool):
+    """Test tool with read-only and mutating methods that record overlap."""
+
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.peak = 0
+        self.log = []
+
+    async def _work(self, label, delay):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.log.append(f"start {label}")
+        await asyncio.sleep(delay)
+        self.log.append(f"end {label}")
+        self.running -= 1
+        return label
+
+    @tool(description="Search", read_only=True)
+    async def web_search(self, query: str, delay: float = 0.02) -> str:
+        return await self._work(query, delay)
+
+    @tool(description="Read", read_only=True, max_concurrency=1)
+    async def read_file(self, path: str) -> str:
+        return await self._work(path, 0.01)
+
+    @tool(description="Write")
+    async def write_file(self, path: str) -> str:
+        return await self._work(path, 0.01)
+
+
+def _call(call_id, name, **args):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(args)))
+
+
+async def _collect(batch):
+    return {index: message async for index, message in batch.results()}
+
+
+@pytest.fixture
+def workspace_tool():
+    """Fixture for an executor with a registered WorkspaceTool."""
+    registry = ToolRegistry()
+    workspace_tool = WorkspaceTool()
+    registry.register_tool(workspace_tool)
+    workspace_tool.executor = ToolExecutor(registry=registry)
+    return workspace_tool
+
+
+class TestConcurrentToolCalls:
+    """Test concurrency limits, write serialization and result ordering."""
+
+    @pytest.mark.asyncio
+    async def test_read_only_calls_run_concurrently_in_call_order(self, workspace_tool):
+        """Test that read-only calls overlap but results keep tool_call_id order."""
+        calls = [
+            _call("a", "web_search", query="slow", delay=0.05),
+            _call("b", "web_search", query="fast", delay=0.0),
+        ]
+
+        messages = await workspace_tool.executor.execute_tool_calls(calls)
+
+        assert [m["tool_call_id"] for m in messages] == ["a", "b"]
+        assert workspace_tool.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_results_stream_as_calls_finish(self, workspace_tool):
+        """Test that the fastest call is yielded first with its batch index."""
+        calls = [
+            _call("a", "web_search", query="slow", delay=0.05),
+            _call("b", "web_search", query="fast", delay=0.0),
+        ]
+
+        indexes = [index async for index, _ in workspace_tool.executor.stream_tool_calls(calls)]
+
+        assert indexes == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_global_limit_bounds_concurrency(self, workspace_tool):
+        """Test that no more than MAX_CONCURRENT_EXECUTIONS tools run at once."""
+        calls = [_call(str(i), "web_search", query=str(i)) for i in range(6)]
+
+        messages = await workspace_tool.executor.execute_tool_calls(calls)
+
+        assert all(json.loads(m["content"])["success"] for m in messages)
+        assert workspace_tool.peak == workspace_tool.executor.security_policy.MAX_CONCURRENT_EXECUTIONS
+
+    @pytest.mark.asyncio
+    async def test_per_tool_limit(self, workspace_tool):
+        """Test that a tool's max_concurrency applies within a concurrent group."""
+        calls = [_call(str(i), "read_file", path=str(i)) for i in range(3)]
+
+        await workspace_tool.executor.execute_tool_calls(calls)
+
+        assert workspace_tool.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_are_barriers(self, workspace_tool):
+        """Test that a mutating call waits for earlier calls and blocks later ones."""
+        calls = [
+            _call("a", "web_search", query="before", delay=0.02),
+            _call("b", "write_file", path="draft.md"),
+            _call("c", "web_search", query="after", delay=0.0),
+        ]
+
+        await workspace_tool.executor.execute_tool_calls(calls)
+
+        assert workspace_tool.log == [
+            "start before", "end before",
+            "start draft.md", "end draft.md",
+            "start after", "end after",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_parallel_disabled(self, workspace_tool):
+        """Test that parallel=False runs read-only calls one at a time."""
+        calls = [_call(str(i), "web_search", query=str(i)) for i in range(3)]
+
+        await workspace_tool.executor.execute_tool_calls(calls, parallel=False)
+
+        assert workspace_tool.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_starts_calls_as_they_are_added(self, workspace_tool):
+        """Test that a call added to a batch runs before the batch is read."""
+        batch = workspace_tool.executor.start_tool_calls()
+        batch.add(_call("a", "web_search", query="early", delay=0.0))
+        await asyncio.sleep(0.01)
+
+        assert workspace_tool.log == ["start early", "end early"]
+        assert [index async for index, _ in batch.results()] == [0]
+
+    @pytest.mark.asyncio
+    async def test_batch_cancel_stops_running_calls(self, workspace_tool):
+        """Test that cancelling a batch stops calls that have not finished."""
+        batch = workspace_tool.executor.start_tool_calls()
+        batch.add(_call("a", "web_search", query="slow", delay=1.0))
+        await asyncio.sleep(0)
+
+        batch.cancel()
+        await asyncio.gather(*batch.tasks, return_exceptions=True)
+
+        assert all(task.cancelled() for task in batch.tasks)
+        assert "end slow" not in workspace_tool.log
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_still_reports_a_result(self, workspace_tool):
+        """Test that results() finishes when one call is cancelled on its own."""
+        batch = workspace_tool.executor.start_tool_calls()
+        batch.add(_call("a", "web_search", query="slow", delay=1.0))
+        batch.add(_call("b", "web_search", query="fast", delay=0.0))
+        await asyncio.sleep(0)
+
+        batch.tasks[0].cancel()
+        results = await asyncio.wait_for(_collect(batch), timeout=1)
+
+        assert sorted(results) == [0, 1]
+        assert json.loads(results[0]["content"]) == {"success": False, "error": "Tool call cancelled"}
+        assert json.loads(results[1]["content"])["success"]
+
+
+class TestToolQueueing:
+    """Test per-agent limits, queue timeouts and queue metrics."""
+
+    @pytest.mark.asyncio
+    async def test_calls_over_the_limit_wait_instead_of_failing(self, workspace_tool):
+        """Test that a burst larger than the global limit completes and records waits."""
+        calls = [_call(str(i), "web_search", query=str(i), delay=0.02) for i in range(6)]
+
+        messages = await workspace_tool.executor.execute_tool_calls(calls)
+
+        assert all(json.loads(m["content"])["success"] for m in messages)
+        queue = workspace_tool.executor.get_execution_stats()["queue"]
+        assert queue["calls"] == 6 and queue["timeouts"] == 0
+        assert queue["max_wait"] > 0
+
+    @pytest.mark.asyncio
+    async def test_per_agent_limit(self, workspace_tool):
+        """Test that one agent's calls are capped while another agent's still run."""
+        executor = ToolExecutor(registry=workspace_tool.executor.registry, max_concurrent_per_agent=1)
+
+        await asyncio.gather(
+            executor.execute_tool("web_search", "default", query="a", delay=0.02),
+            executor.execute_tool("web_search", "default", query="b", delay=0.02),
+        )
+        assert workspace_tool.peak == 1
+
+        await asyncio.gather(
+            executor.execute_tool("web_search", "default", query="c", delay=0.02),
+            executor.execute_tool("web_search", "research_agent", query="d", delay=0.02),
+        )
+        assert workspace_tool.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_limit(self, workspace_tool):
+        """Test that a call fails with a retry hint once it has waited too long."""
+        executor = ToolExecutor(
+            registry=workspace_tool.executor.registry,
+            max_concurrent_executions=1,
+            max_queue_wait=0.01
+        )
+
+        slow, queued = await asyncio.gather(
+            executor.execute_tool("web_search", query="slow", delay=0.1),
+            executor.execute_tool("web_search", query="queued", delay=0.0),
+        )
+
+        assert slow.success
+        assert not queued.success and "waited" in queued.error
+        assert executor.get_execution_stats()["queue"]["timeouts"] == 1
+
+    def test_manager_applies_tools_config(self):
+        """Test that ToolsConfig limits reach the executor."""
+        manager = ToolManager(config=ToolsConfig(
+            max_parallel_executions=7, max_parallel_executions_per_agent=2, max_queue_wait=4.0
+        ))
+
+        policy = manager.executor.security_policy
+        assert policy.MAX_CONCURRENT_EXECUTIONS == 7
+        assert policy.MAX_CONCURRENT_EXECUTIONS_PER_AGENT == 2
+        assert policy.MAX_QUEUE_WAIT == 4.0
@@ -0,0 +1,97 @@
+"""
+Unit tests for process-isolated tool execution.
+"""
+
+import os
+import time
+import pytest
+
+from agentx.tool import executor as executor_module
+from agentx.tool.executor import ToolExecutor
+from agentx.tool.isolation import ProcessToolPool
+from agentx.tool.models import Tool, tool
+from agentx.tool.registry import ToolRegistry
+
+
+class ComputeTool(Tool):
+    """Test tool whose methods run in worker processes."""
+
+    @tool(description="Search", read_only=True, isolation="process")
+    def web_search(self, query: str) -> dict:
+        return {"query": query, "pid": os.getpid()}
+
+    @tool(description="Read", read_only=True, isolation="process")
+    def read_file(self, path: str) -> str:
+        time.sleep(30)
+        return path
+
+    @tool(description="Extract", read_only=True, isolation="process", memory_limit_mb=1024)
+    def extract_content(self, url: str) -> int:
+        return len(bytearray(4 * 1024 * 1024 * 1024))
+
+    @tool(description="News", read_only=True, isolation="process")
+    def news_search(self, query: str) -> str:
+        raise ValueError(f"no news for {query}")
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    """Fixture for an executor with a ComputeTool and a private worker pool."""
+    # Workers import agentx; keep litellm from fetching its cost map over the network
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    pool = ProcessToolPool(max_workers=2)
+    monkeypatch.setattr(executor_module, "get_process_tool_pool", lambda: pool)
+    registry = ToolRegistry()
+    registry.register_tool(ComputeTool())
+    executor = ToolExecutor(registry=registry)
+    executor.security_policy.MAX_EXECUTION_TIME = 5.0
+    yield executor
+    pool.shutdown()
+
+
+class TestProcessIsolation:
+    """Test worker reuse, kill-on-timeout, limits and error reporting."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_reused_worker_process(self, executor):
+        """Test that calls run outside this process and reuse the same worker."""
+        first = await executor.execute_tool("web_search", query="a")
+        second = await executor.execute_tool("web_search", query="b")
+
+        assert first.success and first.result["query"] == "a"
+        assert first.result["pid"] != os.getpid()
+        assert second.result["pid"] == first.result["pid"]
+        assert executor.get_execution_stats()["process_pool"]["workers_started"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker(self, executor):
+        """Test that a timed-out call is killed and the pool recovers."""
+        executor.security_policy.MAX_EXECUTION_TIME = 1.0
+
+        started = time.time()
+        result = await executor.execute_tool("read_file", path="big.csv")
+
+        assert not result.success and "timed out" in result.error
+        assert time.time() - started < 10
+        stats = executor.get_execution_stats()["process_pool"]
+        assert stats["timeouts"] == 1 and stats["idle_workers"] == 0
+
+        executor.security_policy.MAX_EXECUTION_TIME = 5.0
+        assert (await executor.execute_tool("web_search", query="after")).success
+
+    @pytest.mark.skipif(os.name != "posix", reason="resource limits need POSIX")
+    @pytest.mark.asyncio
+    async def test_memory_limit(self, executor):
+        """Test that a call exceeding its memory limit fails without affecting later calls."""
+        result = await executor.execute_tool("extract_content", url="https://example.com")
+
+        assert not result.success and "MemoryError" in result.error
+        assert (await executor.execute_tool("web_search", query="after")).success
+
+    @pytest.mark.asyncio
+    async def test_tool_exception_is_reported(self, executor):
+        """Test that an exception raised in the worker becomes a failed result."""
+        result = await executor.execute_tool("news_search", query="agents")
+
+        assert not result.success
+        assert "ValueError: no news for agents" in result.error
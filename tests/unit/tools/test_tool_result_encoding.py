@@ -0,0 +1,112 @@
+"""
+Unit tests for encoding tool results for the LLM.
+"""
+
+import json
+import pytest
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from agentx.tool.executor import ToolExecutor, ResultEncodingPolicy
+from agentx.tool.models import Tool, ToolResult, tool
+from agentx.tool.registry import ToolRegistry
+
+
+@dataclass
+class SearchHit:
+    title: str
+    url: str
+    snippet: str
+    score: float
+
+
+class SearchTool(Tool):
+    """Test tool returning structured results."""
+
+    @tool(description="Search", read_only=True, result_fields=["title", "url"])
+    async def web_search(self, query: str) -> ToolResult:
+        hits = [SearchHit(f"{query} {i}", f"https://example.com/{i}", "snippet " * 20, 0.5) for i in range(3)]
+        return ToolResult(success=True, result=hits, metadata={"provider": "test"})
+
+    @tool(description="Weather", read_only=True,
+          result_formatter=lambda weather: f"{weather['location']}: {weather['temperature']}°C")
+    async def get_weather(self, location: str) -> dict:
+        return {"location": location, "temperature": 21, "raw": {"station": "x" * 100}}
+
+    @tool(description="News", read_only=True)
+    async def news_search(self, query: str) -> ToolResult:
+        return ToolResult(success=False, error="News backend not available")
+
+    @tool(description="Read", read_only=True, result_formatter=lambda text: text.upper() + 1)
+    async def read_file(self, path: str) -> str:
+        return "contents"
+
+
+def _call(call_id: str, name: str, **arguments) -> SimpleNamespace:
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+
+@pytest.fixture
+def registry():
+    """Fixture for a registry with a SearchTool."""
+    registry = ToolRegistry()
+    registry.register_tool(SearchTool())
+    return registry
+
+
+class TestResultEncoding:
+    """Test compact encoding, projection, formatters and token accounting."""
+
+    @pytest.mark.asyncio
+    async def test_compact_by_default(self, registry):
+        """Test that results are compact JSON with only the outcome."""
+        executor = ToolExecutor(registry=registry)
+
+        [message] = await executor.execute_tool_calls([_call("a", "web_search", query="agents")])
+
+        content = message["content"]
+        assert "\n" not in content and '"success":true' in content
+        assert json.loads(content) == {
+            "success": True,
+            "result": [{"title": f"agents {i}", "url": f"https://example.com/{i}"} for i in range(3)]
+        }
+
+    @pytest.mark.asyncio
+    async def test_formatter_and_failures(self, registry):
+        """Test per-tool formatters, unwrapped tool failures and formatter errors."""
+        executor = ToolExecutor(registry=registry)
+
+        weather, news, read = await executor.execute_tool_calls([
+            _call("a", "get_weather", location="Paris"),
+            _call("b", "news_search", query="agents"),
+            _call("c", "read_file", path="notes.md"),
+        ])
+
+        assert json.loads(weather["content"]) == {"success": True, "result": "Paris: 21°C"}
+        assert json.loads(news["content"]) == {"success": False, "error": "News backend not available"}
+        assert json.loads(read["content"])["result"] == "contents"
+
+    @pytest.mark.asyncio
+    async def test_verbose_policy(self, registry):
+        """Test that metadata and indentation can be turned back on."""
+        policy = ResultEncodingPolicy(compact=False, include_metadata=True)
+        executor = ToolExecutor(registry=registry, result_encoding=policy)
+
+        [message] = await executor.execute_tool_calls([_call("a", "get_weather", location="Paris")])
+
+        content = json.loads(message["content"])
+        assert "\n" in message["content"]
+        assert content["metadata"]["tool_name"] == "get_weather" and "execution_time" in content
+
+    @pytest.mark.asyncio
+    async def test_reports_tokens_saved(self, registry):
+        """Test that stats estimate the prompt tokens saved versus the verbose encoding."""
+        executor = ToolExecutor(registry=registry, result_encoding=ResultEncodingPolicy(track_savings=True))
+
+        await executor.execute_tool_calls([_call("a", "web_search", query="agents"), _call("b", "get_weather", location="Paris")])
+
+        stats = executor.get_execution_stats()["result_encoding"]
+        assert stats["results"] == 2
+        assert 0 < stats["tokens"] < stats["verbose_tokens"]
+        assert stats["tokens_saved"] == stats["verbose_tokens"] - stats["tokens"]
+        assert stats["savings_rate"] > 0.5
@@ -143,6 +143,21 @@ class TestToolSchemaGeneration:
         # The exact behavior may vary - some implementations might return empty list,
         # others might log warnings. Both are acceptable.
 
+    def test_parameters_reflected_once_per_function(self, monkeypatch):
+        """Test that registering new instances of a tool reuses the reflected schema."""
+        calls = []
+        original = ToolRegistry._build_parameters
+        monkeypatch.setattr(ToolRegistry, "_parameter_cache", {})
+        monkeypatch.setattr(
+            ToolRegistry, "_build_parameters",
+            lambda self, func: calls.append(func) or original(self, func)
+        )
+
+        for _ in range(3):
+            ToolRegistry().register_tool(WeatherTool())
+
+        assert len(calls) == 2  # get_weather and get_weather_no_docs
+
 
 if __name__ == "__main__":
     # Allow running the test directly